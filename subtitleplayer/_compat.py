@@ -0,0 +1,8 @@
+"""
+Version compatibility helpers shared across the package
+"""
+
+import sys
+
+# dataclass(slots=True) drops the per-instance __dict__ but needs Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
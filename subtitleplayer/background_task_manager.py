@@ -1,14 +1,34 @@
 """
 Background Task Manager
-Manages long-running tasks (AI generation, translation) in background threads
+Manages long-running tasks (AI generation, translation) on a thread pool
 """
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from typing import Callable, Optional, Any, List
 from dataclasses import dataclass
 from enum import Enum
+from itertools import count
+import inspect
+import threading
 import time
 
+from ._compat import DATACLASS_SLOTS
+
+
+# Process-wide sequence for task IDs; unlike wall-clock ms it never collides
+_task_counter = count(1)
+
+
+def _accepts_kwarg(func: Callable, name: str) -> bool:
+    """Return True if ``func`` can be called with keyword argument ``name``"""
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in params or any(
+        param.kind is inspect.Parameter.VAR_KEYWORD for param in params.values()
+    )
+
 
 class TaskType(Enum):
     """Types of background tasks"""
@@ -25,7 +45,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TaskInfo:
     """Information about a background task"""
     task_id: str
@@ -37,57 +57,86 @@ class TaskInfo:
     error: str = None
 
 
-class BackgroundWorker(QThread):
-    """Worker thread for executing background tasks"""
+class _TaskSignals(QObject):
+    """Signals emitted by BackgroundWorker back on the manager's thread"""
     
     progress_updated = pyqtSignal(str, int)  # task_id, progress
     message_updated = pyqtSignal(str, str)   # task_id, message
     task_completed = pyqtSignal(str, object)  # task_id, result
     task_failed = pyqtSignal(str, str)        # task_id, error
+    finished = pyqtSignal(str)                # task_id
+
+
+class BackgroundWorker(QRunnable):
+    """Pooled runnable for executing background tasks"""
     
     def __init__(self, task_id: str, task_func: Callable, *args, **kwargs):
         super().__init__()
+        # The manager keeps its own reference and releases it on finish
+        self.setAutoDelete(False)
         self.task_id = task_id
         self.task_func = task_func
         self.args = args
         self.kwargs = kwargs
-        self._cancelled = False
+        self.signals = _TaskSignals()
+        self._cancel_event = threading.Event()
+        self._started = threading.Event()
+        self._done = threading.Event()
     
     def run(self):
-        """Execute the task in background thread"""
+        """Execute the task on a pool thread"""
+        self._started.set()
+        try:
+            # Cancelled while still queued in the pool: never start the work
+            if not self._cancel_event.is_set():
+                self._run_task()
+        finally:
+            self._done.set()
+            self.signals.finished.emit(self.task_id)
+    
+    def _run_task(self):
+        signals = self.signals
         try:
             # Create progress callback
             def progress_callback(message: str, progress: int):
-                if self._cancelled:
+                if self._cancel_event.is_set():
                     return
-                self.progress_updated.emit(self.task_id, progress)
-                self.message_updated.emit(self.task_id, message)
-            
-            # Create cancel check callback
-            def cancel_check():
-                return self._cancelled
+                signals.progress_updated.emit(self.task_id, progress)
+                signals.message_updated.emit(self.task_id, message)
             
             # Add callbacks to kwargs
             self.kwargs['progress_callback'] = progress_callback
             if 'cancel_check' not in self.kwargs:
-                self.kwargs['cancel_check'] = cancel_check
+                self.kwargs['cancel_check'] = self._cancel_event.is_set
+            # Tasks that opt in get the event itself for cancel-aware sleeps
+            if 'cancel_event' not in self.kwargs and _accepts_kwarg(self.task_func, 'cancel_event'):
+                self.kwargs['cancel_event'] = self._cancel_event
             
             # Execute task
             result = self.task_func(*self.args, **self.kwargs)
             
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 return
             
             # Emit completion
-            self.task_completed.emit(self.task_id, result)
+            signals.task_completed.emit(self.task_id, result)
             
         except Exception as e:
             error_msg = str(e)
-            self.task_failed.emit(self.task_id, error_msg)
+            signals.task_failed.emit(self.task_id, error_msg)
     
     def cancel(self):
         """Request task cancellation"""
-        self._cancelled = True
+        self._cancel_event.set()
+    
+    @property
+    def started(self) -> bool:
+        """True once a pool thread has picked the task up"""
+        return self._started.is_set()
+    
+    def wait(self, msecs: int) -> bool:
+        """Block until the task has finished or ``msecs`` elapse"""
+        return self._done.wait(msecs / 1000.0)
 
 
 class BackgroundTaskManager(QObject):
@@ -102,6 +151,9 @@ class BackgroundTaskManager(QObject):
         super().__init__()
         self.tasks = {}  # task_id -> TaskInfo
         self.workers = {}  # task_id -> BackgroundWorker
+        self._running_ids: set[str] = set()
+        # Own pool so long transcodes never starve QThreadPool.globalInstance()
+        self.thread_pool = QThreadPool(self)
     
     def start_task(
         self,
@@ -122,7 +174,7 @@ class BackgroundTaskManager(QObject):
             task_id: Unique identifier for this task
         """
         # Generate unique task ID
-        task_id = f"{task_type.value}_{int(time.time() * 1000)}"
+        task_id = f"{task_type.value}_{next(_task_counter)}"
         
         # Create task info
         task_info = TaskInfo(
@@ -134,19 +186,21 @@ class BackgroundTaskManager(QObject):
         )
         
         self.tasks[task_id] = task_info
+        self._running_ids.add(task_id)
         
-        # Create worker thread
+        # Create pooled worker
         worker = BackgroundWorker(task_id, task_func, *args, **kwargs)
-        worker.progress_updated.connect(self._on_progress_updated)
-        worker.message_updated.connect(self._on_message_updated)
-        worker.task_completed.connect(self._on_task_completed)
-        worker.task_failed.connect(self._on_task_failed)
-        worker.finished.connect(lambda: self._cleanup_worker(task_id))
+        signals = worker.signals
+        signals.progress_updated.connect(self._on_progress_updated)
+        signals.message_updated.connect(self._on_message_updated)
+        signals.task_completed.connect(self._on_task_completed)
+        signals.task_failed.connect(self._on_task_failed)
+        signals.finished.connect(self._cleanup_worker)
         
         self.workers[task_id] = worker
         
         # Start worker
-        worker.start()
+        self.thread_pool.start(worker)
         
         # Emit started signal
         self.task_started.emit(task_info)
@@ -158,22 +212,46 @@ class BackgroundTaskManager(QObject):
         if task_id in self.workers:
             worker = self.workers[task_id]
             worker.cancel()
+            self._running_ids.discard(task_id)
             
             if task_id in self.tasks:
                 self.tasks[task_id].status = TaskStatus.CANCELLED
                 self.tasks[task_id].message = "Cancelled by user"
                 self.task_failed.emit(self.tasks[task_id])
     
+    def cancel_all(self, timeout: float = 2.0):
+        """
+        Cancel every running task, then wait for the workers already executing
+        
+        All workers are flagged first so they wind down concurrently; the
+        waits share a single deadline instead of waiting one after another.
+        Workers still queued in the pool skip their task when they start, so
+        they are not waited for.
+        
+        Args:
+            timeout: Total seconds to wait for workers to finish; 0 returns at once
+        """
+        task_ids = list(self.workers)
+        for task_id in task_ids:
+            self.cancel_task(task_id)
+        if timeout <= 0:
+            return
+        
+        deadline = time.monotonic() + timeout
+        for task_id in task_ids:
+            worker = self.workers.get(task_id)
+            if worker is None or not worker.started:
+                continue
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            worker.wait(remaining_ms)
+    
     def get_task(self, task_id: str) -> Optional[TaskInfo]:
         """Get task information"""
         return self.tasks.get(task_id)
     
-    def get_active_tasks(self) -> list[TaskInfo]:
+    def get_active_tasks(self) -> List[TaskInfo]:
         """Get all active (running) tasks"""
-        return [
-            task for task in self.tasks.values()
-            if task.status == TaskStatus.RUNNING
-        ]
+        return [self.tasks[task_id] for task_id in self._running_ids]
     
     def _on_progress_updated(self, task_id: str, progress: int):
         """Handle progress update from worker"""
@@ -189,6 +267,7 @@ class BackgroundTaskManager(QObject):
     
     def _on_task_completed(self, task_id: str, result: Any):
         """Handle task completion"""
+        self._running_ids.discard(task_id)
         if task_id in self.tasks:
             self.tasks[task_id].status = TaskStatus.COMPLETED
             self.tasks[task_id].progress = 100
@@ -198,6 +277,7 @@ class BackgroundTaskManager(QObject):
     
     def _on_task_failed(self, task_id: str, error: str):
         """Handle task failure"""
+        self._running_ids.discard(task_id)
         if task_id in self.tasks:
             self.tasks[task_id].status = TaskStatus.FAILED
             self.tasks[task_id].message = f"Error: {error}"
@@ -205,18 +285,10 @@ class BackgroundTaskManager(QObject):
             self.task_failed.emit(self.tasks[task_id])
     
     def _cleanup_worker(self, task_id: str):
-        """Cleanup worker after thread finishes"""
-        if task_id in self.workers:
-            worker = self.workers[task_id]
-            worker.deleteLater()
-            del self.workers[task_id]
-    
-    def get_active_tasks(self) -> List[str]:
-        """Get list of active (running) task IDs"""
-        return [
-            task_id for task_id, task_info in self.tasks.items()
-            if task_info.status == TaskStatus.RUNNING
-        ]
+        """Cleanup worker after its run finishes"""
+        worker = self.workers.pop(task_id, None)
+        if worker is not None:
+            worker.signals.deleteLater()
     
     def get_task_info(self, task_id: str) -> Optional[TaskInfo]:
         """Get task information by ID"""
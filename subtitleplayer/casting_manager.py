@@ -3,12 +3,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import vlc
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@lru_cache(maxsize=32)
+def _sout_chain(
+    transcode: bool,
+    video_codec: str,
+    audio_codec: str,
+    mux: str,
+    host: str,
+    port: int,
+) -> str:
+    """Build the ``:sout`` chain for a config; repeated casts reuse the string."""
+    sout_parts = []
+    if transcode:
+        sout_parts.append(f"transcode{{vcodec={video_codec},acodec={audio_codec}}}")
+    sout_parts.append(f"std{{access=http,mux={mux},dst={host}:{port}}}")
+    return ":".join(sout_parts)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CastingConfig:
     """Configuration for a casting session."""
 
@@ -20,6 +40,13 @@ class CastingConfig:
     mux: str = "ts"
     ttl: Optional[int] = None
 
+    @property
+    def sout_chain(self) -> str:
+        """The ``:sout`` chain for this config, built once per distinct config."""
+        return _sout_chain(
+            self.transcode, self.video_codec, self.audio_codec, self.mux, self.host, self.port
+        )
+
 
 class CastingError(RuntimeError):
     """Raised when casting actions fail."""
@@ -30,6 +57,7 @@ class CastingManager:
 
     def __init__(self, instance: vlc.Instance) -> None:
         self._instance = instance
+        self._media_new = instance.media_new
         self._stream_player: Optional[vlc.MediaPlayer] = None
         self._active_config: Optional[CastingConfig] = None
         self._active_url: Optional[str] = None
@@ -53,40 +81,30 @@ class CastingManager:
             raise CastingError("Casting session already active")
 
         cfg = config or CastingConfig()
-        stream_media = None
-        if hasattr(media, "duplicate"):
+        options = [
+            f":sout={cfg.sout_chain}",
+            ":sout-keep",
+            ":sout-all",
+            ":network-caching=1000",
+        ]
+        if cfg.ttl is not None:
+            options.append(f":ttl={cfg.ttl}")
+        if loop:
+            options.append(":input-repeat=-1")
+
+        try:
             stream_media = media.duplicate()
+        except AttributeError:
+            stream_media = None
         if stream_media is None:
+            # Rare path: re-parse the media from its MRL with the options attached
             mrl = media.get_mrl() if hasattr(media, "get_mrl") else None
             if not mrl:
                 raise CastingError("Unable to prepare media for casting")
-            stream_media = self._instance.media_new(mrl)
-
-        if loop:
-            stream_media.add_option(":input-repeat=-1")
-
-        sout_parts = []
-        
-        if cfg.transcode:
-            transcode_segment = (
-                f"transcode{{vcodec={cfg.video_codec},acodec={cfg.audio_codec}}}"
-            )
-            sout_parts.append(transcode_segment)
-
-        mux = cfg.mux
-        access = "http"
-        dst = f"{cfg.host}:{cfg.port}"
-        
-        std_segment = f"std{{access={access},mux={mux},dst={dst}}}"
-        sout_parts.append(std_segment)
-
-        sout_chain = ":".join(sout_parts)
-        stream_media.add_option(f":sout={sout_chain}")
-        stream_media.add_option(":sout-keep")
-        stream_media.add_option(":sout-all")
-        stream_media.add_option(":network-caching=1000")
-        if cfg.ttl is not None:
-            stream_media.add_option(f":ttl={cfg.ttl}")
+            stream_media = self._media_new(mrl, *options)
+        else:
+            for option in options:
+                stream_media.add_option(option)
 
         player = self._instance.media_player_new()
         player.set_media(stream_media)
@@ -2,22 +2,91 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
+import os
+import queue
 import threading
+import time
 import uuid
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from ._compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 LOG_DIR = PROJECT_ROOT / "logs"
 EVENTS_FILE = LOG_DIR / "streaming_events.jsonl"
 STATS_FILE = LOG_DIR / "streaming_stats.json"
 
+# Minimum seconds between full rewrites of the stats snapshot; the events
+# JSONL already records every change as it happens.
+STATS_FLUSH_INTERVAL = 5.0
+# Buffered event lines are pushed to disk after this many writes (or on flush).
+EVENTS_FLUSH_EVERY = 32
+# The writer thread persists up to this many queued events per batch, waiting
+# at most EVENT_BATCH_WINDOW seconds for a batch to fill.
+EVENT_BATCH_SIZE = 64
+EVENT_BATCH_WINDOW = 0.1
+# Per-video and per-session history is capped to the most recently used
+# entries so the stats snapshot (and each rewrite of it) stays bounded.
+MAX_TRACKED_VIDEOS = 500
+MAX_TRACKED_SESSIONS = 100
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Parse JSON from ``str``/``bytes``, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp_ms(epoch_ms: int) -> str:
+    """ISO-8601 UTC timestamp; bursts logged within the same millisecond share it."""
+    return datetime.fromtimestamp(epoch_ms / 1000, timezone.utc).isoformat(timespec="milliseconds")
+
+
+@lru_cache(maxsize=256)
+def _basename(path: str) -> str:
+    """Return the file name of ``path``; the same paths are logged repeatedly."""
+    return Path(path).name
+
+
+def _tail_lines(path: Path, count: int, chunk_size: int = 65536) -> List[bytes]:
+    """Return the last ``count`` non-empty lines of ``path``, reading backwards."""
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        buffer = b""
+        while position > 0 and buffer.count(b"\n") <= count:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            handle.seek(position)
+            buffer = handle.read(read_size) + buffer
 
-@dataclass
+    lines = [line for line in buffer.splitlines() if line.strip()]
+    return lines[-count:]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class _SessionSummary:
     """Lightweight in-memory summary for the current application session."""
 
@@ -41,41 +110,89 @@ class DebugLogger:
             session_id=self._session_id,
             started_at=self._timestamp(),
         )
-        self._stats = self._load_stats()
+        self._dirty = False
+        # Counters bumped only by passive events (no stats callback) are kept
+        # in memory and ride along with the next write instead of forcing one
+        self._passive_pending = False
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._events_fh = None
+        self._events_ino: Optional[int] = None
+        self._pending_events = 0
+        # Parsed lazily (normally by the writer thread) to keep import cheap
+        self._stats: Optional[Dict[str, Any]] = None
+
+        # Disk I/O happens on a dedicated writer so log_* calls never block
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._drain, name="DebugLoggerWriter", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        """Write queued events and pending aggregated stats to disk immediately."""
+        if self._writer_thread.is_alive():
+            self._queue.join()
+        try:
+            with self._lock:
+                self._flush_events_locked()
+                if self._dirty:
+                    self._write_stats_locked()
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"[DebugLogger] Failed to flush stats: {exc}", flush=True)
+
+    def close(self) -> None:
+        """Flush everything, stop the writer thread and release the events file."""
+        self.flush()
+        if self._writer_thread.is_alive():
+            self._queue.put(None)
+            self._writer_thread.join(timeout=2.0)
         with self._lock:
-            self._ensure_session_locked()
-            self._write_stats_locked()
+            if self._passive_pending:
+                self._write_stats_locked()
+            if self._events_fh is not None:
+                self._events_fh.close()
+                self._events_fh = None
 
     # ------------------------------------------------------------------
     # Read APIs
     # ------------------------------------------------------------------
     def get_stats_snapshot(self) -> Dict[str, Any]:
-        """Return a deep copy of the aggregated stats for external use."""
+        """Return a deep copy of the aggregated stats for external use.
+
+        The copy is cached until the next event, so callers must treat it as
+        read-only.
+        """
         with self._lock:
-            return json.loads(json.dumps(self._stats))
+            if self._snapshot is None:
+                self._snapshot = copy.deepcopy(self._get_stats_locked())
+            return self._snapshot
 
     def get_recent_events(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Return up to ``limit`` recent events from the JSONL log."""
         limit = max(1, min(int(limit), 500))
+        # Events still queued for the writer thread belong in the tail too
+        if self._writer_thread.is_alive():
+            self._queue.join()
+        with self._lock:
+            self._flush_events_locked()
         if not EVENTS_FILE.exists():
             return []
 
+        # The log is append-only, so the tail is already in chronological order
         events: List[Dict[str, Any]] = []
         try:
-            with EVENTS_FILE.open("r", encoding="utf-8") as handle:
-                for line in deque(handle, maxlen=limit):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+            for line in _tail_lines(EVENTS_FILE, limit):
+                try:
+                    events.append(_loads(line))
+                except json.JSONDecodeError:
+                    continue
         except Exception as exc:  # pylint: disable=broad-except
             print(f"[DebugLogger] Failed to read recent events: {exc}", flush=True)
             return []
 
-        events.sort(key=lambda entry: entry.get("timestamp", ""))
         return events
 
     # ------------------------------------------------------------------
@@ -83,9 +200,10 @@ class DebugLogger:
     # ------------------------------------------------------------------
     def log_video_loaded(self, video_path: str, *, source: str, loop: bool) -> None:
         """Record that a video file was loaded into the player."""
+        video_path = str(video_path)
         payload = {
-            "video_path": str(video_path),
-            "video_name": Path(video_path).name,
+            "video_path": video_path,
+            "video_name": _basename(video_path),
             "source": source,
             "loop": loop,
         }
@@ -101,9 +219,10 @@ class DebugLogger:
         autoplay: bool,
     ) -> None:
         """Record that a streaming session successfully started."""
+        video_path = str(video_path) if video_path else None
         payload = {
-            "video_path": str(video_path) if video_path else None,
-            "video_name": Path(video_path).name if video_path else None,
+            "video_path": video_path,
+            "video_name": _basename(video_path) if video_path else None,
             "source": source,
             "url": url,
             "subtitle_path": str(subtitle_path) if subtitle_path else None,
@@ -119,9 +238,10 @@ class DebugLogger:
         reason: str,
     ) -> None:
         """Record that a streaming session was stopped."""
+        video_path = str(video_path) if video_path else None
         payload = {
-            "video_path": str(video_path) if video_path else None,
-            "video_name": Path(video_path).name if video_path else None,
+            "video_path": video_path,
+            "video_name": _basename(video_path) if video_path else None,
             "source": source,
             "reason": reason,
         }
@@ -135,9 +255,10 @@ class DebugLogger:
         error: str,
     ) -> None:
         """Record a casting failure for diagnostics."""
+        video_path = str(video_path) if video_path else None
         payload = {
-            "video_path": str(video_path) if video_path else None,
-            "video_name": Path(video_path).name if video_path else None,
+            "video_path": video_path,
+            "video_name": _basename(video_path) if video_path else None,
             "source": source,
             "error": error,
         }
@@ -145,9 +266,10 @@ class DebugLogger:
 
     def log_sample_autoplay_started(self, video_path: str) -> None:
         """Record that the bundled sample started autoplay."""
+        video_path = str(video_path)
         payload = {
-            "video_path": str(video_path),
-            "video_name": Path(video_path).name,
+            "video_path": video_path,
+            "video_name": _basename(video_path),
         }
         self._append_event(
             "sample_autoplay_started",
@@ -157,11 +279,13 @@ class DebugLogger:
 
     def log_subtitle_linked(self, video_path: str, subtitle_path: str) -> None:
         """Record which subtitle file was paired with a video."""
+        video_path = str(video_path)
+        subtitle_path = str(subtitle_path)
         payload = {
-            "video_path": str(video_path),
-            "video_name": Path(video_path).name,
-            "subtitle_path": str(subtitle_path),
-            "subtitle_name": Path(subtitle_path).name,
+            "video_path": video_path,
+            "video_name": _basename(video_path),
+            "subtitle_path": subtitle_path,
+            "subtitle_name": _basename(subtitle_path),
         }
         self._append_event("subtitle_linked", payload)
 
@@ -174,70 +298,146 @@ class DebugLogger:
         payload: Dict[str, Any],
         update_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
     ) -> None:
-        """Append a structured event to disk and update aggregate metrics."""
+        """Queue a structured event for the writer thread."""
         record = {
             "timestamp": self._timestamp(),
             "session_id": self._session_id,
             "event": event,
             "data": payload,
         }
+        self._queue.put((record, update_callback))
 
+    def _drain(self) -> None:
+        """Writer thread loop: persist queued events in small batches."""
         try:
             with self._lock:
-                self._write_event_locked(record)
-                self._refresh_stats_locked(record, update_callback)
+                self._get_stats_locked()
         except Exception as exc:  # pylint: disable=broad-except
-            print(f"[DebugLogger] Failed to persist event '{event}': {exc}", flush=True)
-
-    def _write_event_locked(self, record: Dict[str, Any]) -> None:
-        EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with EVENTS_FILE.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            print(f"[DebugLogger] Failed to load stats: {exc}", flush=True)
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + EVENT_BATCH_WINDOW
+            while len(batch) < EVENT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._persist_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _persist_batch(self, batch: List[tuple]) -> None:
+        """Write a batch of events and fold them into the aggregated stats."""
+        try:
+            with self._lock:
+                self._write_events_locked([record for record, _ in batch])
+                self._refresh_stats_locked(batch)
+                if self._dirty:
+                    self._schedule_stats_write_locked()
+                else:
+                    # No stats timer will run for passive events; push the lines out now
+                    self._flush_events_locked()
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"[DebugLogger] Failed to persist {len(batch)} event(s): {exc}", flush=True)
 
-    def _refresh_stats_locked(
-        self,
-        record: Dict[str, Any],
-        update_callback: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]],
-    ) -> None:
-        stats = self._stats
-        totals = stats.setdefault("totals", {})
-        totals["events"] = totals.get("events", 0) + 1
+    def _write_events_locked(self, records: List[Dict[str, Any]]) -> None:
+        if self._events_fh is None:
+            self._open_events_locked()
+        self._events_fh.write(b"".join(_dumps(record) + b"\n" for record in records))
+        self._pending_events += len(records)
+        if self._pending_events >= EVENTS_FLUSH_EVERY:
+            self._flush_events_locked()
 
-        session = stats.setdefault("sessions", {}).setdefault(
-            self._session_id,
-            {
-                "session_id": self._session_id,
-                "started_at": self._session_summary.started_at,
-                "events": 0,
-                "video_loads": 0,
-                "cast_starts": 0,
-                "cast_stops": 0,
-                "autoplay_starts": 0,
-            },
-        )
-        session["events"] = session.get("events", 0) + 1
-        session["last_event_at"] = record["timestamp"]
-        self._session_summary.events += 1
+    def _open_events_locked(self) -> None:
+        EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self._events_fh = EVENTS_FILE.open("ab", buffering=1 << 16)
+        self._events_ino = os.fstat(self._events_fh.fileno()).st_ino
 
-        if update_callback:
-            update_callback(stats, record)
+    def _flush_events_locked(self) -> None:
+        if self._events_fh is None:
+            return
+        self._events_fh.flush()
+        self._pending_events = 0
 
-        stats["last_event"] = record
-        stats["last_updated_at"] = record["timestamp"]
-        self._write_stats_locked()
+        # Reopen on the next write if the log was rotated or deleted meanwhile
+        try:
+            rotated = os.stat(EVENTS_FILE).st_ino != self._events_ino
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self._events_fh.close()
+            self._events_fh = None
+
+    def _refresh_stats_locked(self, batch: List[tuple]) -> None:
+        """Fold a batch of ``(record, update_callback)`` pairs into the stats."""
+        stats = self._get_stats_locked()
+        count = len(batch)
+        last_record = batch[-1][0]
+
+        totals = self._totals
+        totals["events"] = totals.get("events", 0) + count
+
+        session = self._session_dict
+        session["events"] = session.get("events", 0) + count
+        session["last_event_at"] = last_record["timestamp"]
+        self._session_summary.events += count
+
+        # Per-event callbacks still run in order: they stamp "last_*" fields
+        significant = False
+        for record, update_callback in batch:
+            if update_callback:
+                update_callback(stats, record)
+                significant = True
+
+        stats["last_event"] = last_record
+        stats["last_updated_at"] = last_record["timestamp"]
+        self._snapshot = None
+        if significant:
+            self._dirty = True
+        else:
+            self._passive_pending = True
+
+    def _schedule_stats_write_locked(self) -> None:
+        """Rewrite the stats file at most once per ``STATS_FLUSH_INTERVAL``."""
+        elapsed = time.monotonic() - self._last_flush
+        if elapsed >= STATS_FLUSH_INTERVAL:
+            self._write_stats_locked()
+            return
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(STATS_FLUSH_INTERVAL - elapsed, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
     def _update_stats_for_video_loaded(self, stats: Dict[str, Any], record: Dict[str, Any]) -> None:
         data = record["data"]
         source = data.get("source") or "unknown"
         video_path = data.get("video_path")
 
-        totals = stats.setdefault("totals", {})
+        totals = self._totals
         totals["video_loads"] = totals.get("video_loads", 0) + 1
 
-        sources = stats.setdefault("video_sources", {})
+        sources = self._video_sources
         sources[source] = sources.get(source, 0) + 1
 
-        session = stats.setdefault("sessions", {}).setdefault(self._session_id, {})
+        session = self._session_dict
         session["video_loads"] = session.get("video_loads", 0) + 1
 
         if video_path:
@@ -253,18 +453,18 @@ class DebugLogger:
         video_path = data.get("video_path")
         autoplay = data.get("autoplay", False)
 
-        totals = stats.setdefault("totals", {})
+        totals = self._totals
         totals["cast_starts"] = totals.get("cast_starts", 0) + 1
         if autoplay:
             totals["autoplay_casts"] = totals.get("autoplay_casts", 0) + 1
 
-        session = stats.setdefault("sessions", {}).setdefault(self._session_id, {})
+        session = self._session_dict
         session["cast_starts"] = session.get("cast_starts", 0) + 1
 
         if autoplay:
             session["autoplay_starts"] = session.get("autoplay_starts", 0) + 1
 
-        sources = stats.setdefault("cast_sources", {})
+        sources = self._cast_sources
         sources[source] = sources.get(source, 0) + 1
 
         if video_path:
@@ -279,10 +479,10 @@ class DebugLogger:
         data = record["data"]
         video_path = data.get("video_path")
 
-        totals = stats.setdefault("totals", {})
+        totals = self._totals
         totals["cast_stops"] = totals.get("cast_stops", 0) + 1
 
-        session = stats.setdefault("sessions", {}).setdefault(self._session_id, {})
+        session = self._session_dict
         session["cast_stops"] = session.get("cast_stops", 0) + 1
 
         if video_path:
@@ -292,29 +492,35 @@ class DebugLogger:
             video_stats["last_stop_reason"] = data.get("reason")
 
     def _update_stats_for_sample_autoplay(self, stats: Dict[str, Any], record: Dict[str, Any]) -> None:
-        totals = stats.setdefault("totals", {})
+        totals = self._totals
         totals["sample_autoplay_starts"] = totals.get("sample_autoplay_starts", 0) + 1
 
-        session = stats.setdefault("sessions", {}).setdefault(self._session_id, {})
+        session = self._session_dict
         session["autoplay_starts"] = session.get("autoplay_starts", 0) + 1
 
     def _ensure_video_entry(self, stats: Dict[str, Any], video_path: str) -> Dict[str, Any]:
-        videos = stats.setdefault("videos", {})
+        videos = self._videos
         entry = videos.get(video_path)
         if entry is None:
             entry = {
                 "video_path": video_path,
-                "video_name": Path(video_path).name,
+                "video_name": _basename(video_path),
                 "loads": 0,
                 "casts_started": 0,
                 "casts_stopped": 0,
             }
             videos[video_path] = entry
+            while len(videos) > MAX_TRACKED_VIDEOS:
+                videos.popitem(last=False)
+        else:
+            videos.move_to_end(video_path)
         return entry
 
     def _ensure_session_locked(self) -> None:
         stats = self._stats
-        sessions = stats.setdefault("sessions", {})
+        # JSON loads plain dicts; LRU eviction needs ordered ones
+        sessions = stats["sessions"] = OrderedDict(stats.get("sessions", {}))
+        stats["videos"] = OrderedDict(stats.get("videos", {}))
         if self._session_id not in sessions:
             sessions[self._session_id] = {
                 "session_id": self._session_id,
@@ -329,10 +535,25 @@ class DebugLogger:
             order.append(self._session_id)
             stats["last_session_started_at"] = self._session_summary.started_at
 
-        stats.setdefault("totals", {})
-        stats.setdefault("videos", {})
-        stats.setdefault("video_sources", {})
-        stats.setdefault("cast_sources", {})
+            if len(sessions) > MAX_TRACKED_SESSIONS:
+                while len(sessions) > MAX_TRACKED_SESSIONS:
+                    sessions.popitem(last=False)
+                stats["session_order"] = [sid for sid in order if sid in sessions]
+
+        # Hot-path references so event handling skips the setdefault chains
+        self._session_dict = sessions[self._session_id]
+        self._totals = stats.setdefault("totals", {})
+        self._videos = stats["videos"]
+        self._video_sources = stats.setdefault("video_sources", {})
+        self._cast_sources = stats.setdefault("cast_sources", {})
+
+    def _get_stats_locked(self) -> Dict[str, Any]:
+        """Load the stats file and register this session on first use."""
+        if self._stats is None:
+            self._stats = self._load_stats()
+            self._ensure_session_locked()
+            self._write_stats_locked()
+        return self._stats
 
     def _load_stats(self) -> Dict[str, Any]:
         if not STATS_FILE.exists():
@@ -345,7 +566,7 @@ class DebugLogger:
                 "session_order": [],
             }
         try:
-            data = json.loads(STATS_FILE.read_text(encoding="utf-8"))
+            data = _loads(STATS_FILE.read_bytes())
             if not isinstance(data, dict):
                 raise ValueError("Stats file is not a JSON object")
             return data
@@ -366,15 +587,27 @@ class DebugLogger:
             }
 
     def _write_stats_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._stats is None:
+            return
+
         STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        STATS_FILE.write_text(
-            json.dumps(self._stats, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # Write-then-rename so a crash never leaves a truncated stats file behind
+        tmp_path = STATS_FILE.with_suffix(".json.tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(_dumps(self._stats))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, STATS_FILE)
+        self._dirty = False
+        self._passive_pending = False
+        self._last_flush = time.monotonic()
 
     @staticmethod
     def _timestamp() -> str:
-        return datetime.now(timezone.utc).isoformat()
+        return _format_timestamp_ms(time.time_ns() // 1_000_000)
 
 
 debug_logger = DebugLogger()
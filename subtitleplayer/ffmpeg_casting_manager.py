@@ -4,15 +4,29 @@ from __future__ import annotations
 
 import json
 import os
+import select
+import shlex
 import shutil
 import signal
 import socket
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import IO, Dict, Optional
+from typing import IO, Dict, List, Optional, Tuple
+
+from .hls_http_server import HLSServer, serve_in_thread
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import logging
 logger = logging.getLogger(__name__)
@@ -20,6 +34,52 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 LOG_ARCHIVE_DIR = PROJECT_ROOT / "logs" / "cast_failures"
 
+# Upper bound on how stale the manifest check can be while waiting for FFmpeg
+MANIFEST_POLL_INTERVAL = 0.05
+# How long stop() waits for the HLS HTTP server thread to exit
+HTTP_STOP_TIMEOUT = 3.0
+
+# Records "pid:start-token" for FFmpeg so a later session can clean up after a crash
+PID_FILE = Path("/tmp/subtitle_player_stream.pids")
+# How long a leftover process gets to exit after SIGTERM before SIGKILL
+TERMINATE_TIMEOUT = 3.0
+
+# H.264 profiles every HLS client can decode, as reported by ffprobe
+_COPY_H264_PROFILES = frozenset({"Constrained Baseline", "Baseline", "Main", "High"})
+
+# HLS flags that assume every segment can be cut on a forced keyframe; with
+# stream copy, cuts land wherever the source's own keyframes fall
+_COPY_UNSAFE_HLS_FLAGS = frozenset({"split_by_time", "independent_segments"})
+
+# Characters the subtitles= filter argument needs backslash-escaped
+_SUBTITLE_ESCAPE_TABLE = str.maketrans({c: "\\" + c for c in "\\:,'[]() "})
+
+
+def _dumps_pretty(obj: object) -> bytes:
+    """Serialize ``obj`` to indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _kill0_probe(pid: int) -> bool:
+    """Check for *pid* with signal 0 (the portable fallback to /proc)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _pick_hls_root() -> Path:
+    """Prefer a RAM-backed directory for HLS segments, falling back to the temp dir."""
+    shm = "/dev/shm"
+    if os.path.ismount(shm) and os.access(shm, os.W_OK):
+        return Path(shm) / "subtitle_player_hls"
+    return Path(tempfile.gettempdir()) / "subtitle_player_hls"
+
 
 @dataclass
 class FFmpegCastingConfig:
@@ -39,6 +99,43 @@ class FFmpegCastingConfig:
     video_bufsize: str = "12000k"  # VBV buffer size to pair with maxrate
     audio_bitrate: str = "192k"  # Target AAC bitrate
     audio_channels: int = 2  # Downmix to stereo for device compatibility
+    segment_type: str = "mpegts"  # HLS segment container: "mpegts" or "fmp4"
+    hls_flags: str = "delete_segments+append_list+temp_file"  # FFmpeg -hls_flags value
+    video_preset_override: Optional[str] = None  # x264 preset that wins over the hardware-derived one
+    video_tune: Optional[str] = None  # x264 tune (e.g. "zerolatency")
+    movflags: Optional[str] = None  # Fragment flags for fMP4 segments
+    hls_part_duration_ms: Optional[int] = None  # fMP4 fragment length inside each segment (not LL-HLS parts)
+    max_b_frames: Optional[int] = None  # B-frames (0 avoids reordering delay)
+    gop_size: Optional[int] = None  # Keyframe interval in frames
+    copy_mode: bool = False  # Remux source streams as-is (no re-encode)
+
+    @classmethod
+    def low_latency(cls, **overrides) -> "FFmpegCastingConfig":
+        """
+        Fragmented-MP4 profile with short segments for fast cast start and seeks.
+        
+        Latency comes from the 1 s segments. hls_part_duration_ms only splits
+        each segment into ~200 ms fMP4 fragments: segments are published whole
+        (temp_file) and the playlist carries no EXT-X-PART tags, so clients
+        still fetch complete segments.
+        """
+        params = dict(
+            hls_time=1,
+            hls_list_size=6,
+            segment_type="fmp4",
+            hls_flags=(
+                "delete_segments+append_list+temp_file+split_by_time"
+                "+independent_segments+program_date_time"
+            ),
+            video_preset_override="ultrafast",
+            video_tune="zerolatency",
+            movflags="frag_keyframe+empty_moov+default_base_moof+cmaf",
+            hls_part_duration_ms=200,
+            max_b_frames=0,
+            gop_size=30,
+        )
+        params.update(overrides)
+        return cls(**params)
 
 
 class FFmpegCastingError(RuntimeError):
@@ -68,15 +165,24 @@ class FFmpegCastingManager:
                    f"preset={self._ffmpeg_config['preset']}")
         
         self._ffmpeg_process: Optional[subprocess.Popen] = None
-        self._http_server_process: Optional[subprocess.Popen] = None
+        self._ffmpeg_pidfd: Optional[int] = None
+        self._httpd: Optional[HLSServer] = None
+        self._http_thread: Optional[threading.Thread] = None
         self._hls_dir: Optional[Path] = None
         self._active_config: Optional[FFmpegCastingConfig] = None
         self._active_video_path: Optional[str] = None
         self._active_subtitle_path: Optional[str] = None
-        self._ffmpeg_log_handle: Optional[IO[str]] = None
+        self._ffmpeg_log_fd: Optional[int] = None
         self._http_log_handle: Optional[IO[str]] = None
         self._ffmpeg_log_path: Optional[Path] = None
         self._http_log_path: Optional[Path] = None
+        self._probe_cache: Dict[tuple, Dict[str, Dict[str, object]]] = {}
+        self._local_ip: Optional[str] = None
+
+        # Resolve tool paths once instead of walking PATH on every cast
+        self._ffmpeg_bin: Optional[str] = shutil.which("ffmpeg")
+        self._ffprobe_bin: str = shutil.which("ffprobe") or "ffprobe"
+        self._pkill_bin: Optional[str] = shutil.which("pkill")
 
     @property
     def is_casting(self) -> bool:
@@ -84,8 +190,8 @@ class FFmpegCastingManager:
         return (
             self._ffmpeg_process is not None 
             and self._ffmpeg_process.poll() is None
-            and self._http_server_process is not None
-            and self._http_server_process.poll() is None
+            and self._http_thread is not None
+            and self._http_thread.is_alive()
         )
 
     @property
@@ -93,91 +199,239 @@ class FFmpegCastingManager:
         """Get the current streaming URL."""
         if not self.is_casting or not self._active_config:
             return None
-        
-        # Get local IP
+        return f"http://{self._local_ip or 'localhost'}:{self._active_config.port}/stream.m3u8"
+
+    @staticmethod
+    def _detect_local_ip() -> str:
+        """Return the LAN address used for outbound traffic (no packets are sent)."""
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
         except Exception:
-            local_ip = "localhost"
-        
-        return f"http://{local_ip}:{self._active_config.port}/stream.m3u8"
+            return "localhost"
 
-    def _terminate_previous_session(self, port: int) -> None:
-        """Kill any lingering FFmpeg/HTTP processes from prior sessions."""
+    def _terminate_previous_session(self) -> None:
+        """Kill any lingering FFmpeg processes from prior sessions."""
         self._stop_processes_from_pid_file()
 
-        pkill_path = shutil.which("pkill")
-        if not pkill_path:
+        # With pidfds the PID file is authoritative; pkill is only a fallback
+        if hasattr(os, "pidfd_open"):
             return
 
-        patterns = [
-            "ffmpeg.*stream.m3u8",
-            f"http.server {port}",
-            f"hls_http_server.py {port}",
-        ]
+        if not self._pkill_bin:
+            return
 
-        for pattern in patterns:
-            try:
-                subprocess.run(
-                    [pkill_path, "-f", pattern],
-                    check=False,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            except Exception:
-                continue
+        try:
+            subprocess.run(
+                [self._pkill_bin, "-f", "ffmpeg.*stream.m3u8"],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            pass
 
     def _stop_processes_from_pid_file(self) -> None:
         """Terminate processes recorded in the PID file if they are still alive."""
-        pid_file = Path("/tmp/subtitle_player_stream.pids")
-        if not pid_file.exists():
-            return
-
         try:
-            tokens = pid_file.read_text().strip().split()
-        except Exception:
-            tokens = []
+            tokens = PID_FILE.read_text().split()
+        except OSError:
+            return
 
         for token in tokens:
+            pid_text, _, start_token = token.partition(":")
             try:
-                pid = int(token)
+                pid = int(pid_text)
             except ValueError:
                 continue
+            # Skip PIDs that have since been reused by an unrelated process
+            if start_token and start_token != self._process_start_token(pid):
+                continue
             self._terminate_pid(pid)
 
         try:
-            pid_file.unlink()
-        except Exception:
+            PID_FILE.unlink(missing_ok=True)
+        except OSError:
             pass
 
     @staticmethod
-    def _terminate_pid(pid: int) -> None:
-        """Attempt to terminate a process by PID."""
-        for sig in (signal.SIGTERM, signal.SIGKILL):
-            try:
-                os.kill(pid, sig)
-            except ProcessLookupError:
-                return
-            except PermissionError:
-                return
+    def _process_start_token(pid: int) -> str:
+        """Return the kernel start time of *pid* from /proc, or "" if unavailable."""
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            return ""
+        # Fields after the parenthesised command name; starttime is field 22
+        fields = stat.rpartition(b")")[2].split()
+        return fields[19].decode() if len(fields) > 19 else ""
+
+    @staticmethod
+    def _terminate_pid(pid: int, timeout: float = TERMINATE_TIMEOUT) -> None:
+        """
+        Terminate a process by PID, escalating to SIGKILL if needed.
+        
+        On Linux the wait blocks on a pidfd until the process exits; elsewhere
+        it falls back to short sleeps.
+        """
+        if not hasattr(os, "pidfd_open"):
+            for sig in (signal.SIGTERM, signal.SIGKILL):
+                try:
+                    os.kill(pid, sig)
+                except (ProcessLookupError, PermissionError):
+                    return
 
-            time.sleep(0.1)
-            if not FFmpegCastingManager._is_pid_running(pid):
-                return
+                time.sleep(0.1)
+                if not FFmpegCastingManager._is_pid_running(pid):
+                    return
+            return
+
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            return
+
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            for sig in (signal.SIGTERM, signal.SIGKILL):
+                try:
+                    os.kill(pid, sig)
+                except (ProcessLookupError, PermissionError):
+                    return
+                if poller.poll(timeout * 1000):
+                    break
+            # Reap it if it was our own child; other processes are reaped by their parent
+            try:
+                os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+            except (ChildProcessError, OSError):
+                pass
+        finally:
+            os.close(pidfd)
 
     @staticmethod
     def _is_pid_running(pid: int) -> bool:
         """Check if a PID is still running."""
+        if sys.platform.startswith("linux"):
+            # One stat() of the process table; no signal permission check involved
+            return os.path.exists(f"/proc/{pid}")
+        return _kill0_probe(pid)
+
+    def _probe_streams(self, video_path: str) -> Dict[str, Dict[str, object]]:
+        """
+        Probe the first video and audio stream of *video_path* with one ffprobe call.
+        
+        Results are cached per path and mtime, so re-casting the same file
+        does not spawn ffprobe again. Missing streams map to empty dicts.
+        """
         try:
-            os.kill(pid, 0)
-        except ProcessLookupError:
+            cache_key = (video_path, os.stat(video_path).st_mtime_ns)
+        except OSError:
+            return {"video": {}, "audio": {}}
+        cached = self._probe_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        cmd = [
+            self._ffprobe_bin,
+            "-v", "error",
+            "-show_entries",
+            "stream=codec_type,codec_name,profile,level,height,pix_fmt,channels,r_frame_rate",
+            "-of", "json",
+            video_path,
+        ]
+        streams: Dict[str, Dict[str, object]] = {"video": {}, "audio": {}}
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=10)
+            if result.returncode == 0:
+                for stream in json.loads(result.stdout or "{}").get("streams", []):
+                    kind = stream.get("codec_type")
+                    if kind in streams and not streams[kind]:
+                        streams[kind] = stream
+        except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+            return streams
+
+        self._probe_cache[cache_key] = streams
+        return streams
+
+    def _keyint_for(self, video_path: str, hls_time: int) -> Optional[int]:
+        """Frames per HLS segment for *video_path*, or None if the frame rate is unknown."""
+        rate = self._probe_streams(video_path)["video"].get("r_frame_rate")
+        try:
+            num, _, den = str(rate).partition("/")
+            fps = float(num) / float(den or 1)
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+        if fps <= 0:
+            return None
+        return max(1, int(round(fps * hls_time)))
+
+    def can_stream_copy(self, video_path: str, config: Optional[FFmpegCastingConfig] = None) -> bool:
+        """
+        Whether the source can be remuxed into HLS without re-encoding.
+        
+        Requires H.264 (Baseline/Main/High, level <= 4.1, yuv420p, no taller
+        than the target height) with AAC audio that fits the channel limit.
+        """
+        cfg = config or FFmpegCastingConfig()
+        streams = self._probe_streams(video_path)
+        video, audio = streams["video"], streams["audio"]
+
+        if video.get("codec_name") != "h264":
             return False
-        except PermissionError:
-            return True
-        return True
+        if video.get("profile") not in _COPY_H264_PROFILES:
+            return False
+        level = video.get("level")
+        if not isinstance(level, int) or not 0 < level <= 41:
+            return False
+        if video.get("pix_fmt") != "yuv420p":
+            return False
+        height = video.get("height")
+        if cfg.target_height and (not isinstance(height, int) or height > cfg.target_height):
+            return False
+
+        if audio.get("codec_name") != "aac":
+            return False
+        channels = audio.get("channels")
+        return isinstance(channels, int) and channels <= cfg.audio_channels
+
+    def _wait_for_manifest(self, manifest_path: Path, timeout: float) -> Optional[int]:
+        """
+        Block until FFmpeg writes the HLS manifest or exits.
+        
+        On Linux the wait sleeps on a pidfd, so an FFmpeg crash wakes it
+        immediately; elsewhere it falls back to short sleeps.
+        
+        Returns:
+            None once the manifest exists, or FFmpeg's return code if it exited first
+            
+        Raises:
+            TimeoutError: If neither happens within *timeout* seconds
+        """
+        process = self._ffmpeg_process
+        deadline = time.monotonic() + timeout
+
+        poller = None
+        if self._ffmpeg_pidfd is not None:
+            poller = select.poll()
+            poller.register(self._ffmpeg_pidfd, select.POLLIN)
+
+        while True:
+            if manifest_path.exists():
+                return None
+            if process.poll() is not None:
+                return process.returncode
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No HLS manifest after {timeout} seconds")
+
+            interval = min(MANIFEST_POLL_INTERVAL, remaining)
+            if poller is not None:
+                poller.poll(interval * 1000)
+            else:
+                time.sleep(interval)
 
     def start_hls_stream(
         self,
@@ -201,12 +455,17 @@ class FFmpegCastingManager:
         if self.is_casting:
             raise FFmpegCastingError("Casting session already active")
 
+        if self._ffmpeg_bin is None:
+            raise FFmpegCastingError(
+                "FFmpeg not found. Please install FFmpeg to enable network casting."
+            )
+
         if not os.path.exists(video_path):
             raise FFmpegCastingError(f"Video file not found: {video_path}")
 
         cfg = config or FFmpegCastingConfig()
 
-        self._terminate_previous_session(cfg.port)
+        self._terminate_previous_session()
 
         subtitle_filter_arg: Optional[str] = None
         if subtitle_path:
@@ -217,151 +476,202 @@ class FFmpegCastingManager:
             self._active_subtitle_path = normalized_subtitle
         else:
             self._active_subtitle_path = None
+
+        if subtitle_filter_arg and cfg.copy_mode:
+            # Burning in subtitles needs a re-encode
+            cfg = replace(cfg, copy_mode=False)
+        if cfg.copy_mode:
+            # Without a re-encode, split_by_time would start segments on non-IDR
+            # frames and independent_segments would advertise them as decodable
+            hls_flags = "+".join(
+                flag for flag in cfg.hls_flags.split("+")
+                if flag not in _COPY_UNSAFE_HLS_FLAGS
+            )
+            cfg = replace(cfg, hls_flags=hls_flags)
         
-        # Create HLS directory
-        self._hls_dir = Path("/tmp/subtitle_player_hls")
-        self._hls_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Clean up old segments
-        for old_file in self._hls_dir.glob("*"):
-            try:
-                old_file.unlink()
-            except Exception:
-                pass
+        # Create a clean HLS directory (tmpfs when available: segments never touch disk)
+        self._hls_dir = _pick_hls_root()
+        self._reset_hls_dir()
 
         # Start FFmpeg HLS encoder with hardware optimization
-        ffmpeg_cmd = [
-            "ffmpeg",
+        # Argument groups are flattened once at the end
+        groups: List[Tuple[str, ...]] = [(
+            self._ffmpeg_bin,
+            "-nostats",  # No per-frame progress lines in ffmpeg.log
+            "-loglevel", "info" if logger.isEnabledFor(logging.DEBUG) else "warning",
             "-re",  # Read input at native framerate
             "-stream_loop", "-1",  # Loop indefinitely
-        ]
+        )]
         
-        # Add hardware acceleration if available
-        hwaccel = self._ffmpeg_config.get('hwaccel')
+        # Add hardware acceleration if available (decoding is skipped when remuxing)
+        hwaccel = None if cfg.copy_mode else self._ffmpeg_config.get('hwaccel')
         if hwaccel:
-            ffmpeg_cmd.extend(["-hwaccel", hwaccel])
+            groups.append(("-hwaccel", hwaccel))
             if hwaccel == "cuda":
-                ffmpeg_cmd.extend(["-hwaccel_output_format", "cuda"])
+                groups.append(("-hwaccel_output_format", "cuda"))
                 logger.info("Using NVIDIA CUDA hardware acceleration")
         
-        ffmpeg_cmd.extend(["-i", video_path])
-
-        video_filters: list[str] = []
-        if subtitle_filter_arg:
-            video_filters.append(subtitle_filter_arg)
-
-        if cfg.target_height:
-            video_filters.append(f"scale=-2:{cfg.target_height}")
-
-        video_filters.append("format=yuv420p")
-
-        # Hardware-accelerated video encoding
-        video_codec = self._ffmpeg_config.get('video_codec', 'libx264')
-        preset = self._ffmpeg_config.get('preset', cfg.video_preset)
-        threads = self._ffmpeg_config.get('threads', 0)
-        
-        ffmpeg_cmd.extend([
-            "-vf", ",".join(video_filters),
-            "-c:v", video_codec,
-        ])
-        
-        # Preset settings depend on codec
-        if video_codec == "h264_nvenc":
-            # NVIDIA NVENC settings
-            ffmpeg_cmd.extend([
-                "-preset", self._ffmpeg_config.get('preset_nvenc', 'p4'),
-                "-rc", self._ffmpeg_config.get('rc', 'vbr'),
-                "-gpu", self._ffmpeg_config.get('gpu', '0'),
-            ])
-            logger.info(f"Using NVIDIA NVENC encoder (preset {self._ffmpeg_config.get('preset_nvenc', 'p4')})")
-        elif video_codec in ["h264_vaapi", "h264_videotoolbox"]:
-            # AMD or Apple hardware encoding
-            logger.info(f"Using {video_codec} hardware encoder")
+        groups.append((
+            "-fflags", "+nobuffer+genpts",
+            "-probesize", "5M",
+            "-analyzeduration", "5M",
+            "-i", video_path,
+        ))
+
+        if cfg.copy_mode:
+            # Source is already H.264/AAC: remux only, no decode/encode
+            logger.info("Using stream-copy fast path (no re-encode)")
+            groups.append((
+                "-c:v", "copy",
+                "-c:a", "copy",
+            ))
+            if cfg.segment_type == "mpegts":
+                # MPEG-TS needs Annex B start codes; fMP4 keeps the MP4 layout
+                groups.append(("-bsf:v", "h264_mp4toannexb"))
         else:
-            # Software encoding
-            ffmpeg_cmd.extend([
-                "-preset", preset,
-                "-threads", str(threads) if threads > 0 else "0",
-            ])
-            logger.info(f"Using software encoder with {threads if threads > 0 else 'auto'} threads, preset {preset}")
-        
-        ffmpeg_cmd.extend([
-            "-crf", str(cfg.video_crf),
-            "-profile:v", cfg.video_profile,
-            "-level:v", cfg.video_level,
-            "-pix_fmt", "yuv420p",
-        ])
-
-        if cfg.video_maxrate:
-            ffmpeg_cmd.extend(["-maxrate", cfg.video_maxrate])
-        
-        # Use optimized buffer size
-        buffer_size = self._ffmpeg_config.get('buffer_size', cfg.video_bufsize or "4M")
-        ffmpeg_cmd.extend(["-bufsize", buffer_size])
-
-        ffmpeg_cmd.extend([
-            "-c:a", "aac",
-            "-ac", str(cfg.audio_channels),
-            "-b:a", cfg.audio_bitrate,
+            # Hardware-accelerated video encoding
+            video_codec = self._ffmpeg_config.get('video_codec', 'libx264')
+            video_filters = self._build_video_filter_chain(cfg, subtitle_filter_arg, hwaccel)
+            preset = cfg.video_preset_override or self._ffmpeg_config.get('preset', cfg.video_preset)
+            threads = self._ffmpeg_config.get('threads', 0)
+
+            groups.append((
+                "-vf", ",".join(video_filters),
+                "-c:v", video_codec,
+            ))
+
+            # One GOP per HLS segment: explicit override, else source fps * hls_time
+            keyint = cfg.gop_size or self._keyint_for(video_path, cfg.hls_time)
+            force_key_frames = f"expr:gte(t,n_forced*{cfg.hls_time})"
+
+            # Preset settings depend on codec
+            if video_codec == "h264_nvenc":
+                # NVIDIA NVENC settings
+                groups.append((
+                    "-preset", self._ffmpeg_config.get('preset_nvenc', 'p4'),
+                    "-rc", self._ffmpeg_config.get('rc', 'vbr'),
+                    "-gpu", self._ffmpeg_config.get('gpu', '0'),
+                    "-no-scenecut", "1",
+                    "-forced-idr", "1",
+                    "-force_key_frames", force_key_frames,
+                ))
+                logger.info(f"Using NVIDIA NVENC encoder (preset {self._ffmpeg_config.get('preset_nvenc', 'p4')})")
+            elif video_codec in ["h264_vaapi", "h264_videotoolbox"]:
+                # AMD or Apple hardware encoding
+                logger.info(f"Using {video_codec} hardware encoder")
+            else:
+                # Software encoding
+                groups.append((
+                    "-preset", preset,
+                    "-threads", str(threads) if threads > 0 else "0",
+                    "-tune", cfg.video_tune or "zerolatency",
+                    "-sc_threshold", "0",
+                    "-force_key_frames", force_key_frames,
+                ))
+                if keyint:
+                    groups.append(("-keyint_min", str(keyint)))
+                logger.info(f"Using software encoder with {threads if threads > 0 else 'auto'} threads, preset {preset}")
+
+            groups.append((
+                "-crf", str(cfg.video_crf),
+                "-profile:v", cfg.video_profile,
+                "-level:v", cfg.video_level,
+            ))
+
+            if cfg.video_maxrate:
+                groups.append(("-maxrate", cfg.video_maxrate))
+
+            # Use optimized buffer size
+            buffer_size = self._ffmpeg_config.get('buffer_size', cfg.video_bufsize or "4M")
+            groups.append(("-bufsize", buffer_size))
+
+            if cfg.max_b_frames is not None:
+                groups.append(("-bf", str(cfg.max_b_frames)))
+            if keyint:
+                groups.append(("-g", str(keyint)))
+
+            groups.append((
+                "-c:a", "aac",
+                "-ac", str(cfg.audio_channels),
+                "-b:a", cfg.audio_bitrate,
+            ))
+
+        groups.append((
+            "-flush_packets", "1",
+            "-max_muxing_queue_size", "1024",
             "-f", "hls",
             "-hls_time", str(cfg.hls_time),
             "-hls_list_size", str(cfg.hls_list_size),
-            "-hls_flags", "delete_segments+append_list",
-            "-hls_segment_filename", str(self._hls_dir / "segment%03d.ts"),
+            "-hls_flags", cfg.hls_flags,
+        ))
+
+        # Per-session names: the HTTP server marks segments immutable, so a
+        # restarted cast must never reuse a URL with different bytes
+        session_tag = f"{time.time_ns() // 1_000_000:x}"
+        if cfg.segment_type == "fmp4":
+            groups.append((
+                "-hls_segment_type", "fmp4",
+                "-hls_fmp4_init_filename", f"init_{session_tag}.mp4",
+            ))
+            segment_options = []
+            if cfg.movflags:
+                segment_options.append(f"movflags=+{cfg.movflags}")
+            if cfg.hls_part_duration_ms:
+                segment_options.append(f"frag_duration={cfg.hls_part_duration_ms * 1000}")
+            if segment_options:
+                groups.append(("-hls_segment_options", ":".join(segment_options)))
+            segment_pattern = f"segment_{session_tag}_%03d.m4s"
+        else:
+            segment_pattern = f"segment_{session_tag}_%03d.ts"
+
+        groups.append((
+            "-hls_segment_filename", str(self._hls_dir / segment_pattern),
             str(self._hls_dir / "stream.m3u8"),
-        ])
+        ))
         
-        logger.info(f"FFmpeg command: {' '.join(ffmpeg_cmd)}")
+        ffmpeg_cmd = list(chain.from_iterable(groups))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"FFmpeg command: {shlex.join(ffmpeg_cmd)}")
 
         # For debugging, log FFmpeg output to a file
+        # (a raw O_APPEND fd: FFmpeg writes straight to the file, nothing to flush here)
         ffmpeg_log = self._hls_dir / "ffmpeg.log"
-        self._ffmpeg_log_handle = open(str(ffmpeg_log), "w")
+        self._ffmpeg_log_fd = os.open(
+            str(ffmpeg_log),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+            0o644,
+        )
         self._ffmpeg_log_path = ffmpeg_log
         
         try:
             self._ffmpeg_process = subprocess.Popen(
                 ffmpeg_cmd,
-                stdout=self._ffmpeg_log_handle,
+                stdout=self._ffmpeg_log_fd,
                 stderr=subprocess.STDOUT,
                 stdin=subprocess.DEVNULL,
             )
         except FileNotFoundError:
-            self._ffmpeg_log_handle.close()
-            self._ffmpeg_log_handle = None
+            self._close_ffmpeg_log()
             raise FFmpegCastingError(
                 "FFmpeg not found. Please install FFmpeg to enable network casting."
             )
         except Exception as e:
-            self._ffmpeg_log_handle.close()
-            self._ffmpeg_log_handle = None
+            self._close_ffmpeg_log()
             raise FFmpegCastingError(f"Failed to start FFmpeg: {e}")
 
+        if hasattr(os, "pidfd_open"):
+            try:
+                self._ffmpeg_pidfd = os.pidfd_open(self._ffmpeg_process.pid)
+            except OSError:
+                self._ffmpeg_pidfd = None
+
         # Wait for first segment to be created
-        startup_deadline = time.monotonic() + max(5, cfg.startup_timeout)
         manifest_path = self._hls_dir / "stream.m3u8"
 
-        while time.monotonic() < startup_deadline:
-            if manifest_path.exists():
-                break
-
-            if self._ffmpeg_process and self._ffmpeg_process.poll() is not None:
-                return_code = self._ffmpeg_process.returncode
-                self._persist_failure_logs(
-                    "ffmpeg_exit_during_startup",
-                    video_path,
-                    cfg,
-                    {
-                        "return_code": return_code,
-                        "subtitle_on_cast": bool(self._active_subtitle_path),
-                    },
-                )
-                self.stop()
-                raise FFmpegCastingError(
-                    f"FFmpeg exited prematurely while starting stream (return code {return_code})."
-                )
-
-            time.sleep(0.5)
-        else:
+        try:
+            return_code = self._wait_for_manifest(manifest_path, max(5, cfg.startup_timeout))
+        except TimeoutError:
             self._persist_failure_logs(
                 "startup_timeout",
                 video_path,
@@ -375,64 +685,52 @@ class FFmpegCastingManager:
                 f"Stream failed to initialize within {cfg.startup_timeout} seconds"
             )
 
-        # Start HTTP server with proper HLS MIME types
-        hls_server_script = PROJECT_ROOT / "src" / "hls_http_server.py"
-        http_cmd = [
-            "python3",
-            str(hls_server_script),
-            str(cfg.port),
-            "-d", str(self._hls_dir),
-        ]
-
-        # For debugging, log HTTP server output to a file
-        http_log = self._hls_dir / "http.log"
-        self._http_log_handle = open(str(http_log), "w")
-        self._http_log_path = http_log
-
-        try:
-            self._http_server_process = subprocess.Popen(
-                http_cmd,
-                stdout=self._http_log_handle,
-                stderr=subprocess.STDOUT,
-                stdin=subprocess.DEVNULL,
-            )
-        except Exception as e:
+        if return_code is not None:
             self._persist_failure_logs(
-                "http_server_start_failure",
+                "ffmpeg_exit_during_startup",
                 video_path,
                 cfg,
                 {
-                    "error": str(e),
+                    "return_code": return_code,
+                    "subtitle_on_cast": bool(self._active_subtitle_path),
                 },
             )
             self.stop()
-            raise FFmpegCastingError(f"Failed to start HTTP server: {e}")
+            raise FFmpegCastingError(
+                f"FFmpeg exited prematurely while starting stream (return code {return_code})."
+            )
 
-        # Give HTTP server a moment to start
-        time.sleep(1)
+        # Serve the HLS directory from a thread in this process
+        http_log = self._hls_dir / "http.log"
+        self._http_log_handle = open(str(http_log), "w", buffering=1)
+        self._http_log_path = http_log
 
-        # Verify server is running
-        if self._http_server_process.poll() is not None:
+        try:
+            self._httpd, self._http_thread = serve_in_thread(
+                cfg.port,
+                str(self._hls_dir),
+                log_stream=self._http_log_handle,
+            )
+        except OSError as e:
             self._persist_failure_logs(
-                "http_server_exited",
+                "http_server_start_failure",
                 video_path,
                 cfg,
                 {
-                    "return_code": self._http_server_process.returncode,
+                    "error": str(e),
                 },
             )
             self.stop()
-            raise FFmpegCastingError("HTTP server failed to start")
+            raise FFmpegCastingError(f"Failed to start HTTP server: {e}")
 
         self._active_config = cfg
         self._active_video_path = video_path
+        self._local_ip = self._detect_local_ip()
         
         # Save PIDs for manual cleanup if needed
-        pid_file = Path("/tmp/subtitle_player_stream.pids")
+        ffmpeg_pid = self._ffmpeg_process.pid
         try:
-            pid_file.write_text(
-                f"{self._ffmpeg_process.pid} {self._http_server_process.pid}\n"
-            )
+            PID_FILE.write_text(f"{ffmpeg_pid}:{self._process_start_token(ffmpeg_pid)}\n")
         except Exception:
             pass
 
@@ -450,22 +748,23 @@ class FFmpegCastingManager:
                 pass
             self._ffmpeg_process = None
 
-        if self._http_server_process is not None:
-            try:
-                self._http_server_process.terminate()
-                self._http_server_process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                self._http_server_process.kill()
-            except Exception:
-                pass
-            self._http_server_process = None
+        if self._ffmpeg_pidfd is not None:
+            os.close(self._ffmpeg_pidfd)
+            self._ffmpeg_pidfd = None
 
-        if self._ffmpeg_log_handle is not None:
+        if self._httpd is not None:
             try:
-                self._ffmpeg_log_handle.close()
+                self._httpd.shutdown()
+                self._httpd.server_close()
             except Exception:
                 pass
-            self._ffmpeg_log_handle = None
+            self._httpd = None
+
+        if self._http_thread is not None:
+            self._http_thread.join(timeout=HTTP_STOP_TIMEOUT)
+            self._http_thread = None
+
+        self._close_ffmpeg_log()
         self._ffmpeg_log_path = None
 
         if self._http_log_handle is not None:
@@ -476,33 +775,32 @@ class FFmpegCastingManager:
             self._http_log_handle = None
         self._http_log_path = None
 
-        if self._hls_dir and self._hls_dir.exists():
-            try:
-                for file in self._hls_dir.glob("*"):
-                    file.unlink()
-                self._hls_dir.rmdir()
-            except Exception:
-                pass
+        if self._hls_dir:
+            shutil.rmtree(self._hls_dir, ignore_errors=True)
 
-        pid_file = Path("/tmp/subtitle_player_stream.pids")
-        if pid_file.exists():
-            try:
-                pid_file.unlink()
-            except Exception:
-                pass
+        try:
+            PID_FILE.unlink(missing_ok=True)
+        except OSError:
+            pass
 
         self._active_config = None
         self._active_video_path = None
+        self._local_ip = None
         self._active_subtitle_path = None
         self._hls_dir = None
 
-    def _flush_logs(self) -> None:
-        for handle in (self._ffmpeg_log_handle, self._http_log_handle):
-            if handle:
-                try:
-                    handle.flush()
-                except Exception:
-                    pass
+    def _reset_hls_dir(self) -> None:
+        """Remove leftovers from a previous session and recreate the HLS directory."""
+        shutil.rmtree(self._hls_dir, ignore_errors=True)
+        self._hls_dir.mkdir(parents=True, exist_ok=True)
+
+    def _close_ffmpeg_log(self) -> None:
+        if self._ffmpeg_log_fd is not None:
+            try:
+                os.close(self._ffmpeg_log_fd)
+            except OSError:
+                pass
+            self._ffmpeg_log_fd = None
 
     def _persist_failure_logs(
         self,
@@ -514,8 +812,6 @@ class FFmpegCastingManager:
         """Copy FFmpeg/HTTP logs to the project logs directory for post-mortem analysis."""
 
         try:
-            self._flush_logs()
-
             archive_root = LOG_ARCHIVE_DIR
             archive_root.mkdir(parents=True, exist_ok=True)
 
@@ -537,57 +833,68 @@ class FFmpegCastingManager:
                 "reason": reason,
                 "video_path": video_path,
                 "subtitle_path": self._active_subtitle_path,
-                "config": {
-                    "host": config.host,
-                    "port": config.port,
-                    "hls_time": config.hls_time,
-                    "hls_list_size": config.hls_list_size,
-                    "startup_timeout": config.startup_timeout,
-                    "target_height": config.target_height,
-                    "video_crf": config.video_crf,
-                    "video_preset": config.video_preset,
-                    "video_profile": config.video_profile,
-                    "video_level": config.video_level,
-                    "video_maxrate": config.video_maxrate,
-                    "video_bufsize": config.video_bufsize,
-                    "audio_bitrate": config.audio_bitrate,
-                    "audio_channels": config.audio_channels,
-                },
+                "config": asdict(config),
                 "ffmpeg_return_code": self._ffmpeg_process.returncode if self._ffmpeg_process else None,
-                "http_return_code": self._http_server_process.returncode if self._http_server_process else None,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
             if extra:
                 metadata.update(extra)
 
-            (bundle_dir / "metadata.json").write_text(
-                json.dumps(metadata, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-
-            if self._ffmpeg_log_path and self._ffmpeg_log_path.exists():
-                shutil.copy(self._ffmpeg_log_path, bundle_dir / "ffmpeg.log")
+            (bundle_dir / "metadata.json").write_bytes(_dumps_pretty(metadata))
 
-            if self._http_log_path and self._http_log_path.exists():
-                shutil.copy(self._http_log_path, bundle_dir / "http.log")
+            # copyfile uses sendfile where available; the two copies overlap
+            logs = [
+                (path, bundle_dir / name)
+                for path, name in (
+                    (self._ffmpeg_log_path, "ffmpeg.log"),
+                    (self._http_log_path, "http.log"),
+                )
+                if path and path.exists()
+            ]
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(shutil.copyfile, src, dst) for src, dst in logs]
+                for future in futures:
+                    future.result()
 
             return bundle_dir
         except Exception:
             return None
 
+    @staticmethod
+    def _build_video_filter_chain(
+        cfg: FFmpegCastingConfig,
+        subtitle_filter_arg: Optional[str],
+        hwaccel: Optional[str],
+    ) -> list[str]:
+        """
+        Build the -vf chain for the active decode path.
+        
+        With CUDA decoding the frames stay in GPU memory: scaling runs in
+        scale_cuda and frames only visit system memory when subtitles have to
+        be burned in. Every chain pins yuv420p, so no separate -pix_fmt is needed.
+        """
+        if hwaccel == "cuda":
+            if cfg.target_height:
+                scale = f"scale_cuda=-2:{cfg.target_height}:format=yuv420p"
+            else:
+                scale = "scale_cuda=format=yuv420p"
+            if not subtitle_filter_arg:
+                return [scale]
+            return [scale, "hwdownload", "format=yuv420p", subtitle_filter_arg, "hwupload_cuda"]
+
+        video_filters: list[str] = []
+        if subtitle_filter_arg:
+            video_filters.append(subtitle_filter_arg)
+        if cfg.target_height:
+            video_filters.append(f"scale=-2:{cfg.target_height}")
+        video_filters.append("format=yuv420p")
+        return video_filters
+
     @staticmethod
     def _build_subtitle_filter(subtitle_path: str) -> str:
         """Escape and build the FFmpeg subtitles filter argument."""
-        resolved = Path(subtitle_path).resolve()
-        escaped = str(resolved).replace("\\", "\\\\")
-        escaped = escaped.replace(":", "\\:")
-        escaped = escaped.replace(",", "\\,")
-        escaped = escaped.replace("'", "\\'")
-        escaped = escaped.replace("[", "\\[").replace("]", "\\]")
-        escaped = escaped.replace("(", "\\(").replace(")", "\\)")
-        escaped = escaped.replace(" ", "\\ ")
-        return f"subtitles={escaped}"
+        return "subtitles=" + str(Path(subtitle_path).resolve()).translate(_SUBTITLE_ESCAPE_TABLE)
 
     def cleanup(self) -> None:
         """Cleanup resources."""
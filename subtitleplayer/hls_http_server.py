@@ -2,45 +2,259 @@
 """
 Custom HTTP server with correct MIME types for HLS streaming.
 
-Serves .m3u8 as application/vnd.apple.mpegurl and .ts as video/mp2t
-to ensure proper playback in browsers and native HLS players.
+Serves .m3u8 as application/vnd.apple.mpegurl, .ts as video/mp2t and
+fragmented-MP4 segments (.mp4 init / .m4s) to ensure proper playback in
+browsers and native HLS players.
 """
 
+import functools
 import http.server
 import mimetypes
+import os
+import re
+import socket
 import socketserver
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
+from urllib.parse import urlsplit
+from typing import IO, Optional, Tuple
 
 
 # Register HLS MIME types
 mimetypes.add_type("application/vnd.apple.mpegurl", ".m3u8")
 mimetypes.add_type("video/mp2t", ".ts")
+mimetypes.add_type("video/mp4", ".mp4")
+mimetypes.add_type("video/iso.segment", ".m4s")
 mimetypes.add_type("text/vtt", ".vtt")
 
+# Playlists change constantly; segments and init files never change once published
+PLAYLIST_CACHE_CONTROL = "no-cache, max-age=0"
+SEGMENT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "no-cache, no-store, must-revalidate"
+_SEGMENT_EXTENSIONS = frozenset({".ts", ".m4s", ".mp4"})
+
+# Single byte range: "bytes=start-end", "bytes=start-" or "bytes=-suffix"
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+# Idle keep-alive connections are dropped after this many seconds so they
+# cannot pin pool workers; players re-request the playlist well within it
+KEEPALIVE_TIMEOUT = 5
+
 
 class HLSRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Request handler with CORS headers for cross-origin streaming."""
     
+    # Keep-alive: a player fetches the playlist and every segment over one connection
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    
+    # Older Pythons snapshot mimetypes at import, before the HLS types above exist
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        ".m3u8": "application/vnd.apple.mpegurl",
+        ".ts": "video/mp2t",
+        ".mp4": "video/mp4",
+        ".m4s": "video/iso.segment",
+        ".vtt": "text/vtt",
+    }
+    
+    # Set per request by send_head; read by end_headers and copyfile
+    _cache_control = DEFAULT_CACHE_CONTROL
+    _byte_range: Optional[Tuple[int, int]] = None
+    
+    def setup(self):
+        """Disable Nagle so small playlist responses go out immediately."""
+        super().setup()
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+    
+    def copyfile(self, source, outputfile):
+        """Send file bodies (or the requested byte range) with zero-copy sendfile."""
+        byte_range, self._byte_range = self._byte_range, None
+        try:
+            in_fd = source.fileno()
+            if byte_range is not None:
+                offset, count = byte_range
+            else:
+                offset = source.tell()
+                count = os.fstat(in_fd).st_size - offset
+        except (AttributeError, OSError, ValueError):
+            return super().copyfile(source, outputfile)
+
+        # The handler timeout puts the socket in timeout mode; socket.sendfile
+        # waits for it to drain on EAGAIN (bounded by that timeout) and falls
+        # back to send() where os.sendfile is unavailable
+        self.connection.sendfile(source, offset, count)
+    
     def end_headers(self):
-        """Add CORS headers to allow browser access."""
+        """Add CORS and per-file-type cache headers."""
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, HEAD, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "*")
-        self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+        self.send_header("Cache-Control", self._cache_control)
         super().end_headers()
     
+    def send_error(self, code, message=None, explain=None):
+        """Never let clients cache an error under a segment URL."""
+        self._cache_control = DEFAULT_CACHE_CONTROL
+        super().send_error(code, message, explain)
+    
+    def send_head(self):
+        """Pick cache headers by extension and answer single-range requests with 206."""
+        self._byte_range = None
+        extension = os.path.splitext(urlsplit(self.path).path)[1].lower()
+        if extension == ".m3u8":
+            self._cache_control = PLAYLIST_CACHE_CONTROL
+        elif extension in _SEGMENT_EXTENSIONS:
+            self._cache_control = SEGMENT_CACHE_CONTROL
+        else:
+            self._cache_control = DEFAULT_CACHE_CONTROL
+
+        range_header = self.headers.get("Range")
+        path = self.translate_path(self.path)
+        match = _RANGE_RE.fullmatch(range_header.strip()) if range_header else None
+        if match is None or not os.path.isfile(path):
+            # No range, a directory, or a multi-range request: serve the whole thing
+            return super().send_head()
+
+        try:
+            source = open(path, "rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            size = os.fstat(source.fileno()).st_size
+            first, last = match.groups()
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            elif last:
+                start = max(0, size - int(last))
+                end = size - 1
+            else:
+                source.close()
+                return super().send_head()
+
+            if start >= size or start > end:
+                source.close()
+                self._cache_control = DEFAULT_CACHE_CONTROL
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            self._byte_range = (start, end - start + 1)
+            return source
+        except Exception:
+            source.close()
+            raise
+    
     def do_OPTIONS(self):
         """Handle CORS preflight."""
         self.send_response(200)
+        self.send_header("Content-Length", "0")
         self.end_headers()
     
     def log_message(self, format, *args):
         """Log with cleaner format."""
-        sys.stderr.write("%s - - [%s] %s\n" %
-                         (self.address_string(),
-                          self.log_date_time_string(),
-                          format % args))
+        stream = getattr(self.server, "log_stream", None) or sys.stderr
+        stream.write("%s - - [%s] %s\n" %
+                     (self.address_string(),
+                      self.log_date_time_string(),
+                      format % args))
+        stream.flush()
+
+
+class HLSServer(http.server.ThreadingHTTPServer):
+    """HTTP server that rebinds instantly and handles requests on a bounded pool."""
+
+    allow_reuse_address = True
+    request_queue_size = 128
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    log_stream: Optional[IO[str]] = None
+
+    def __init__(self, server_address, RequestHandlerClass, bind_and_activate=True):
+        super().__init__(server_address, RequestHandlerClass, bind_and_activate)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="hls-http",
+        )
+        # Pool workers are not daemons, so open connections are tracked and
+        # torn down on close rather than left to run out their idle timeout
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def server_bind(self):
+        """Bind without HTTPServer's reverse-DNS lookup of the host name."""
+        socketserver.TCPServer.server_bind(self)
+        host, port = self.server_address[:2]
+        self.server_name = host
+        self.server_port = port
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool instead of a new thread."""
+        with self._connections_lock:
+            self._connections.add(request)
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Unblock workers parked on idle keep-alive reads so they exit now
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._executor.shutdown(wait=False)
+
+
+def _handler_for(directory: str):
+    return functools.partial(HLSRequestHandler, directory=str(Path(directory).resolve()))
+
+
+def serve_in_thread(
+    port: int,
+    directory: str,
+    log_stream: Optional[IO[str]] = None,
+) -> Tuple[HLSServer, threading.Thread]:
+    """
+    Start the HLS HTTP server on a background thread of the current process.
+    
+    The socket is bound and listening when this returns; stop it with
+    ``httpd.shutdown()`` followed by ``httpd.server_close()``.
+    
+    Raises:
+        OSError: If the port cannot be bound
+    """
+    httpd = HLSServer(("", port), _handler_for(directory))
+    httpd.log_stream = log_stream
+    thread = threading.Thread(
+        target=httpd.serve_forever,
+        name=f"hls-http-{port}",
+        daemon=True,
+    )
+    thread.start()
+    return httpd, thread
 
 
 def serve(port: int = 8080, directory: str = "."):
@@ -51,19 +265,12 @@ def serve(port: int = 8080, directory: str = "."):
         port: Port to listen on (default 8080)
         directory: Directory to serve files from (default current)
     """
-    handler = HLSRequestHandler
-    
-    # Change to the target directory
     target_dir = Path(directory).resolve()
     if not target_dir.exists():
         print(f"Error: Directory {target_dir} does not exist", file=sys.stderr)
         sys.exit(1)
     
-    import os
-    os.chdir(str(target_dir))
-    
-    # Use ThreadingTCPServer for concurrent connections
-    with socketserver.ThreadingTCPServer(("", port), handler) as httpd:
+    with HLSServer(("", port), _handler_for(str(target_dir))) as httpd:
         print(f"Serving HLS content from {target_dir} on port {port}")
         print(f"Stream URL: http://0.0.0.0:{port}/stream.m3u8")
         try:
@@ -4,19 +4,144 @@ Handles authentication, subtitle search, and download from OpenSubtitles.com API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
 import os
 import struct
 import gzip
 import json
-from typing import List, Dict, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# OpenSubtitles hash: file size plus the 64-bit little-endian words of the
+# first and last 64 KiB, unpacked a whole window at a time
+HASH_CHUNK_SIZE = 65536
+_HASH_WORDS = struct.Struct(f"<{HASH_CHUNK_SIZE // 8}Q")
+
+# (connect, read) seconds for every API call, so a stalled server cannot
+# hold a caller forever
+REQUEST_TIMEOUT = (10, 30)
+
+
+def _parse(response) -> Any:
+    """Decode a JSON response body straight from bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+@lru_cache(maxsize=1)
+def _word_sum() -> Callable[[bytes], int]:
+    """Return the window summer: a Numba-compiled loop when installed, else struct."""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return lambda window: sum(_HASH_WORDS.unpack(window))
+
+    @njit(cache=True)
+    def _sum_u64(words):
+        total = np.uint64(0)
+        for i in range(words.shape[0]):  # Plain index loop so LLVM vectorizes it
+            total += words[i]
+        return total
+
+    return lambda window: int(_sum_u64(np.frombuffer(window, dtype="<u8")))
+
+
+@lru_cache(maxsize=1)
+def _tail_reader() -> ThreadPoolExecutor:
+    """Shared pool that reads hash tail windows while the caller reads the head."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="subhash")
+
+
+@lru_cache(maxsize=128)
+def _cached_hash(path: str, filesize: int, mtime_ns: int) -> Optional[str]:
+    """OpenSubtitles hash of *path*; size and mtime in the key invalidate stale entries."""
+    if filesize < HASH_CHUNK_SIZE * 2:
+        return None
+    
+    tail_offset = filesize - HASH_CHUNK_SIZE
+    if hasattr(os, "pread"):
+        # Positional reads share no file offset, so head and tail are in flight together
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            tail_future = _tail_reader().submit(os.pread, fd, HASH_CHUNK_SIZE, tail_offset)
+            head = os.pread(fd, HASH_CHUNK_SIZE, 0)
+            tail = tail_future.result()
+        finally:
+            os.close(fd)
+    else:
+        # Unbuffered: each window is a single read() straight into one buffer
+        with open(path, "rb", buffering=0) as f:
+            head = f.read(HASH_CHUNK_SIZE)
+            f.seek(tail_offset, 0)
+            tail = f.read(HASH_CHUNK_SIZE)
+    if len(head) != HASH_CHUNK_SIZE or len(tail) != HASH_CHUNK_SIZE:
+        return None  # File shrank while hashing
+    
+    word_sum = _word_sum()
+    hash_value = filesize + word_sum(head) + word_sum(tail)
+    return "%016x" % (hash_value & 0xFFFFFFFFFFFFFFFF)  # Remain as 64bit number
+
+
+def to_columnar(subtitles: List[Dict]) -> Dict[str, list]:
+    """
+    Flatten search results into parallel columns in a single pass
+    
+    Display, filtering and sorting then touch one flat list per field instead
+    of walking nested attribute dicts again for every row.
+    
+    Args:
+        subtitles: List of subtitle dictionaries from search
+        
+    Returns:
+        Dictionary of equal-length lists keyed by field name; missing values are None
+    """
+    columns: Dict[str, list] = {
+        'language': [],
+        'release': [],
+        'download_count': [],
+        'ratings': [],
+        'format': [],
+        'uploader': [],
+        'file_id': [],
+    }
+    languages = columns['language'].append
+    releases = columns['release'].append
+    download_counts = columns['download_count'].append
+    ratings = columns['ratings'].append
+    formats = columns['format'].append
+    uploaders = columns['uploader'].append
+    file_ids = columns['file_id'].append
+    for sub in subtitles:
+        attributes = sub.get('attributes') or {}
+        languages(attributes.get('language'))
+        releases(attributes.get('release'))
+        download_counts(attributes.get('download_count'))
+        ratings(attributes.get('ratings'))
+        formats(attributes.get('format'))
+        uploaders((attributes.get('uploader') or {}).get('name'))
+        file_ids((attributes.get('files') or [{}])[0].get('file_id'))
+    return columns
+
 
 class OpenSubtitlesAPI:
     """Client for OpenSubtitles.com API v1"""
     
     BASE_URL = "https://api.opensubtitles.com/api/v1"
+    _URL_LOGIN = BASE_URL + "/login"
+    _URL_SEARCH = BASE_URL + "/subtitles"
+    _URL_DOWNLOAD = BASE_URL + "/download"
+    _URL_USER = BASE_URL + "/infos/user"
     
     def __init__(self, api_key: str = None):
         """
@@ -27,9 +152,14 @@ class OpenSubtitlesAPI:
         """
         self.api_key = api_key or os.environ.get('OPENSUBTITLES_API_KEY', '')
         self.session = requests.Session()
+        # Pooled keep-alive connections: search, download link and file fetch reuse TLS sessions
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=3)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'Api-Key': self.api_key,
             'Content-Type': 'application/json',
+            'Accept': 'application/json',
             'User-Agent': 'SubtitlePlayer v1.0'
         })
         self.token = None
@@ -47,11 +177,12 @@ class OpenSubtitlesAPI:
         """
         try:
             response = self.session.post(
-                f"{self.BASE_URL}/login",
-                json={'username': username, 'password': password}
+                self._URL_LOGIN,
+                json={'username': username, 'password': password},
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse(response)
             self.token = data.get('token')
             if self.token:
                 self.session.headers.update({'Authorization': f'Bearer {self.token}'})
@@ -71,32 +202,8 @@ class OpenSubtitlesAPI:
             str: 16-character hexadecimal hash or None if failed
         """
         try:
-            longlongformat = 'q'  # long long
-            bytesize = struct.calcsize(longlongformat)
-            
-            with open(filepath, "rb") as f:
-                filesize = os.path.getsize(filepath)
-                hash_value = filesize
-                
-                if filesize < 65536 * 2:
-                    return None
-                
-                # Read first 64KB
-                for _ in range(65536 // bytesize):
-                    buffer = f.read(bytesize)
-                    (l_value,) = struct.unpack(longlongformat, buffer)
-                    hash_value += l_value
-                    hash_value &= 0xFFFFFFFFFFFFFFFF  # Remain as 64bit number
-                
-                # Read last 64KB
-                f.seek(max(0, filesize - 65536), 0)
-                for _ in range(65536 // bytesize):
-                    buffer = f.read(bytesize)
-                    (l_value,) = struct.unpack(longlongformat, buffer)
-                    hash_value += l_value
-                    hash_value &= 0xFFFFFFFFFFFFFFFF
-                
-                return "%016x" % hash_value
+            st = os.stat(filepath)
+            return _cached_hash(os.path.abspath(filepath), st.st_size, st.st_mtime_ns)
         except Exception as e:
             print(f"Error calculating hash: {e}")
             return None
@@ -122,33 +229,26 @@ class OpenSubtitlesAPI:
         Returns:
             List of subtitle dictionaries with metadata
         """
-        params = {}
-        
         # Calculate hash if video path provided
         if video_path and not video_hash:
             video_hash = self.calculate_video_hash(video_path)
         
-        if video_hash:
-            params['moviehash'] = video_hash
-            
-        if query:
-            params['query'] = query
-            
-        if languages:
-            params['languages'] = ','.join(languages)
-        else:
-            params['languages'] = 'en'
-            
-        if imdb_id:
-            params['imdb_id'] = imdb_id
+        candidates = (
+            ('moviehash', video_hash),
+            ('query', query),
+            ('languages', ','.join(languages) if languages else 'en'),
+            ('imdb_id', imdb_id),
+        )
+        params = {key: value for key, value in candidates if value}
         
         try:
             response = self.session.get(
-                f"{self.BASE_URL}/subtitles",
-                params=params
+                self._URL_SEARCH,
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse(response)
             return data.get('data', [])
         except Exception as e:
             print(f"Error searching subtitles: {e}")
@@ -168,24 +268,24 @@ class OpenSubtitlesAPI:
         try:
             # Get download link
             response = self.session.post(
-                f"{self.BASE_URL}/download",
-                json={'file_id': file_id}
+                self._URL_DOWNLOAD,
+                json={'file_id': file_id},
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = _parse(response)
             
             download_link = data.get('link')
             if not download_link:
                 print("No download link received")
                 return False
             
-            # Download the file
-            sub_response = self.session.get(download_link)
-            sub_response.raise_for_status()
-            
-            # Save to file
-            with open(output_path, 'wb') as f:
-                f.write(sub_response.content)
+            # Stream the file to disk instead of buffering it in memory
+            with self.session.get(download_link, stream=True, timeout=REQUEST_TIMEOUT) as sub_response:
+                sub_response.raise_for_status()
+                with open(output_path, 'wb') as f:
+                    for chunk in sub_response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             
             print(f"Subtitle downloaded successfully to {output_path}")
             return True
@@ -204,20 +304,18 @@ class OpenSubtitlesAPI:
         Returns:
             Dictionary grouped by format (srt, ass, vtt, etc.)
         """
-        formats = {}
+        formats = defaultdict(list)
         for sub in subtitles:
-            fmt = sub.get('attributes', {}).get('format', 'unknown')
-            if fmt not in formats:
-                formats[fmt] = []
-            formats[fmt].append(sub)
-        return formats
+            attributes = sub.get('attributes') or {}
+            formats[attributes.get('format', 'unknown')].append(sub)
+        return dict(formats)
     
     def get_user_info(self) -> Optional[Dict]:
         """Get information about the logged-in user"""
         try:
-            response = self.session.get(f"{self.BASE_URL}/infos/user")
+            response = self.session.get(self._URL_USER, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return _parse(response)
         except Exception as e:
             print(f"Error getting user info: {e}")
             return None
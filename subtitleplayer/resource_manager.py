@@ -5,16 +5,47 @@ Dynamically detects and allocates hardware resources for optimal performance
 
 import os
 import sys
+import json
 import platform
 import subprocess
+import time
 import psutil
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from bisect import bisect, bisect_left
+from typing import Callable, Optional, Dict, List, Tuple
 from pathlib import Path
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Detected hardware is reused until the next boot; bump the version when the
+# SystemResources/GPUInfo fields change
+RESOURCE_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "subtitleplayer" / "resources.json"
+)
+RESOURCE_CACHE_VERSION = 1
+# Back-to-back get_current_resources() calls within this window reuse the last reading
+RESOURCE_REFRESH_TTL = 0.25
+# Memory thresholds (MB) the config builders branch on; crossing one invalidates them
+_RAM_TIERS = (2000, 4000, 8000)
+_GPU_MEMORY_TIERS = (2000, 5000, 10000)
+
+
+@lru_cache(maxsize=1)
+def _maybe_torch():
+    """Import torch once for GPU probing; None if missing or SUBTITLER_NO_GPU is set."""
+    if os.environ.get("SUBTITLER_NO_GPU"):
+        logger.info("SUBTITLER_NO_GPU set - skipping GPU detection")
+        return None
+    try:
+        import torch
+    except ImportError:
+        logger.debug("PyTorch not available for GPU detection")
+        return None
+    return torch
+
 
 @dataclass
 class GPUInfo:
@@ -51,35 +82,100 @@ class SystemResources:
     optimal_workers: int = 1
     optimal_batch_size: int = 1
     use_fp16: bool = False
+    use_bf16: bool = False
     use_gpu: bool = False
 
 
+def _root_is_rotational() -> Optional[bool]:
+    """Read /sys for the block device holding /; None when it cannot be resolved."""
+    try:
+        st_dev = os.stat("/").st_dev
+        if os.major(st_dev) == 0:
+            return None  # Virtual/anonymous device (btrfs subvolume, overlayfs, ...)
+        device = Path(os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}"))
+        # Partitions have no queue/ of their own; the parent disk does
+        for candidate in (device, device.parent):
+            flag = candidate / "queue" / "rotational"
+            if flag.exists():
+                return flag.read_text().strip() == "1"
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+@lru_cache(maxsize=1)
+def _cpu_has_vnni() -> bool:
+    """True if the CPU has AVX-512 VNNI or AVX-VNNI (fast int8 dot products)."""
+    flags: List[str] = []
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    flags = line.split(":", 1)[1].split()
+                    break
+    except OSError:
+        try:
+            import cpuinfo  # py-cpuinfo, optional
+            flags = cpuinfo.get_cpu_info().get("flags", [])
+        except Exception:
+            return False
+    return "avx512_vnni" in flags or "avx_vnni" in flags
+
+
 class ResourceManager:
     """Manages hardware resource detection and allocation"""
     
-    def __init__(self):
-        """Initialize resource manager and detect hardware"""
-        self.resources = SystemResources()
-        self.resources.gpu = GPUInfo()
-        self._detect_all_resources()
+    def __init__(self, resources: Optional[SystemResources] = None):
+        """
+        Initialize resource manager and detect hardware
+        
+        Args:
+            resources: Previously detected resources to reuse; only RAM is re-read
+        """
+        self._last_refresh = 0.0
+        # Built configs are reused until a refresh moves memory across a tier
+        self._config_generation = 0
+        self._config_cache: Dict[str, Tuple[int, Dict]] = {}
+        if resources is not None:
+            self.resources = resources
+            self._detect_ram()
+        else:
+            self.resources = SystemResources()
+            self.resources.gpu = GPUInfo()
+            self._detect_all_resources()
         self._calculate_optimal_settings()
+        self._memory_tier = self._current_memory_tier()
         self._log_system_info()
     
     def _detect_all_resources(self):
         """Detect all available hardware resources"""
-        self._detect_cpu()
-        self._detect_ram()
+        # One psutil snapshot feeds every detector
+        try:
+            cpu_physical = psutil.cpu_count(logical=False)
+            cpu_logical = psutil.cpu_count(logical=True)
+            cpu_freq = psutil.cpu_freq()
+        except Exception as e:
+            logger.warning(f"Error detecting CPU: {e}")
+            cpu_physical = cpu_logical = cpu_freq = None
+        try:
+            mem = psutil.virtual_memory()
+        except Exception as e:
+            logger.warning(f"Error detecting RAM: {e}")
+            mem = None
+
+        self._detect_cpu(cpu_physical, cpu_logical, cpu_freq)
+        if mem is not None:
+            self._detect_ram(mem)
         self._detect_storage()
         self._detect_gpu()
     
-    def _detect_cpu(self):
+    def _detect_cpu(self, cpu_physical: Optional[int], cpu_logical: Optional[int], cpu_freq=None):
         """Detect CPU information"""
         try:
-            self.resources.cpu_count_physical = psutil.cpu_count(logical=False) or 1
-            self.resources.cpu_count_logical = psutil.cpu_count(logical=True) or 1
+            self.resources.cpu_count_physical = cpu_physical or 1
+            self.resources.cpu_count_logical = cpu_logical or 1
             
             # Get CPU frequency
-            cpu_freq = psutil.cpu_freq()
             if cpu_freq:
                 self.resources.cpu_freq_max = cpu_freq.max or cpu_freq.current or 0.0
             
@@ -88,10 +184,11 @@ class ResourceManager:
         except Exception as e:
             logger.warning(f"Error detecting CPU: {e}")
     
-    def _detect_ram(self):
-        """Detect RAM information"""
+    def _detect_ram(self, mem=None):
+        """Detect RAM information (from *mem* when a snapshot is already at hand)"""
         try:
-            mem = psutil.virtual_memory()
+            if mem is None:
+                mem = psutil.virtual_memory()
             self.resources.ram_total = mem.total // (1024 * 1024)  # Convert to MB
             self.resources.ram_available = mem.available // (1024 * 1024)
             self.resources.ram_percent_used = mem.percent
@@ -106,8 +203,14 @@ class ResourceManager:
         try:
             system = platform.system()
             
-            if system == "Linux":
-                # Check if root partition is on SSD
+            rotational = _root_is_rotational() if system == "Linux" else None
+            if rotational is not None:
+                # sysfs answered for the root filesystem's device; no lsblk needed
+                self.resources.has_ssd = not rotational
+                self.resources.storage_type = "HDD" if rotational else "SSD"
+            
+            elif system == "Linux":
+                # Check if any disk is an SSD
                 result = subprocess.run(
                     ["lsblk", "-d", "-o", "name,rota"],
                     capture_output=True,
@@ -172,9 +275,10 @@ class ResourceManager:
     
     def _detect_cuda(self) -> bool:
         """Detect NVIDIA CUDA GPU"""
+        torch = _maybe_torch()
+        if torch is None:
+            return False
         try:
-            import torch
-            
             if torch.cuda.is_available():
                 self.resources.gpu.available = True
                 self.resources.gpu.backend = "cuda"
@@ -195,8 +299,6 @@ class ResourceManager:
                 logger.info(f"Compute Capability: {self.resources.gpu.compute_capability}")
                 
                 return True
-        except ImportError:
-            logger.debug("PyTorch not available for CUDA detection")
         except Exception as e:
             logger.debug(f"CUDA detection failed: {e}")
         
@@ -204,9 +306,10 @@ class ResourceManager:
     
     def _detect_rocm(self) -> bool:
         """Detect AMD ROCm GPU"""
+        torch = _maybe_torch()
+        if torch is None:
+            return False
         try:
-            import torch
-            
             if hasattr(torch, 'hip') and torch.hip.is_available():
                 self.resources.gpu.available = True
                 self.resources.gpu.backend = "rocm"
@@ -219,7 +322,7 @@ class ResourceManager:
                 logger.info(f"GPU Memory: {self.resources.gpu.memory_total} MB")
                 
                 return True
-        except (ImportError, AttributeError):
+        except AttributeError:
             pass
         except Exception as e:
             logger.debug(f"ROCm detection failed: {e}")
@@ -228,9 +331,10 @@ class ResourceManager:
     
     def _detect_mps(self) -> bool:
         """Detect Apple Metal Performance Shaders (Apple Silicon)"""
+        torch = _maybe_torch()
+        if torch is None:
+            return False
         try:
-            import torch
-            
             if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
                 self.resources.gpu.available = True
                 self.resources.gpu.backend = "mps"
@@ -239,7 +343,7 @@ class ResourceManager:
                 logger.info(f"GPU: {self.resources.gpu.name} (MPS)")
                 
                 return True
-        except (ImportError, AttributeError):
+        except AttributeError:
             pass
         except Exception as e:
             logger.debug(f"MPS detection failed: {e}")
@@ -251,15 +355,13 @@ class ResourceManager:
         # Determine if we can use GPU
         self.resources.use_gpu = self.resources.gpu.available
         
-        # FP16 support (NVIDIA with compute capability >= 7.0, or RTX series)
-        if self.resources.gpu.backend == "cuda":
-            if self.resources.gpu.compute_capability:
-                major, minor = self.resources.gpu.compute_capability
-                # RTX cards (Turing and newer) have compute capability >= 7.5
-                self.resources.use_fp16 = (major >= 7 and minor >= 5) or major >= 8
-            # Also check GPU name for RTX
-            if "RTX" in self.resources.gpu.name.upper():
-                self.resources.use_fp16 = True
+        # FP16 Tensor Cores from Volta (7.0) on, BF16 from Ampere (8.0) on
+        self.resources.use_fp16 = False
+        self.resources.use_bf16 = False
+        if self.resources.gpu.backend == "cuda" and self.resources.gpu.compute_capability:
+            major, _minor = self.resources.gpu.compute_capability
+            self.resources.use_fp16 = major >= 7
+            self.resources.use_bf16 = major >= 8
         
         # Calculate optimal worker count
         # Use physical cores - 1 for workers, keep 1 for main thread
@@ -291,6 +393,7 @@ class ResourceManager:
             logger.info(f"GPU: {self.resources.gpu.name} ({self.resources.gpu.backend})")
             logger.info(f"GPU Memory: {self.resources.gpu.memory_total} MB")
             logger.info(f"FP16 Support: {'Yes' if self.resources.use_fp16 else 'No'}")
+            logger.info(f"BF16 Support: {'Yes' if self.resources.use_bf16 else 'No'}")
         else:
             logger.info("GPU: None detected")
         
@@ -303,12 +406,47 @@ class ResourceManager:
         logger.info(f"Optimal Batch Size: {self.resources.optimal_batch_size}")
         logger.info("=" * 60)
     
+    def _current_memory_tier(self) -> Tuple[int, int, int]:
+        ram = self.resources.ram_available
+        # RAM is compared with both ">" and "<" by the builders, so track both edges
+        return (
+            bisect(_RAM_TIERS, ram),
+            bisect_left(_RAM_TIERS, ram),
+            bisect(_GPU_MEMORY_TIERS, self.resources.gpu.memory_available),
+        )
+    
+    def _memoized(self, name: str, build: Callable[[], Dict]) -> Dict:
+        """Return the cached config *name*, rebuilding it if the generation moved on."""
+        cached = self._config_cache.get(name)
+        if cached is not None and cached[0] == self._config_generation:
+            return cached[1]
+        config = build()
+        self._config_cache[name] = (self._config_generation, config)
+        return config
+    
+    def invalidate_cache(self) -> None:
+        """Drop memoized configs so the next get_*_config() call rebuilds them"""
+        self._config_generation += 1
+        self._config_cache.clear()
+    
     def get_whisper_config(self) -> Dict:
         """Get optimal configuration for Whisper AI"""
+        return self._memoized("whisper", self._build_whisper_config)
+    
+    def get_translation_config(self) -> Dict:
+        """Get optimal configuration for translation"""
+        return self._memoized("translation", self._build_translation_config)
+    
+    def get_ffmpeg_config(self) -> Dict:
+        """Get optimal FFmpeg encoding configuration"""
+        return self._memoized("ffmpeg", self._build_ffmpeg_config)
+    
+    def _build_whisper_config(self) -> Dict:
         config = {
             "device": self.resources.gpu.backend if self.resources.use_gpu else "cpu",
             "fp16": self.resources.use_fp16 and self.resources.use_gpu,
-            "compute_type": "float16" if (self.resources.use_fp16 and self.resources.use_gpu) else "float32",
+            "compute_type": self._whisper_compute_type(),
+            "model_size": self.get_recommended_model_size(),
             # Faster decoding strategies for GPU
             "beam_size": 5 if self.resources.use_gpu else 1,
             "best_of": 5 if self.resources.use_gpu else 1,
@@ -322,8 +460,19 @@ class ResourceManager:
         
         return config
     
-    def get_translation_config(self) -> Dict:
-        """Get optimal configuration for translation"""
+    def _whisper_compute_type(self) -> str:
+        """Narrowest Whisper compute type the hardware runs natively."""
+        gpu = self.resources.gpu
+        if self.resources.use_gpu:
+            if gpu.backend == "cuda" and gpu.compute_capability:
+                if tuple(gpu.compute_capability) >= (7, 0):  # Tensor Cores: int8 weights, fp16 math
+                    return "int8_float16"
+                if tuple(gpu.compute_capability) >= (6, 1):  # DP4A int8 instructions
+                    return "int8"
+            return "float16" if self.resources.use_fp16 else "float32"
+        return "int8" if _cpu_has_vnni() else "float32"
+    
+    def _build_translation_config(self) -> Dict:
         # Increase batch sizes significantly with good RAM
         if self.resources.ram_available > 8000:  # > 8GB available
             batch_size = 50
@@ -344,8 +493,7 @@ class ResourceManager:
         
         return config
     
-    def get_ffmpeg_config(self) -> Dict:
-        """Get optimal FFmpeg encoding configuration"""
+    def _build_ffmpeg_config(self) -> Dict:
         config = {
             "threads": self.resources.optimal_workers,
             "preset": "fast" if self.resources.has_ssd else "medium",
@@ -383,6 +531,11 @@ class ResourceManager:
     
     def get_current_resources(self) -> SystemResources:
         """Get current resource snapshot (updated RAM)"""
+        now = time.monotonic()
+        if now - self._last_refresh < RESOURCE_REFRESH_TTL:
+            return self.resources
+        self._last_refresh = now
+        
         # Update dynamic values
         try:
             mem = psutil.virtual_memory()
@@ -391,14 +544,18 @@ class ResourceManager:
             
             if self.resources.gpu.available and self.resources.gpu.backend == "cuda":
                 try:
-                    import torch
-                    mem_free, _ = torch.cuda.mem_get_info(0)
+                    mem_free, _ = _maybe_torch().cuda.mem_get_info(0)
                     self.resources.gpu.memory_available = mem_free // (1024 * 1024)
                 except:
                     pass
         except Exception as e:
             logger.warning(f"Error updating resources: {e}")
         
+        tier = self._current_memory_tier()
+        if tier != self._memory_tier:
+            self._memory_tier = tier
+            self._config_generation += 1
+        
         return self.resources
     
     def get_resource_usage_string(self) -> str:
@@ -448,6 +605,44 @@ class ResourceManager:
             return "base"
 
 
+def _resource_cache_key() -> Dict:
+    return {
+        "version": RESOURCE_CACHE_VERSION,
+        "node": platform.node(),
+        "boot_time": int(psutil.boot_time()),  # Sub-second jitter on some platforms
+        "no_gpu": bool(os.environ.get("SUBTITLER_NO_GPU")),
+    }
+
+
+def _load_cached_resources() -> Optional[SystemResources]:
+    """Return resources detected earlier in this boot, or None if the cache is stale."""
+    try:
+        data = json.loads(RESOURCE_CACHE_FILE.read_text(encoding="utf-8"))
+        if data.get("key") != _resource_cache_key():
+            return None
+        fields = dict(data["resources"])
+        gpu = dict(fields.pop("gpu") or {})
+        if gpu.get("compute_capability") is not None:
+            gpu["compute_capability"] = tuple(gpu["compute_capability"])
+        return SystemResources(gpu=GPUInfo(**gpu), **fields)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_resources(resources: SystemResources) -> None:
+    """Persist detected resources atomically; failures only cost a re-detect next launch."""
+    try:
+        RESOURCE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = RESOURCE_CACHE_FILE.with_suffix(".json.tmp")
+        tmp_path.write_text(
+            json.dumps({"key": _resource_cache_key(), "resources": asdict(resources)}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, RESOURCE_CACHE_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not cache resources: {e}")
+
+
 # Global instance
 _resource_manager = None
 
@@ -456,5 +651,11 @@ def get_resource_manager() -> ResourceManager:
     """Get global resource manager instance"""
     global _resource_manager
     if _resource_manager is None:
-        _resource_manager = ResourceManager()
+        cached = _load_cached_resources()
+        if cached is not None:
+            logger.info(f"Using cached hardware detection from {RESOURCE_CACHE_FILE}")
+            _resource_manager = ResourceManager(resources=cached)
+        else:
+            _resource_manager = ResourceManager()
+            _save_cached_resources(_resource_manager.resources)
     return _resource_manager
@@ -5,9 +5,13 @@ Displays ongoing player statuses within the main status bar.
 
 from __future__ import annotations
 
-from typing import Dict
+import heapq
+import itertools
+import time
+from typing import Dict, List, Tuple
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QSize, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -18,6 +22,59 @@ from PyQt6.QtWidgets import (
 )
 
 
+CHIP_POOL_SIZE = 16
+CHIP_POOL_PREALLOCATE = 4
+
+# Applied once on StatsFooter and inherited by every chip it owns.
+_CHIP_STYLESHEET = """
+    QFrame#StatusChip {
+        background-color: #2a2a2a;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+    }
+    QFrame#StatusChip QLabel {
+        color: #f0f0f0;
+    }
+    QFrame#StatusChip QPushButton,
+    QFrame#StatusChip QToolButton {
+        background-color: #0e639c;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 10px;
+    }
+    QFrame#StatusChip QPushButton:hover,
+    QFrame#StatusChip QToolButton:hover {
+        background-color: #1177bb;
+    }
+    QFrame#StatusChip QToolButton {
+        padding: 0px 6px;
+        min-width: 18px;
+    }
+"""
+
+_CANCEL_ICON: QIcon | None = None
+
+
+def _cancel_icon() -> QIcon:
+    """Return the chip's close cross, painted once per process."""
+    global _CANCEL_ICON
+    if _CANCEL_ICON is None:
+        pixmap = QPixmap(12, 12)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor("#ffffff"))
+        pen.setWidthF(1.6)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        painter.drawLine(2, 2, 10, 10)
+        painter.drawLine(10, 2, 2, 10)
+        painter.end()
+        _CANCEL_ICON = QIcon(pixmap)
+    return _CANCEL_ICON
+
+
 class StatusChip(QFrame):
     """Compact widget representing a single status entry."""
 
@@ -27,34 +84,9 @@ class StatusChip(QFrame):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setObjectName("StatusChip")
-        self.setStyleSheet(
-            """
-            QFrame#StatusChip {
-                background-color: #2a2a2a;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-            }
-            QFrame#StatusChip QLabel {
-                color: #f0f0f0;
-            }
-            QFrame#StatusChip QPushButton,
-            QFrame#StatusChip QToolButton {
-                background-color: #0e639c;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 10px;
-            }
-            QFrame#StatusChip QPushButton:hover,
-            QFrame#StatusChip QToolButton:hover {
-                background-color: #1177bb;
-            }
-            QFrame#StatusChip QToolButton {
-                padding: 0px 6px;
-                min-width: 18px;
-            }
-            """
-        )
+        self.key = ""
+        self._action_visible = False
+        self._cancel_visible = False
 
         layout = QHBoxLayout()
         layout.setContentsMargins(10, 4, 10, 4)
@@ -68,30 +100,37 @@ class StatusChip(QFrame):
         self.action_button = QPushButton("Abrir")
         self.action_button.setVisible(False)
         self.action_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.action_button.clicked.connect(self.action_clicked.emit)
+        self.action_button.clicked.connect(self.action_clicked)
         self.action_button.setFixedHeight(22)
         layout.addWidget(self.action_button)
 
         self.cancel_button = QToolButton()
-        self.cancel_button.setText("✕")
+        self.cancel_button.setIcon(_cancel_icon())
+        self.cancel_button.setIconSize(QSize(10, 10))
         self.cancel_button.setVisible(False)
         self.cancel_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.cancel_button.clicked.connect(self.cancel_clicked.emit)
+        self.cancel_button.clicked.connect(self.cancel_clicked)
         self.cancel_button.setFixedHeight(22)
         layout.addWidget(self.cancel_button)
 
+    def set_key(self, key: str) -> None:
+        self.key = key
+
     def set_text(self, text: str) -> None:
         self.label.setText(text)
 
     def set_action(self, label: str | None) -> None:
-        if label:
+        if label and label != self.action_button.text():
             self.action_button.setText(label)
-            self.action_button.show()
-        else:
-            self.action_button.hide()
+        visible = bool(label)
+        if visible != self._action_visible:
+            self._action_visible = visible
+            self.action_button.setVisible(visible)
 
     def set_cancel_enabled(self, enabled: bool) -> None:
-        self.cancel_button.setVisible(enabled)
+        if enabled != self._cancel_visible:
+            self._cancel_visible = enabled
+            self.cancel_button.setVisible(enabled)
 
 
 class StatsFooter(QWidget):
@@ -102,14 +141,24 @@ class StatsFooter(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self.setStyleSheet(_CHIP_STYLESHEET)
 
         self._chips: Dict[str, StatusChip] = {}
-        self._clear_timers: Dict[str, QTimer] = {}
+        # Pending auto-clears share one timer: a heap of (deadline, seq, key)
+        # entries, where only the seq recorded in _clear_seq is still live.
+        self._clear_heap: List[Tuple[float, int, str]] = []
+        self._clear_seq: Dict[str, int] = {}
+        self._clear_counter = itertools.count()
+        self._chip_pool: List[StatusChip] = []
 
         self._message_timer = QTimer(self)
         self._message_timer.setSingleShot(True)
         self._message_timer.timeout.connect(self._on_message_timeout)
 
+        self._clear_timer = QTimer(self)
+        self._clear_timer.setSingleShot(True)
+        self._clear_timer.timeout.connect(self._drain_clears)
+
         layout = QHBoxLayout()
         layout.setContentsMargins(6, 0, 6, 0)
         layout.setSpacing(12)
@@ -133,6 +182,11 @@ class StatsFooter(QWidget):
         self._idle_label.setStyleSheet("color: #b0b0b0;")
         self._chip_layout.addWidget(self._idle_label)
 
+        for _ in range(CHIP_POOL_PREALLOCATE):
+            chip = self._create_chip()
+            chip.hide()
+            self._chip_pool.append(chip)
+
     # ------------------------------------------------------------------
     # Basic status management
     # ------------------------------------------------------------------
@@ -163,61 +217,122 @@ class StatsFooter(QWidget):
         """Add or update a status chip."""
         chip = self._chips.get(key)
         if chip is None:
-            chip = StatusChip(self)
-            chip.action_clicked.connect(lambda key=key: self.action_requested.emit(key))
-            chip.cancel_clicked.connect(lambda key=key: self.cancel_requested.emit(key))
+            chip = self._acquire_chip()
+            chip.set_key(key)
             self._chips[key] = chip
             self._chip_layout.addWidget(chip)
+            chip.show()
             self._idle_label.hide()
 
-        chip.set_text(text)
-        chip.set_action(button_text)
-        chip.set_cancel_enabled(cancelable)
+        chip.setUpdatesEnabled(False)
+        try:
+            chip.set_text(text)
+            chip.set_action(button_text)
+            chip.set_cancel_enabled(cancelable)
+        finally:
+            chip.setUpdatesEnabled(True)
 
-        # Reset any pending auto-clear timers if status changed back to active
-        timer = self._clear_timers.pop(key, None)
-        if timer:
-            timer.stop()
-            timer.deleteLater()
+        # Reset any pending auto-clear if status changed back to active
+        self._clear_seq.pop(key, None)
 
     def clear_status(self, key: str) -> None:
         """Remove a status chip."""
         chip = self._chips.pop(key, None)
         if chip:
-            chip.hide()
-            chip.deleteLater()
+            self._release_chip(chip)
 
-        timer = self._clear_timers.pop(key, None)
-        if timer:
-            timer.stop()
-            timer.deleteLater()
+        self._clear_seq.pop(key, None)
 
         if not self._chips:
             self._idle_label.show()
 
     def clear_all(self) -> None:
-        for key in list(self._chips.keys()):
-            self.clear_status(key)
+        """Remove every status chip in a single layout/paint pass."""
+        if not self._chips:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            for chip in self._chips.values():
+                self._release_chip(chip)
+            self._chips.clear()
+            self._clear_seq.clear()
+            self._clear_heap.clear()
+            self._clear_timer.stop()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._idle_label.show()
 
     def schedule_clear(self, key: str, delay_ms: int) -> None:
         """Schedule a status for automatic removal."""
         if key not in self._chips:
             return
 
-        timer = self._clear_timers.get(key)
-        if timer:
-            timer.stop()
-        else:
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            self._clear_timers[key] = timer
-            timer.timeout.connect(lambda key=key: self.clear_status(key))
-
-        timer.start(delay_ms)
+        seq = next(self._clear_counter)
+        self._clear_seq[key] = seq
+        heapq.heappush(
+            self._clear_heap, (time.monotonic() + delay_ms / 1000.0, seq, key)
+        )
+        self._reschedule_clears()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _acquire_chip(self) -> StatusChip:
+        if self._chip_pool:
+            return self._chip_pool.pop()
+        return self._create_chip()
+
+    def _create_chip(self) -> StatusChip:
+        chip = StatusChip(self._chip_container)
+        chip.action_clicked.connect(self._on_chip_action)
+        chip.cancel_clicked.connect(self._on_chip_cancel)
+        return chip
+
+    def _release_chip(self, chip: StatusChip) -> None:
+        """Detach a chip from its key and return it to the pool."""
+        chip.set_key("")
+        chip.hide()
+        self._chip_layout.removeWidget(chip)
+
+        if len(self._chip_pool) < CHIP_POOL_SIZE:
+            self._chip_pool.append(chip)
+        else:
+            chip.deleteLater()
+
+    def _on_chip_action(self) -> None:
+        chip = self.sender()
+        if isinstance(chip, StatusChip) and chip.key:
+            self.action_requested.emit(chip.key)
+
+    def _on_chip_cancel(self) -> None:
+        chip = self.sender()
+        if isinstance(chip, StatusChip) and chip.key:
+            self.cancel_requested.emit(chip.key)
+
+    def _drain_clears(self) -> None:
+        now = time.monotonic()
+        heap = self._clear_heap
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            if self._clear_seq.get(key) == seq:
+                self.clear_status(key)
+        self._reschedule_clears()
+
+    def _reschedule_clears(self) -> None:
+        """Point the shared timer at the earliest live deadline."""
+        heap = self._clear_heap
+        while heap and self._clear_seq.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+        if not heap:
+            self._clear_timer.stop()
+            return
+
+        delay = max(0.0, heap[0][0] - time.monotonic())
+        self._clear_timer.start(int(delay * 1000) + 1)
+
     def _on_message_timeout(self) -> None:
         self._message_label.clear()
         self._message_label.hide()
\ No newline at end of file
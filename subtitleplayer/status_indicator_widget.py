@@ -49,13 +49,13 @@ class TaskIndicator(QFrame):
         header_layout = QHBoxLayout()
         
         # Task icon and title
-        if self.task_info.task_type == TaskType.AI_GENERATION:
+        if self.task_info.task_type is TaskType.AI_GENERATION:
             icon = "🤖"
             title = "AI Generation"
-        elif self.task_info.task_type == TaskType.TRANSLATION:
+        elif self.task_info.task_type is TaskType.TRANSLATION:
             icon = "🌍"
             title = "Translation"
-        elif self.task_info.task_type == TaskType.PROXY_TRANSCODE:
+        elif self.task_info.task_type is TaskType.PROXY_TRANSCODE:
             icon = "🎬"
             title = "Proxy 1080p"
         else:
@@ -128,7 +128,7 @@ class TaskIndicator(QFrame):
         self.message_label.setText(task_info.message)
         
         # Update style based on status
-        if task_info.status == TaskStatus.COMPLETED:
+        if task_info.status is TaskStatus.COMPLETED:
             self.progress_bar.setStyleSheet("""
                 QProgressBar {
                     border: 1px solid #3d3d3d;
@@ -143,7 +143,7 @@ class TaskIndicator(QFrame):
                 }
             """)
             self.cancel_btn.hide()
-        elif task_info.status == TaskStatus.FAILED:
+        elif task_info.status is TaskStatus.FAILED:
             self.progress_bar.setStyleSheet("""
                 QProgressBar {
                     border: 1px solid #3d3d3d;
@@ -212,8 +212,8 @@ class StatusIndicatorWidget(QWidget):
             return
         
         indicator = TaskIndicator(task_info, self)
-        indicator.clicked.connect(self.task_clicked.emit)
-        indicator.cancel_requested.connect(self.cancel_requested.emit)
+        indicator.clicked.connect(self.task_clicked)
+        indicator.cancel_requested.connect(self.cancel_requested)
         
         self.task_indicators[task_info.task_id] = indicator
         self.main_layout.addWidget(indicator)
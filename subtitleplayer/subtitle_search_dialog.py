@@ -3,60 +3,119 @@ Subtitle Search and Download Dialog
 Search OpenSubtitles.com and download subtitles
 """
 
-import os
+from functools import partial
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QLineEdit, QComboBox, QTableWidget, QTableWidgetItem,
-    QMessageBox, QProgressBar, QGroupBox
+    QMessageBox, QProgressBar, QGroupBox, QHeaderView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QCoreApplication, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+)
+
+from .opensubtitles_api import OpenSubtitlesAPI, to_columnar
+
+
+# Columns whose content is short and bounded get a fixed width instead of
+# being measured cell by cell: Language, Downloads, Rating, Format
+_FIXED_COLUMN_WIDTHS = {0: 90, 2: 90, 3: 70, 4: 70}
+# Release is the only free-text column that is sized to its contents;
+# Uploader is the last section and already stretches
+_CONTENT_SIZED_COLUMNS = (1,)
+
+# (display name, language code) in combo order; "" searches every language
+_LANG_ITEMS = (
+    ("All Languages", ""),
+    ("English", "en"),
+    ("Spanish", "es"),
+    ("Portuguese (Brazil)", "pt-BR"),
+    ("Portuguese", "pt"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Italian", "it"),
+    ("Russian", "ru"),
+    ("Japanese", "ja"),
+    ("Korean", "ko"),
+    ("Chinese (Simplified)", "zh-CN"),
+    ("Arabic", "ar"),
+    ("Dutch", "nl"),
+    ("Polish", "pl"),
+    ("Turkish", "tr"),
+)
+
+# Results without a format attribute are saved as SubRip
+_DEFAULT_SUBTITLE_FORMAT = 'srt'
+
+# (to_columnar field, placeholder when missing) for each table column in order
+_TABLE_COLUMNS = (
+    ('language', 'Unknown'),
+    ('release', 'N/A'),
+    ('download_count', 0),
+    ('ratings', 0),
+    ('format', _DEFAULT_SUBTITLE_FORMAT),
+    ('uploader', 'Unknown'),
+)
+
+
+# How long application shutdown waits for a worker thread still finishing a
+# request after its dialog closed
+WORKER_EXIT_TIMEOUT_MS = 5000
 
-from .opensubtitles_api import OpenSubtitlesAPI
+# Worker threads that have not finished yet; joined when the application quits
+_live_worker_threads = set()
+_exit_hook_connected = False
 
 
-class SubtitleSearchThread(QThread):
-    """Background thread for searching subtitles"""
+def _join_worker_threads():
+    """Stop every outstanding worker thread before the application is torn down"""
+    for thread in list(_live_worker_threads):
+        thread.quit()
+        if not thread.wait(WORKER_EXIT_TIMEOUT_MS):
+            print("Warning: subtitle worker thread still busy at exit")
+
+
+def _track_worker_thread(thread):
+    """Register *thread* so application shutdown waits for it"""
+    global _exit_hook_connected
+    if not _exit_hook_connected:
+        QCoreApplication.instance().aboutToQuit.connect(_join_worker_threads)
+        _exit_hook_connected = True
+    _live_worker_threads.add(thread)
+    thread.finished.connect(partial(_live_worker_threads.discard, thread))
+
+
+def _basename(path):
+    """File name of a path for display, whichever separator it uses"""
+    return path.replace('\\', '/').rpartition('/')[2]
+
+
+class SubtitleWorker(QObject):
+    """Runs API calls on the dialog's long-lived background thread"""
     
-    results_ready = pyqtSignal(list)
+    results_ready = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
+    download_complete = pyqtSignal(bool, str)
     
-    def __init__(self, api_client, video_path, query, language):
-        super().__init__()
-        self.api_client = api_client
-        self.video_path = video_path
-        self.query = query
-        self.language = language
-    
-    def run(self):
+    @pyqtSlot(object, object, object, object)
+    def search(self, api_client, video_path, query, language):
         """Run subtitle search"""
         try:
-            results = self.api_client.search_subtitles(
-                video_path=self.video_path,
-                query=self.query,
-                languages=[self.language] if self.language else None
+            results = api_client.search_subtitles(
+                video_path=video_path,
+                query=query,
+                languages=[language] if language else None
             )
-            self.results_ready.emit(results)
+            self.results_ready.emit(to_columnar(results))
         except Exception as e:
             self.error_occurred.emit(str(e))
-
-
-class SubtitleDownloadThread(QThread):
-    """Background thread for downloading subtitles"""
     
-    download_complete = pyqtSignal(bool, str)
-    
-    def __init__(self, api_client, file_id, output_path):
-        super().__init__()
-        self.api_client = api_client
-        self.file_id = file_id
-        self.output_path = output_path
-    
-    def run(self):
+    @pyqtSlot(object, object, str)
+    def download(self, api_client, file_id, output_path):
         """Download subtitle"""
         try:
-            success = self.api_client.download_subtitle(self.file_id, self.output_path)
-            self.download_complete.emit(success, self.output_path)
+            success = api_client.download_subtitle(file_id, output_path)
+            self.download_complete.emit(success, output_path)
         except Exception as e:
             self.download_complete.emit(False, str(e))
 
@@ -64,33 +123,42 @@ class SubtitleDownloadThread(QThread):
 class SubtitleSearchDialog(QDialog):
     """Dialog for searching and downloading subtitles"""
     
-    LANGUAGES = {
-        "English": "en",
-        "Spanish": "es",
-        "Portuguese (Brazil)": "pt-BR",
-        "Portuguese": "pt",
-        "French": "fr",
-        "German": "de",
-        "Italian": "it",
-        "Russian": "ru",
-        "Japanese": "ja",
-        "Korean": "ko",
-        "Chinese (Simplified)": "zh-CN",
-        "Arabic": "ar",
-        "Dutch": "nl",
-        "Polish": "pl",
-        "Turkish": "tr"
-    }
+    # Queued over to the worker thread
+    search_requested = pyqtSignal(object, object, object, object)
+    download_requested = pyqtSignal(object, object, str)
+    
+    LANGUAGES = dict(_LANG_ITEMS[1:])
     
     def __init__(self, video_path, parent=None):
         super().__init__(parent)
         self.video_path = video_path
         self.api_client = None
-        self.search_results = []
+        self._file_ids = []
+        self._formats = []
+        self._result_columns = ()
+        self._config_manager = None
         self.selected_subtitle_path = None
         
+        # One worker thread serves every search/download for the dialog's lifetime
+        # Owned by the application rather than the dialog: an in-flight request
+        # may outlive the dialog, and both objects delete themselves once the
+        # thread has finished
+        self._worker_thread = QThread(QCoreApplication.instance())
+        self._worker = SubtitleWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._worker_thread.finished.connect(self._worker_thread.deleteLater)
+        _track_worker_thread(self._worker_thread)
+        self.search_requested.connect(self._worker.search)
+        self.download_requested.connect(self._worker.download)
+        self._worker.results_ready.connect(self.on_search_complete)
+        self._worker.error_occurred.connect(self.on_search_error)
+        self._worker.download_complete.connect(self.on_download_complete)
+        self._worker_thread.start()
+        
         self.init_ui()
-        self.load_api_key()
+        # Read the config after the first paint rather than before it
+        QTimer.singleShot(0, self.load_api_key)
     
     def init_ui(self):
         """Initialize user interface"""
@@ -129,7 +197,7 @@ class SubtitleSearchDialog(QDialog):
         search_layout = QVBoxLayout()
         
         # Video file info
-        video_name = os.path.basename(self.video_path)
+        video_name = _basename(str(self.video_path))
         video_label = QLabel(f"Video: {video_name}")
         search_layout.addWidget(video_label)
         
@@ -146,10 +214,12 @@ class SubtitleSearchDialog(QDialog):
         lang_layout = QHBoxLayout()
         lang_label = QLabel("Language:")
         self.language_combo = QComboBox()
-        self.language_combo.addItem("All Languages", "")
-        for lang_name, lang_code in self.LANGUAGES.items():
-            self.language_combo.addItem(lang_name, lang_code)
+        self.language_combo.blockSignals(True)
+        self.language_combo.addItems([name for name, _ in _LANG_ITEMS])
+        for index, (_, code) in enumerate(_LANG_ITEMS):
+            self.language_combo.setItemData(index, code)
         self.language_combo.setCurrentText("English")
+        self.language_combo.blockSignals(False)
         lang_layout.addWidget(lang_label)
         lang_layout.addWidget(self.language_combo)
         lang_layout.addStretch()
@@ -174,7 +244,11 @@ class SubtitleSearchDialog(QDialog):
         self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.results_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.results_table.horizontalHeader().setStretchLastSection(True)
+        header = self.results_table.horizontalHeader()
+        header.setStretchLastSection(True)
+        for col, width in _FIXED_COLUMN_WIDTHS.items():
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+            self.results_table.setColumnWidth(col, width)
         layout.addWidget(self.results_table)
         
         # Progress bar
@@ -201,8 +275,13 @@ class SubtitleSearchDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Enable download button when row selected
-        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        # Enable download button when row selected; a row selection emits
+        # once per cell, so coalesce them into one check per event-loop pass
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self.on_selection_changed)
+        self.results_table.itemSelectionChanged.connect(self._selection_timer.start)
         
         self.apply_style()
     
@@ -276,17 +355,26 @@ class SubtitleSearchDialog(QDialog):
             }
         """)
     
+    def _get_config_manager(self):
+        """Return the dialog's ConfigManager, loading it on first use"""
+        if self._config_manager is None:
+            # Share the player's instance: no extra disk read, and its own
+            # later save_config() calls keep the key saved here
+            self._config_manager = getattr(self.parent(), 'config_manager', None)
+        if self._config_manager is None:
+            from .config_manager import ConfigManager
+            self._config_manager = ConfigManager()
+        return self._config_manager
+    
     def load_api_key(self):
         """Load saved API key"""
-        from .config_manager import ConfigManager
-        config_manager = ConfigManager()
-        if config_manager.config.api_key:
+        config_manager = self._get_config_manager()
+        if config_manager.config.api_key and not self.api_key_input.text():
             self.api_key_input.setText(config_manager.config.api_key)
     
     def save_api_key(self):
         """Save API key"""
-        from .config_manager import ConfigManager
-        config_manager = ConfigManager()
+        config_manager = self._get_config_manager()
         config_manager.config.api_key = self.api_key_input.text()
         config_manager.save_config()
     
@@ -317,73 +405,86 @@ class SubtitleSearchDialog(QDialog):
         self.progress_bar.setRange(0, 0)  # Indeterminate
         self.status_label.setText("Searching...")
         self.search_btn.setEnabled(False)
-        self.results_table.setRowCount(0)
+        # Previous rows stay in place (greyed out) so their items can be
+        # refilled instead of reallocated when the results arrive
+        self.results_table.clearSelection()
+        self.results_table.setEnabled(False)
+        self.download_btn.setEnabled(False)
         
-        # Start search thread
-        self.search_thread = SubtitleSearchThread(
+        # Hand the search to the worker thread
+        self.search_requested.emit(
             self.api_client,
             self.video_path,
             query if query else None,
             language if language else None
         )
-        self.search_thread.results_ready.connect(self.on_search_complete)
-        self.search_thread.error_occurred.connect(self.on_search_error)
-        self.search_thread.start()
     
-    def on_search_complete(self, results):
+    def on_search_complete(self, columns):
         """Handle search completion"""
         self.progress_bar.setVisible(False)
         self.search_btn.setEnabled(True)
-        self.search_results = results
-        
-        if not results:
+        self.results_table.setEnabled(True)
+        self._file_ids = columns['file_id']
+        self._formats = [fmt or _DEFAULT_SUBTITLE_FORMAT for fmt in columns['format']]
+        row_count = len(self._file_ids)
+        
+        if not row_count:
+            self._result_columns = ()
+            self.results_table.setRowCount(0)
             self.status_label.setText("No subtitles found")
             return
         
-        self.status_label.setText(f"Found {len(results)} subtitle(s)")
-        
-        # Populate table
-        self.results_table.setRowCount(len(results))
-        
-        for i, result in enumerate(results):
-            attrs = result.get('attributes', {})
-            
-            # Language
-            language = attrs.get('language', 'Unknown')
-            self.results_table.setItem(i, 0, QTableWidgetItem(language))
-            
-            # Release
-            release = attrs.get('release', 'N/A')
-            self.results_table.setItem(i, 1, QTableWidgetItem(release))
-            
-            # Downloads
-            downloads = str(attrs.get('download_count', 0))
-            self.results_table.setItem(i, 2, QTableWidgetItem(downloads))
-            
-            # Rating
-            rating = str(attrs.get('ratings', 0))
-            self.results_table.setItem(i, 3, QTableWidgetItem(rating))
-            
-            # Format
-            fmt = attrs.get('format', 'N/A')
-            self.results_table.setItem(i, 4, QTableWidgetItem(fmt))
-            
-            # Uploader
-            uploader = attrs.get('uploader', {}).get('name', 'Unknown')
-            self.results_table.setItem(i, 5, QTableWidgetItem(uploader))
-        
-        self.results_table.resizeColumnsToContents()
+        self.status_label.setText(f"Found {row_count} subtitle(s)")
+        
+        # One tuple of display strings per table column
+        self._result_columns = tuple(
+            tuple(str(default if value is None else value) for value in columns[name])
+            for name, default in _TABLE_COLUMNS
+        )
+        
+        # Populate table with repaints, sorting and signals held off
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            # Shrinking frees surplus items; rows that survive keep theirs
+            table.setRowCount(row_count)
+
+            for col, values in enumerate(self._result_columns):
+                for row, value in enumerate(values):
+                    item = table.item(row, col)
+                    if item is None:
+                        table.setItem(row, col, QTableWidgetItem(value))
+                    else:
+                        item.setText(value)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+
+        for col in _CONTENT_SIZED_COLUMNS:
+            table.resizeColumnToContents(col)
     
     def on_search_error(self, error):
         """Handle search error"""
         self.progress_bar.setVisible(False)
         self.search_btn.setEnabled(True)
+        self._file_ids = []
+        self._formats = []
+        self._result_columns = ()
+        self.results_table.setRowCount(0)
+        self.results_table.setEnabled(True)
         self.status_label.setText(f"Error: {error}")
         QMessageBox.critical(self, "Search Error", f"Failed to search subtitles:\n{error}")
     
     def on_selection_changed(self):
         """Handle table selection change"""
-        self.download_btn.setEnabled(len(self.results_table.selectedItems()) > 0)
+        self.download_btn.setEnabled(
+            self.results_table.isEnabled()
+            and self.results_table.selectionModel().hasSelection()
+        )
     
     def download_subtitle(self):
         """Download selected subtitle"""
@@ -391,9 +492,10 @@ class SubtitleSearchDialog(QDialog):
         if selected_row < 0:
             return
         
-        # Get file_id from result
-        result = self.search_results[selected_row]
-        file_id = result.get('attributes', {}).get('files', [{}])[0].get('file_id')
+        if selected_row >= len(self._file_ids):
+            return
+        
+        file_id = self._file_ids[selected_row]
         
         if not file_id:
             QMessageBox.warning(self, "Error", "Could not get subtitle file ID")
@@ -401,8 +503,7 @@ class SubtitleSearchDialog(QDialog):
         
         # Determine output path
         video_path = Path(self.video_path)
-        subtitle_format = result.get('attributes', {}).get('format', 'srt')
-        output_path = video_path.with_suffix(f'.{subtitle_format}')
+        output_path = video_path.with_suffix(f'.{self._formats[selected_row]}')
         
         # Check if file exists
         if output_path.exists():
@@ -421,14 +522,8 @@ class SubtitleSearchDialog(QDialog):
         self.status_label.setText("Downloading...")
         self.download_btn.setEnabled(False)
         
-        # Start download thread
-        self.download_thread = SubtitleDownloadThread(
-            self.api_client,
-            file_id,
-            str(output_path)
-        )
-        self.download_thread.download_complete.connect(self.on_download_complete)
-        self.download_thread.start()
+        # Hand the download to the worker thread
+        self.download_requested.emit(self.api_client, file_id, str(output_path))
     
     def on_download_complete(self, success, path_or_error):
         """Handle download completion"""
@@ -437,11 +532,12 @@ class SubtitleSearchDialog(QDialog):
         
         if success:
             self.selected_subtitle_path = path_or_error
-            self.status_label.setText(f"Downloaded successfully: {os.path.basename(path_or_error)}")
+            file_name = _basename(path_or_error)
+            self.status_label.setText(f"Downloaded successfully: {file_name}")
             QMessageBox.information(
                 self,
                 "Download Complete",
-                f"Subtitle downloaded successfully:\n{os.path.basename(path_or_error)}"
+                f"Subtitle downloaded successfully:\n{file_name}"
             )
             self.accept()
         else:
@@ -452,6 +548,11 @@ class SubtitleSearchDialog(QDialog):
                 f"Failed to download subtitle:\n{path_or_error}"
             )
     
+    def done(self, result):
+        """Stop the worker thread once the dialog closes, without waiting on it"""
+        self._worker_thread.quit()
+        super().done(result)
+    
     def get_selected_subtitle_path(self):
         """Get path to downloaded subtitle"""
         return self.selected_subtitle_path
@@ -3,25 +3,341 @@ Professional Sidebar for Subtitle Settings
 Allows real-time subtitle customization while watching video
 """
 
+from dataclasses import astuple, fields
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QSpinBox,
     QComboBox, QCheckBox, QPushButton, QColorDialog, QScrollArea,
-    QFrame, QGroupBox, QSizePolicy, QDoubleSpinBox, QFontComboBox, QToolButton
+    QFrame, QGroupBox, QSizePolicy, QDoubleSpinBox, QFontComboBox, QToolButton,
+    QLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QTimer
+from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPen, QPixmap
 from .config_manager import SubtitleStyle
 
 
+# Quiet period before a burst of slider/spinbox changes is emitted
+SETTINGS_EMIT_DELAY_MS = 50
+
+_SIDEBAR_QSS = """
+    QWidget {
+        background-color: #101010;
+        color: #e0e0e0;
+        font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
+        font-size: 13px;
+    }
+
+    QScrollArea {
+        border: none;
+        background: #101010;
+    }
+
+    QFrame#HeaderFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1a1a1a, stop:1 #101010);
+        border-radius: 8px;
+        padding: 10px;
+    }
+
+    QGroupBox {
+        background: #1a1a1a;
+        border: 1px solid #2a2a2a;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 16px;
+        font-weight: bold;
+        color: #ffffff;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 4px 12px;
+        background: #101010;
+        border-radius: 4px;
+        left: 10px;
+        color: #4a9eff;
+    }
+
+    QLabel {
+        color: #d0d0d0;
+        background: transparent;
+    }
+
+    QLabel#SidebarTitle {
+        color: #ffffff;
+    }
+
+    QLabel#SidebarDesc {
+        color: #888888;
+        font-size: 12px;
+    }
+
+    QLabel#FieldLabel {
+        color: #b0b0b0;
+        font-size: 12px;
+        font-weight: 500;
+    }
+
+    QLabel#ColorValue {
+        color: #888888;
+        font-size: 11px;
+        font-family: monospace;
+    }
+
+    QLabel#TimingHint {
+        color: #666666;
+        font-size: 11px;
+        font-style: italic;
+    }
+
+    QComboBox, QFontComboBox {
+        background: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #3a3a3a;
+        border-radius: 5px;
+        padding: 6px 10px;
+        min-height: 25px;
+    }
+
+    QComboBox:hover, QFontComboBox:hover {
+        border: 1px solid #4a9eff;
+        background: #323232;
+    }
+
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid #888888;
+        width: 0;
+        height: 0;
+        margin-right: 8px;
+    }
+
+    QSpinBox, QDoubleSpinBox {
+        background: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #3a3a3a;
+        border-radius: 5px;
+        padding: 5px 8px;
+        min-height: 25px;
+    }
+
+    QSpinBox:hover, QDoubleSpinBox:hover {
+        border: 1px solid #4a9eff;
+        background: #323232;
+    }
+
+    QSpinBox::up-button, QDoubleSpinBox::up-button,
+    QSpinBox::down-button, QDoubleSpinBox::down-button {
+        background: #3a3a3a;
+        border: none;
+        width: 18px;
+        border-radius: 3px;
+    }
+
+    QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
+    QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
+        background: #4a9eff;
+    }
+
+    QSlider::groove:horizontal {
+        border: none;
+        height: 6px;
+        background: #2a2a2a;
+        border-radius: 3px;
+    }
+
+    QSlider::handle:horizontal {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #5aa0ff, stop:1 #3a80ff);
+        border: 2px solid #2a5a9f;
+        width: 16px;
+        height: 16px;
+        margin: -6px 0;
+        border-radius: 9px;
+    }
+
+    QSlider::handle:horizontal:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #6ab0ff, stop:1 #4a90ff);
+        border: 2px solid #3a6aaf;
+    }
+
+    QSlider::sub-page:horizontal {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4a9eff, stop:1 #2a7edf);
+        border-radius: 3px;
+    }
+
+    QCheckBox {
+        color: #d0d0d0;
+        spacing: 8px;
+    }
+
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #3a3a3a;
+        border-radius: 4px;
+        background: #2a2a2a;
+    }
+
+    QCheckBox::indicator:hover {
+        border: 2px solid #4a9eff;
+        background: #323232;
+    }
+
+    QCheckBox::indicator:checked {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #4a9eff, stop:1 #2a7edf);
+        border: 2px solid #2a6acf;
+    }
+
+    QCheckBox::indicator:checked:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5aa0ff, stop:1 #3a80ff);
+    }
+
+    QPushButton#ColorButton {
+        border: 2px solid #3a3a3a;
+        border-radius: 5px;
+        min-width: 50px;
+        min-height: 28px;
+    }
+
+    QPushButton#ColorButton:hover {
+        border: 2px solid #4a9eff;
+    }
+
+    QToolButton#LegacyToggleButton {
+        background: rgba(74, 158, 255, 0.15);
+        color: #9ec0ff;
+        border: 1px solid #3a6aaf;
+        border-radius: 5px;
+        padding: 6px 12px;
+        font-size: 16px;
+        font-weight: normal;
+    }
+
+    QToolButton#LegacyToggleButton:hover {
+        background: rgba(74, 158, 255, 0.25);
+        border: 1px solid #4a9eff;
+    }
+
+    QScrollBar:vertical {
+        background: #1a1a1a;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0;
+    }
+
+    QScrollBar::handle:vertical {
+        background: #3a3a3a;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+
+    QScrollBar::handle:vertical:hover {
+        background: #4a4a4a;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+"""
+
+
+_LEGACY_ICON = None
+
+
+def _legacy_icon():
+    """Swap arrows for the legacy dialog button, painted once per process"""
+    global _LEGACY_ICON
+    if _LEGACY_ICON is None:
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pen = QPen(QColor("#9ec0ff"))
+        pen.setWidthF(1.5)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        # Right-pointing arrow on top, left-pointing arrow below
+        painter.drawLine(2, 5, 14, 5)
+        painter.drawLine(14, 5, 11, 2)
+        painter.drawLine(14, 5, 11, 8)
+        painter.drawLine(2, 11, 14, 11)
+        painter.drawLine(2, 11, 5, 8)
+        painter.drawLine(2, 11, 5, 14)
+        painter.end()
+        _LEGACY_ICON = QIcon(pixmap)
+    return _LEGACY_ICON
+
+
+def _hbox(*items, spacing=None):
+    """Build a horizontal row in one call
+    
+    Items are widgets or layouts; a (widget, stretch) tuple sets a stretch
+    factor and None adds a stretch.
+    """
+    row = QHBoxLayout()
+    if spacing is not None:
+        row.setSpacing(spacing)
+    for item in items:
+        if item is None:
+            row.addStretch()
+        elif isinstance(item, tuple):
+            row.addWidget(*item)
+        elif isinstance(item, QLayout):
+            row.addLayout(item)
+        else:
+            row.addWidget(item)
+    return row
+
+
 class SubtitleSettingsSidebar(QWidget):
     """Professional sidebar for subtitle settings"""
     
     settings_changed = pyqtSignal(object)  # Emits SubtitleStyle
+    # (field name, new value) for each field that changed; sent just before
+    # the matching settings_changed so receivers can skip unaffected work
+    settings_field_changed = pyqtSignal(str, object)
     toggle_legacy = pyqtSignal()
     
+    # Combo index <-> SubtitleStyle position value
+    _POS_V = ("top", "center", "bottom")
+    _POS_H = ("left", "center", "right")
+    _POS_V_IDX = {value: index for index, value in enumerate(_POS_V)}
+    _POS_H_IDX = {value: index for index, value in enumerate(_POS_H)}
+    
     def __init__(self, style: SubtitleStyle, parent=None):
         super().__init__(parent)
         self.style = style
+        # Field values as of the last settings_changed emit
+        self._emitted_state = astuple(style)
+        # Swatch icons keyed by (colour, width, height)
+        self._color_icon_cache = {}
+        # Built on the first colour pick and reused afterwards
+        self._color_dialog = None
+        
+        # Every emit goes through this timer, so the renderer runs from the
+        # event loop rather than inside the input handler. Continuous controls
+        # restart it with a delay; only the last value of a burst is emitted
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._emit_settings_changed)
+        
         self.setMaximumWidth(480)
         self.setMinimumWidth(260)
         self.setSizePolicy(
@@ -39,7 +355,6 @@ class SubtitleSettingsSidebar(QWidget):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setStyleSheet("QScrollArea { border: none; background: #101010; }")
 
         content = QWidget()
         layout = QVBoxLayout()
@@ -68,30 +383,58 @@ class SubtitleSettingsSidebar(QWidget):
         title_font.setBold(True)
         title_font.setFamily("Segoe UI, Arial, sans-serif")
         title.setFont(title_font)
-        title.setStyleSheet("color: #ffffff; background: transparent;")
+        title.setObjectName("SidebarTitle")
         
         title_layout.addWidget(title)
         title_layout.addStretch()
         
         # Legacy toggle button
         self.legacy_toggle_btn = QToolButton()
-        self.legacy_toggle_btn.setText("⇄")
+        self.legacy_toggle_btn.setIcon(_legacy_icon())
+        self.legacy_toggle_btn.setIconSize(QSize(16, 16))
         self.legacy_toggle_btn.setToolTip("Switch to Legacy Dialog")
         self.legacy_toggle_btn.setObjectName("LegacyToggleButton")
-        self.legacy_toggle_btn.clicked.connect(lambda: self.toggle_legacy.emit())
+        self.legacy_toggle_btn.clicked.connect(self.toggle_legacy)
         title_layout.addWidget(self.legacy_toggle_btn)
         
         header_layout.addLayout(title_layout)
         
         # Subtitle description
         desc = QLabel("Customize subtitle appearance and timing in real-time")
-        desc.setStyleSheet("color: #888888; font-size: 12px; background: transparent;")
+        desc.setObjectName("SidebarDesc")
         desc.setWordWrap(True)
         header_layout.addWidget(desc)
         
         layout.addWidget(header_frame)
         
-        # Typography Section
+        # Sections are built on first show; the sidebar starts hidden
+        self._content_layout = layout
+        self._sections_built = False
+        
+        # Apply refined styling
+        self.setStyleSheet(_SIDEBAR_QSS)
+    
+    def showEvent(self, event):
+        """Build the settings sections the first time the sidebar is shown"""
+        if not self._sections_built:
+            self._build_sections()
+        super().showEvent(event)
+    
+    def _build_sections(self):
+        """Create every settings section beneath the header"""
+        self._sections_built = True
+        layout = self._content_layout
+        for build in (
+            self._build_typography,
+            self._build_colors,
+            self._build_position,
+            self._build_timing,
+        ):
+            layout.addWidget(build())
+        layout.addStretch()
+    
+    def _build_typography(self):
+        """Font family, size and weight controls"""
         typo_group = self._create_section("📝 Typography")
         
         # Font Family
@@ -103,62 +446,54 @@ class SubtitleSettingsSidebar(QWidget):
         
         # Font Size
         font_size_layout = self._create_slider_row(
-            "Font Size", 8, 72, self.style.font_size, "pt"
+            "Font Size", 8, 72, self.style.font_size, "pt",
+            on_change=self.on_font_size_changed
         )
         self.font_size_spinner = font_size_layout[0]
-        self.font_size_spinner.valueChanged.connect(self.on_font_size_changed)
         typo_group.layout().addLayout(font_size_layout[1])
         
         # Style Checkboxes
-        style_row = QHBoxLayout()
-        style_row.setSpacing(10)
-        
         self.bold_check = QCheckBox("Bold")
         self.bold_check.setChecked(self.style.font_bold)
         self.bold_check.stateChanged.connect(self.on_style_changed)
-        style_row.addWidget(self.bold_check)
         
         self.italic_check = QCheckBox("Italic")
         self.italic_check.setChecked(self.style.font_italic)
         self.italic_check.stateChanged.connect(self.on_style_changed)
-        style_row.addWidget(self.italic_check)
-        style_row.addStretch()
-        
-        typo_group.layout().addLayout(style_row)
-        layout.addWidget(typo_group)
         
-        # Colors Section
+        typo_group.layout().addLayout(
+            _hbox(self.bold_check, self.italic_check, None, spacing=10)
+        )
+        return typo_group
+    
+    def _build_colors(self):
+        """Text, stroke and background colour controls"""
         colors_group = self._create_section("🎨 Colors")
         
         # Text Color
         text_color_row = self._create_color_row("Text Color", self.style.text_color)
         self.text_color_btn = text_color_row[0]
-        self.text_color_btn.clicked.connect(lambda: self.pick_color("text"))
+        self.text_color_btn.clicked.connect(self._pick_text_color)
         colors_group.layout().addLayout(text_color_row[1])
         
         # Stroke Color
         stroke_color_row = self._create_color_row("Stroke Color", self.style.stroke_color)
         self.stroke_color_btn = stroke_color_row[0]
-        self.stroke_color_btn.clicked.connect(lambda: self.pick_color("stroke"))
+        self.stroke_color_btn.clicked.connect(self._pick_stroke_color)
         colors_group.layout().addLayout(stroke_color_row[1])
         
         # Stroke Width
         stroke_width_layout = self._create_slider_row(
-            "Stroke Width", 0, 10, self.style.stroke_width, "px"
+            "Stroke Width", 0, 10, self.style.stroke_width, "px",
+            on_change=self.on_style_changed
         )
         self.stroke_width_slider = stroke_width_layout[2]
-        self.stroke_value_label = stroke_width_layout[3]
-        self.stroke_width_slider.valueChanged.connect(self.on_style_changed)
         colors_group.layout().addLayout(stroke_width_layout[1])
         
         # Background
-        bg_row = QHBoxLayout()
-        bg_row.setSpacing(10)
-        
         self.bg_enable_check = QCheckBox("Background")
         self.bg_enable_check.setChecked(bool(self.style.background_color))
         self.bg_enable_check.stateChanged.connect(self.on_background_toggled)
-        bg_row.addWidget(self.bg_enable_check)
         
         self.bg_color_btn = QPushButton()
         self.bg_color_btn.setFixedSize(60, 30)
@@ -168,288 +503,76 @@ class SubtitleSettingsSidebar(QWidget):
             self.bg_color_btn,
             initial_bg_color.name(QColor.NameFormat.HexArgb)
         )
-        self.bg_color_btn.clicked.connect(lambda: self.pick_color("background"))
+        self.bg_color_btn.clicked.connect(self._pick_background_color)
         self.bg_color_btn.setEnabled(self.bg_enable_check.isChecked())
-        bg_row.addWidget(self.bg_color_btn)
-        bg_row.addStretch()
-        
-        colors_group.layout().addLayout(bg_row)
-        layout.addWidget(colors_group)
         
-        # Position Section
+        colors_group.layout().addLayout(
+            _hbox(self.bg_enable_check, self.bg_color_btn, None, spacing=10)
+        )
+        return colors_group
+    
+    def _build_position(self):
+        """Placement and margin controls"""
         position_group = self._create_section("📍 Position")
         
         # Vertical Position
-        v_pos_row = QHBoxLayout()
-        v_pos_row.addWidget(QLabel("Vertical:"))
         self.pos_v_combo = QComboBox()
         self.pos_v_combo.addItems(["Top", "Center", "Bottom"])
-        pos_map = {"top": 0, "center": 1, "bottom": 2}
-        self.pos_v_combo.setCurrentIndex(pos_map.get(self.style.position_vertical, 2))
+        self.pos_v_combo.setCurrentIndex(self._POS_V_IDX.get(self.style.position_vertical, 2))
         self.pos_v_combo.currentTextChanged.connect(self.on_position_changed)
-        v_pos_row.addWidget(self.pos_v_combo, 1)
-        position_group.layout().addLayout(v_pos_row)
+        position_group.layout().addLayout(
+            _hbox(QLabel("Vertical:"), (self.pos_v_combo, 1))
+        )
         
         # Horizontal Position
-        h_pos_row = QHBoxLayout()
-        h_pos_row.addWidget(QLabel("Horizontal:"))
         self.pos_h_combo = QComboBox()
         self.pos_h_combo.addItems(["Left", "Center", "Right"])
-        pos_map_h = {"left": 0, "center": 1, "right": 2}
-        self.pos_h_combo.setCurrentIndex(pos_map_h.get(self.style.position_horizontal, 1))
+        self.pos_h_combo.setCurrentIndex(self._POS_H_IDX.get(self.style.position_horizontal, 1))
         self.pos_h_combo.currentTextChanged.connect(self.on_position_changed)
-        h_pos_row.addWidget(self.pos_h_combo, 1)
-        position_group.layout().addLayout(h_pos_row)
+        position_group.layout().addLayout(
+            _hbox(QLabel("Horizontal:"), (self.pos_h_combo, 1))
+        )
         
         # Vertical Margin
         margin_v_layout = self._create_slider_row(
-            "Vertical Margin", 0, 300, self.style.margin_vertical, "px"
+            "Vertical Margin", 0, 300, self.style.margin_vertical, "px",
+            on_change=self.on_margin_changed
         )
         self.margin_v_spinner = margin_v_layout[0]
-        self.margin_v_spinner.valueChanged.connect(self.on_margin_changed)
         position_group.layout().addLayout(margin_v_layout[1])
         
         # Horizontal Margin
         margin_h_layout = self._create_slider_row(
-            "Horizontal Margin", 0, 300, self.style.margin_horizontal, "px"
+            "Horizontal Margin", 0, 300, self.style.margin_horizontal, "px",
+            on_change=self.on_margin_changed
         )
         self.margin_h_spinner = margin_h_layout[0]
-        self.margin_h_spinner.valueChanged.connect(self.on_margin_changed)
         position_group.layout().addLayout(margin_h_layout[1])
         
-        layout.addWidget(position_group)
-        
-        # Timing Section
+        return position_group
+    
+    def _build_timing(self):
+        """Timing offset control"""
         timing_group = self._create_section("⏱️ Timing")
         
-        timing_layout = QHBoxLayout()
-        timing_layout.addWidget(QLabel("Timing Offset:"))
         self.timing_offset_spinner = QDoubleSpinBox()
+        self.timing_offset_spinner.setKeyboardTracking(False)
         self.timing_offset_spinner.setRange(-3600.0, 3600.0)
         self.timing_offset_spinner.setDecimals(2)
         self.timing_offset_spinner.setSingleStep(0.1)
         self.timing_offset_spinner.setValue(float(self.style.timing_offset))
         self.timing_offset_spinner.setSuffix(" s")
         self.timing_offset_spinner.valueChanged.connect(self.on_timing_changed)
-        timing_layout.addWidget(self.timing_offset_spinner, 1)
-        timing_group.layout().addLayout(timing_layout)
+        timing_group.layout().addLayout(
+            _hbox(QLabel("Timing Offset:"), (self.timing_offset_spinner, 1))
+        )
         
         timing_hint = QLabel("Shift subtitles forward (+) or backward (−)")
-        timing_hint.setStyleSheet("color: #666666; font-size: 11px; font-style: italic; background: transparent;")
+        timing_hint.setObjectName("TimingHint")
         timing_hint.setWordWrap(True)
         timing_group.layout().addWidget(timing_hint)
         
-        layout.addWidget(timing_group)
-        
-        # Add stretch at end
-        layout.addStretch()
-        
-        # Apply refined styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #101010;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 13px;
-            }
-            
-            QFrame#HeaderFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a1a, stop:1 #101010);
-                border-radius: 8px;
-                padding: 10px;
-            }
-            
-            QGroupBox {
-                background: #1a1a1a;
-                border: 1px solid #2a2a2a;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 16px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 4px 12px;
-                background: #101010;
-                border-radius: 4px;
-                left: 10px;
-                color: #4a9eff;
-            }
-            
-            QLabel {
-                color: #d0d0d0;
-                background: transparent;
-            }
-            
-            QComboBox, QFontComboBox {
-                background: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 6px 10px;
-                min-height: 25px;
-            }
-            
-            QComboBox:hover, QFontComboBox:hover {
-                border: 1px solid #4a9eff;
-                background: #323232;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #888888;
-                width: 0;
-                height: 0;
-                margin-right: 8px;
-            }
-            
-            QSpinBox, QDoubleSpinBox {
-                background: #2a2a2a;
-                color: #ffffff;
-                border: 1px solid #3a3a3a;
-                border-radius: 5px;
-                padding: 5px 8px;
-                min-height: 25px;
-            }
-            
-            QSpinBox:hover, QDoubleSpinBox:hover {
-                border: 1px solid #4a9eff;
-                background: #323232;
-            }
-            
-            QSpinBox::up-button, QDoubleSpinBox::up-button,
-            QSpinBox::down-button, QDoubleSpinBox::down-button {
-                background: #3a3a3a;
-                border: none;
-                width: 18px;
-                border-radius: 3px;
-            }
-            
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
-                background: #4a9eff;
-            }
-            
-            QSlider::groove:horizontal {
-                border: none;
-                height: 6px;
-                background: #2a2a2a;
-                border-radius: 3px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5aa0ff, stop:1 #3a80ff);
-                border: 2px solid #2a5a9f;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 9px;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6ab0ff, stop:1 #4a90ff);
-                border: 2px solid #3a6aaf;
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4a9eff, stop:1 #2a7edf);
-                border-radius: 3px;
-            }
-            
-            QCheckBox {
-                color: #d0d0d0;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #3a3a3a;
-                border-radius: 4px;
-                background: #2a2a2a;
-            }
-            
-            QCheckBox::indicator:hover {
-                border: 2px solid #4a9eff;
-                background: #323232;
-            }
-            
-            QCheckBox::indicator:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #4a9eff, stop:1 #2a7edf);
-                border: 2px solid #2a6acf;
-            }
-            
-            QCheckBox::indicator:checked:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #5aa0ff, stop:1 #3a80ff);
-            }
-            
-            QPushButton#ColorButton {
-                border: 2px solid #3a3a3a;
-                border-radius: 5px;
-                min-width: 50px;
-                min-height: 28px;
-            }
-            
-            QPushButton#ColorButton:hover {
-                border: 2px solid #4a9eff;
-            }
-            
-            QToolButton#LegacyToggleButton {
-                background: rgba(74, 158, 255, 0.15);
-                color: #9ec0ff;
-                border: 1px solid #3a6aaf;
-                border-radius: 5px;
-                padding: 6px 12px;
-                font-size: 16px;
-                font-weight: normal;
-            }
-            
-            QToolButton#LegacyToggleButton:hover {
-                background: rgba(74, 158, 255, 0.25);
-                border: 1px solid #4a9eff;
-            }
-            
-            QScrollBar:vertical {
-                background: #1a1a1a;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: #3a3a3a;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: #4a4a4a;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        return timing_group
     
     def _create_section(self, title):
         """Create a styled section group"""
@@ -464,13 +587,18 @@ class SubtitleSettingsSidebar(QWidget):
         """Add a label above a widget"""
         if label_text:
             label = QLabel(label_text)
-            label.setStyleSheet("color: #b0b0b0; font-size: 12px; font-weight: 500; background: transparent;")
+            label.setObjectName("FieldLabel")
             parent.layout().addWidget(label)
         if widget:
             parent.layout().addWidget(widget)
     
-    def _create_slider_row(self, label_text, min_val, max_val, current_val, suffix=""):
-        """Create a row with label, slider, and spinbox"""
+    def _create_slider_row(self, label_text, min_val, max_val, current_val, suffix="",
+                           on_change=None):
+        """Create a row with label, slider, and spinbox
+        
+        on_change is called once per user change, whichever of the two
+        widgets it came from.
+        """
         row = QHBoxLayout()
         row.setSpacing(12)
         
@@ -484,6 +612,8 @@ class SubtitleSettingsSidebar(QWidget):
         row.addWidget(slider, 1)
         
         spinbox = QSpinBox()
+        # Typed numbers are applied once on Enter/focus-out, not per digit
+        spinbox.setKeyboardTracking(False)
         spinbox.setRange(min_val, max_val)
         spinbox.setValue(current_val)
         if suffix:
@@ -491,15 +621,24 @@ class SubtitleSettingsSidebar(QWidget):
         spinbox.setMinimumWidth(80)
         row.addWidget(spinbox)
         
-        # Sync slider and spinbox
-        slider.valueChanged.connect(spinbox.setValue)
-        spinbox.valueChanged.connect(slider.setValue)
+        # Sync slider and spinbox without the echo bouncing back
+        def sync_spinbox(value):
+            spinbox.blockSignals(True)
+            spinbox.setValue(value)
+            spinbox.blockSignals(False)
+        
+        def sync_slider(value):
+            slider.blockSignals(True)
+            slider.setValue(value)
+            slider.blockSignals(False)
         
-        value_label = QLabel(str(current_val))
-        value_label.setMinimumWidth(35)
-        value_label.setStyleSheet("color: #888888; font-weight: bold; background: transparent;")
+        slider.valueChanged.connect(sync_spinbox)
+        spinbox.valueChanged.connect(sync_slider)
+        if on_change is not None:
+            slider.valueChanged.connect(on_change)
+            spinbox.valueChanged.connect(on_change)
         
-        return (spinbox, row, slider, value_label)
+        return (spinbox, row, slider)
     
     def _create_color_row(self, label_text, color_hex):
         """Create a row for color selection"""
@@ -518,7 +657,7 @@ class SubtitleSettingsSidebar(QWidget):
         row.addWidget(color_btn)
         
         color_value = QLabel(color_hex)
-        color_value.setStyleSheet("color: #888888; font-size: 11px; font-family: monospace; background: transparent;")
+        color_value.setObjectName("ColorValue")
         row.addWidget(color_value)
         row.addStretch()
         
@@ -526,28 +665,35 @@ class SubtitleSettingsSidebar(QWidget):
     
     def update_color_button(self, button, color_hex):
         """Update button appearance with color"""
-        # Ensure color is valid
-        color = QColor(color_hex)
-        if not color.isValid():
-            color = QColor("#ffffff")
-        
-        # Calculate if we need dark or light text
-        luminance = (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()) / 255
-        text_color = "#000000" if luminance > 0.5 else "#ffffff"
-        
-        button.setStyleSheet(f"""
-            QPushButton#ColorButton {{
-                background-color: {color.name()};
-                color: {text_color};
-                border: 2px solid #3a3a3a;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            QPushButton#ColorButton:hover {{
-                border: 2px solid #4a9eff;
-            }}
-        """)
+        # Border and hover come from the sidebar stylesheet; the colour itself
+        # is a swatch icon so changing it never re-polishes the button
+        swatch_size = button.size() - QSize(10, 10)
+        key = (color_hex, swatch_size.width(), swatch_size.height())
+        icon = self._color_icon_cache.get(key)
+        if icon is None:
+            # Ensure color is valid
+            color = QColor(color_hex)
+            if not color.isValid():
+                color = QColor("#ffffff")
+            pixmap = QPixmap(swatch_size)
+            pixmap.fill(QColor(color.name()))
+            icon = QIcon(pixmap)
+            self._color_icon_cache[key] = icon
+        
+        button.setIcon(icon)
+        button.setIconSize(swatch_size)
+    
+    @pyqtSlot()
+    def _pick_text_color(self):
+        self.pick_color("text")
+    
+    @pyqtSlot()
+    def _pick_stroke_color(self):
+        self.pick_color("stroke")
+    
+    @pyqtSlot()
+    def _pick_background_color(self):
+        self.pick_color("background")
     
     def pick_color(self, color_type):
         """Open color picker"""
@@ -558,7 +704,19 @@ class SubtitleSettingsSidebar(QWidget):
         else:
             current_color = self.style.background_color or "#000000B4"
 
-        color = QColorDialog.getColor(QColor(current_color), self, f"Choose {color_type} color")
+        dialog = self._color_dialog
+        if dialog is None:
+            dialog = self._color_dialog = QColorDialog(self)
+        dialog.setWindowTitle(f"Choose {color_type} color")
+        dialog.setOption(
+            QColorDialog.ColorDialogOption.ShowAlphaChannel,
+            color_type == "background"
+        )
+        dialog.setCurrentColor(QColor(current_color))
+        if not dialog.exec():
+            return
+        
+        color = dialog.currentColor()
         if color.isValid():
             if color_type == "text":
                 self.style.text_color = color.name()
@@ -570,42 +728,60 @@ class SubtitleSettingsSidebar(QWidget):
                 hex_argb = color.name(QColor.NameFormat.HexArgb)
                 self.style.background_color = hex_argb
                 self.update_color_button(self.bg_color_btn, hex_argb)
-            self.settings_changed.emit(self.style)
+            self._queue_settings_changed(0)
     
+    @pyqtSlot(int)
     def on_font_size_changed(self, value):
         """Handle font size change"""
+        if value == self.style.font_size:
+            return
         self.style.font_size = value
-        self.settings_changed.emit(self.style)
+        self._queue_settings_changed()
     
+    @pyqtSlot(QFont)
     def on_font_changed(self, font):
         """Handle font family change"""
-        if isinstance(font, QFont):
-            self.style.font_family = font.family()
-        else:
-            self.style.font_family = str(font)
-        self.settings_changed.emit(self.style)
+        family = font.family() if isinstance(font, QFont) else str(font)
+        if family == self.style.font_family:
+            return
+        self.style.font_family = family
+        self._queue_settings_changed()
     
+    @pyqtSlot()
     def on_style_changed(self):
         """Handle style changes (bold, italic, stroke width)"""
-        self.style.font_bold = self.bold_check.isChecked()
-        self.style.font_italic = self.italic_check.isChecked()
-        self.style.stroke_width = self.stroke_width_slider.value()
-        self.stroke_value_label.setText(str(self.style.stroke_width))
-        self.settings_changed.emit(self.style)
+        bold = self.bold_check.isChecked()
+        italic = self.italic_check.isChecked()
+        stroke_width = self.stroke_width_slider.value()
+        style = self.style
+        if (bold, italic, stroke_width) == (style.font_bold, style.font_italic, style.stroke_width):
+            return
+        style.font_bold = bold
+        style.font_italic = italic
+        style.stroke_width = stroke_width
+        self._queue_settings_changed()
     
+    @pyqtSlot()
     def on_position_changed(self):
         """Handle position changes"""
-        pos_map_v = {0: "top", 1: "center", 2: "bottom"}
-        pos_map_h = {0: "left", 1: "center", 2: "right"}
-        self.style.position_vertical = pos_map_v[self.pos_v_combo.currentIndex()]
-        self.style.position_horizontal = pos_map_h[self.pos_h_combo.currentIndex()]
-        self.settings_changed.emit(self.style)
+        vertical = self._POS_V[self.pos_v_combo.currentIndex()]
+        horizontal = self._POS_H[self.pos_h_combo.currentIndex()]
+        if (vertical, horizontal) == (self.style.position_vertical, self.style.position_horizontal):
+            return
+        self.style.position_vertical = vertical
+        self.style.position_horizontal = horizontal
+        self._queue_settings_changed()
     
+    @pyqtSlot()
     def on_timing_changed(self):
         """Handle timing offset change"""
-        self.style.timing_offset = float(self.timing_offset_spinner.value())
-        self.settings_changed.emit(self.style)
+        offset = float(self.timing_offset_spinner.value())
+        if offset == self.style.timing_offset:
+            return
+        self.style.timing_offset = offset
+        self._queue_settings_changed()
 
+    @pyqtSlot()
     def on_background_toggled(self):
         """Enable/disable background color"""
         enabled = self.bg_enable_check.isChecked()
@@ -615,10 +791,32 @@ class SubtitleSettingsSidebar(QWidget):
             self.update_color_button(self.bg_color_btn, self.style.background_color)
         elif not enabled:
             self.style.background_color = ""
-        self.settings_changed.emit(self.style)
+        self._queue_settings_changed(0)
 
+    @pyqtSlot()
     def on_margin_changed(self):
         """Handle margin updates"""
-        self.style.margin_vertical = self.margin_v_spinner.value()
-        self.style.margin_horizontal = self.margin_h_spinner.value()
+        vertical = self.margin_v_spinner.value()
+        horizontal = self.margin_h_spinner.value()
+        if (vertical, horizontal) == (self.style.margin_vertical, self.style.margin_horizontal):
+            return
+        self.style.margin_vertical = vertical
+        self.style.margin_horizontal = horizontal
+        self._queue_settings_changed()
+
+    def _queue_settings_changed(self, delay_ms=SETTINGS_EMIT_DELAY_MS):
+        """(Re)arm the emit timer; a pending delayed emit is folded in"""
+        self._emit_timer.start(delay_ms)
+
+    @pyqtSlot()
+    def _emit_settings_changed(self):
+        """Emit the current style if it differs from the last emit"""
+        # A burst that ended where it started changes nothing downstream
+        state = astuple(self.style)
+        if state == self._emitted_state:
+            return
+        previous, self._emitted_state = self._emitted_state, state
+        for field, old, new in zip(fields(self.style), previous, state):
+            if old != new:
+                self.settings_field_changed.emit(field.name, new)
         self.settings_changed.emit(self.style)
@@ -5,10 +5,12 @@ Professional video player with VLC backend and subtitle support
 
 import sys
 import os
+import importlib
 import socket
 import shutil
 import subprocess
 import time
+from functools import partial
 from typing import Optional
 from pathlib import Path
 from PyQt6.QtWidgets import (
@@ -17,8 +19,11 @@ from PyQt6.QtWidgets import (
     QMenu, QMessageBox, QSplitter, QSplitterHandle, QSizePolicy,
     QDialog
 )
-from PyQt6.QtCore import Qt, QTimer, QUrl, pyqtSignal, QPoint
-from PyQt6.QtGui import QAction, QActionGroup, QPalette, QColor, QFont, QPainter, QPen
+from PyQt6.QtCore import (
+    Qt, QTimer, QUrl, pyqtSignal, QPoint, QFileSystemWatcher, QObject, QRunnable, QThreadPool,
+    QEvent
+)
+from PyQt6.QtGui import QAction, QActionGroup, QPalette, QColor, QFont, QPainter, QPen, QIcon
 import vlc
 
 # Suppress VLC warnings and debug messages
@@ -39,6 +44,37 @@ SAMPLE_VIDEO_PATH = PROJECT_ROOT / "temp" / "sample.mp4"
 SAMPLE_CAST_URL_FILE = PROJECT_ROOT / "temp" / "start_cast_url.txt"
 SAMPLE_CAST_LOG_FILE = PROJECT_ROOT / "temp" / "start_cast.log"
 
+# Sidecar subtitle auto-detection (exact name match first, then language codes)
+SUBTITLE_AUTODETECT_EXTENSIONS = ('.srt', '.vtt', '.ass', '.ssa')
+SUBTITLE_AUTODETECT_SUFFIXES = ('', '.en', '.pt-BR', '.pt', '.es', '.eng', '.por')
+
+
+class _SrtSaveSignals(QObject):
+    """Signals emitted by _SrtSaveTask back on the GUI thread"""
+
+    done = pyqtSignal(str, bool)  # subtitle_path, success
+
+
+class _SrtSaveTask(QRunnable):
+    """Write AI-generated segments to an SRT file on a pool thread"""
+
+    def __init__(self, generator_cls, segments, subtitle_path: str, resource_manager, signals: _SrtSaveSignals):
+        super().__init__()
+        self.generator_cls = generator_cls
+        self.segments = segments
+        self.subtitle_path = subtitle_path
+        self.resource_manager = resource_manager
+        self.signals = signals
+
+    def run(self):
+        success = False
+        try:
+            generator = self.generator_cls(resource_manager=self.resource_manager)
+            success = generator.save_to_srt(self.segments, self.subtitle_path)
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"Error saving AI subtitles: {exc}")
+        self.signals.done.emit(self.subtitle_path, success)
+
 
 class SidebarSplitterHandle(QSplitterHandle):
     """Custom splitter handle with hand cursor and styled appearance"""
@@ -228,7 +264,15 @@ class VideoPlayer(QMainWindow):
         self.subtitle_parser = SubtitleParser()
         self.current_video = None
         self._current_video_source = None
+        self._current_video_exists = False
+
+        # Push-based existence tracking for the loaded video (avoids stat() per menu refresh)
+        self._video_watcher = QFileSystemWatcher(self)
+        self._video_watcher.fileChanged.connect(self._on_video_path_changed)
+        self._video_watcher.directoryChanged.connect(self._on_video_path_changed)
         self.current_subtitles = []
+        self._parsed_sub_cache = {}  # path -> (mtime, base entries without timing offset)
+        self._subfile_cache = None  # (video_path, associated subtitle path) for current_video
         self.subtitle_style = SubtitleStyle()
         self.subtitle_settings_dialog = None
         self.streaming_stats_dialog = None
@@ -253,10 +297,22 @@ class VideoPlayer(QMainWindow):
         # AI generation dialog references
         self.minimized_ai_dialog = None  # Reference to minimized dialog
         self.current_ai_dialog = None  # Reference to current AI dialog (visible or minimized)
-        self._ai_progress_slot = None  # Cached slot for thread progress updates
+        self._last_ai_footer_ts = 0.0  # Throttle footer progress repaints to <= 10 Hz
+        self._pending_ai_progress = None
+        self._ai_footer_flush_timer = QTimer(self)
+        self._ai_footer_flush_timer.setSingleShot(True)
+        self._ai_footer_flush_timer.setInterval(120)
+        self._ai_footer_flush_timer.timeout.connect(self._flush_ai_progress)
 
         # Track active translation dialog for quick restore
         self._active_translation_dialog = None
+
+        # Footer chip updates are coalesced per key and applied in one pass
+        self._pending_status = {}
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(50)
+        self._status_flush_timer.timeout.connect(self._flush_status)
         
         # Auto-hide controls
         self.controls_visible = True
@@ -280,6 +336,7 @@ class VideoPlayer(QMainWindow):
         self._hardware_accel_mode = normalized_mode
         self.instance = None
         self.media_player = None
+        self._last_volume = None
         self._initialize_vlc_player()
         
         # Pass resource manager to casting manager
@@ -291,6 +348,21 @@ class VideoPlayer(QMainWindow):
         self.timer = QTimer(self)
         self.timer.setInterval(100)
         self.timer.timeout.connect(self.update_ui)
+        self._fmt_time_cache = {}
+        self._last_duration_sec = None
+
+        # Coalesce bursts of resize/move events into one overlay geometry sync
+        self._geom_update_timer = QTimer(self)
+        self._geom_update_timer.setSingleShot(True)
+        self._geom_update_timer.setInterval(0)
+        self._geom_update_timer.timeout.connect(self._do_update_subtitle_window_geometry)
+        self._last_subtitle_geom = None
+        self._subtitle_raised = False
+
+        # Video context menu is built on first use and reused afterwards
+        self._ctx_menu = None
+        self._menu_icon_cache = {}
+        self._lazy_classes = {}  # (module, class name) -> class for heavy dialogs
         
         self.init_ui()
         self.apply_theme()
@@ -318,7 +390,7 @@ class VideoPlayer(QMainWindow):
         # Splitter for video and sidebar
         self.splitter = SidebarSplitter(Qt.Orientation.Horizontal)
         self.splitter.setStyleSheet("QSplitter::handle { background-color: #1c1c1c; }")
-        self.splitter.splitterMoved.connect(lambda *_: self.update_subtitle_window_geometry())
+        self.splitter.splitterMoved.connect(self._on_splitter_moved)
 
         # Left side - video container
         left_widget = QWidget()
@@ -353,6 +425,7 @@ class VideoPlayer(QMainWindow):
 
         self.subtitle_sidebar = SubtitleSettingsSidebar(self.subtitle_style)
         self.subtitle_sidebar.settings_changed.connect(self.on_sidebar_settings_changed)
+        self.subtitle_sidebar.settings_field_changed.connect(self.on_sidebar_setting_field_changed)
         self.subtitle_sidebar.toggle_legacy.connect(self.show_subtitle_settings)
         sidebar_layout.addWidget(self.subtitle_sidebar)
 
@@ -388,7 +461,7 @@ class VideoPlayer(QMainWindow):
         self.resource_monitor_label.setStyleSheet("color: #90EE90; font-size: 10px;")
         self.resource_monitor_label.setToolTip("System resource usage")
         self.statusBar().addPermanentWidget(self.resource_monitor_label)
-        self.update_resource_monitor()
+        QTimer.singleShot(0, self.update_resource_monitor)  # First sample once the window is shown
 
         # Connect background task manager to footer updates
         self.task_manager.task_started.connect(self.on_background_task_started)
@@ -421,6 +494,38 @@ class VideoPlayer(QMainWindow):
         if self.status_footer:
             self.status_footer.show_message(message, timeout)
 
+    def _queue_status(self, key: str, *args, **kwargs) -> None:
+        """Queue a footer chip update; only the latest state per key is applied."""
+        self._pending_status[key] = ("set", args, kwargs, None)
+        self._status_flush_timer.start()
+
+    def _queue_clear_status(self, key: str) -> None:
+        """Queue removal of a footer chip, dropping any pending update for it."""
+        self._pending_status[key] = ("clear", (), {}, None)
+        self._status_flush_timer.start()
+
+    def _queue_schedule_clear(self, key: str, delay_ms: int) -> None:
+        """Schedule a chip clear, deferring it behind a pending update for the key."""
+        pending = self._pending_status.get(key)
+        if pending is None:
+            if self.status_footer:
+                self.status_footer.schedule_clear(key, delay_ms)
+        elif pending[0] == "set":
+            self._pending_status[key] = pending[:3] + (delay_ms,)
+
+    def _flush_status(self) -> None:
+        """Apply all pending footer chip updates in a single pass."""
+        pending, self._pending_status = self._pending_status, {}
+        if not self.status_footer:
+            return
+        for key, (op, args, kwargs, clear_delay) in pending.items():
+            if op == "clear":
+                self.status_footer.clear_status(key)
+                continue
+            self.status_footer.set_status(key, *args, **kwargs)
+            if clear_delay is not None:
+                self.status_footer.schedule_clear(key, clear_delay)
+
     def on_stats_footer_action_requested(self, key: str) -> None:
         """Handle action button requests from the stats footer."""
         if key == "ai":
@@ -460,7 +565,7 @@ class VideoPlayer(QMainWindow):
     def on_translation_started(self, target_lang: str) -> None:
         """Update footer when translation begins."""
         if self.status_footer:
-            self.status_footer.set_status(
+            self._queue_status(
                 "translation",
                 f"🌐 {self._progress_prefix(0)}Translating to {target_lang}",
                 button_text="Abrir",
@@ -476,7 +581,7 @@ class VideoPlayer(QMainWindow):
 
         prefix = "🌐"
         progress_text = self._progress_prefix(percent)
-        self.status_footer.set_status(
+        self._queue_status(
             "translation",
             f"{prefix} {progress_text}{message}",
             button_text="Abrir",
@@ -490,7 +595,7 @@ class VideoPlayer(QMainWindow):
 
         self._active_tasks_by_key.pop("translation", None)
 
-        self.status_footer.set_status(
+        self._queue_status(
             "translation",
             f"🌐 {message}",
             button_text="Abrir",
@@ -498,23 +603,23 @@ class VideoPlayer(QMainWindow):
         )
 
         clear_delay = 8000 if success else 10000
-        self.status_footer.schedule_clear("translation", clear_delay)
+        self._queue_schedule_clear("translation", clear_delay)
 
     def _key_for_task_type(self, task_type: TaskType) -> str:
-        if task_type == TaskType.AI_GENERATION:
+        if task_type is TaskType.AI_GENERATION:
             return "ai"
-        if task_type == TaskType.TRANSLATION:
+        if task_type is TaskType.TRANSLATION:
             return "translation"
-        if task_type == TaskType.PROXY_TRANSCODE:
+        if task_type is TaskType.PROXY_TRANSCODE:
             return "proxy"
         return task_type.value
 
     def _icon_for_task_type(self, task_type: TaskType) -> str:
-        if task_type == TaskType.AI_GENERATION:
+        if task_type is TaskType.AI_GENERATION:
             return "🤖"
-        if task_type == TaskType.TRANSLATION:
+        if task_type is TaskType.TRANSLATION:
             return "🌐"
-        if task_type == TaskType.PROXY_TRANSCODE:
+        if task_type is TaskType.PROXY_TRANSCODE:
             return "🎬"
         return "⚙️"
 
@@ -544,7 +649,7 @@ class VideoPlayer(QMainWindow):
         self._active_tasks_by_key[key] = task_info.task_id
         self._task_key_lookup[task_info.task_id] = key
 
-        self.status_footer.set_status(
+        self._queue_status(
             key,
             f"{icon} {progress_text}{display_message}",
             button_text="Abrir" if key in {"ai", "translation"} else None,
@@ -562,7 +667,7 @@ class VideoPlayer(QMainWindow):
         icon = self._icon_for_task_type(task_info.task_type)
         progress_text = self._progress_prefix(task_info.progress)
 
-        self.status_footer.set_status(
+        self._queue_status(
             key,
             f"{icon} {progress_text}{task_info.message}",
             button_text="Abrir" if key in {"ai", "translation"} else None,
@@ -603,22 +708,22 @@ class VideoPlayer(QMainWindow):
             else:
                 message = "Proxy 1080p finalizado"
 
-            self.status_footer.set_status(
+            self._queue_status(
                 key,
                 f"{icon} {message}",
                 button_text=button_text,
                 cancelable=False,
             )
-            self.status_footer.schedule_clear(key, 15000)
+            self._queue_schedule_clear(key, 15000)
             return
 
-        self.status_footer.set_status(
+        self._queue_status(
             key,
             f"{icon} {message}",
             button_text=button_text,
             cancelable=False,
         )
-        self.status_footer.schedule_clear(key, 8000)
+        self._queue_schedule_clear(key, 8000)
 
     def on_background_task_failed(self, task_info: TaskInfo) -> None:
         if not self.status_footer:
@@ -642,23 +747,23 @@ class VideoPlayer(QMainWindow):
                 self.optimize_proxy_action.setEnabled(True)
 
             error_detail = task_info.error or task_info.message or "Falha desconhecida"
-            self.status_footer.set_status(
+            self._queue_status(
                 key,
                 f"{icon} Falha ao gerar proxy",
                 button_text=None,
                 cancelable=False,
             )
-            self.status_footer.schedule_clear(key, 12000)
+            self._queue_schedule_clear(key, 12000)
             self.show_status_message(f"Não foi possível criar o proxy 1080p: {error_detail}", 6000)
             return
 
-        self.status_footer.set_status(
+        self._queue_status(
             key,
             f"{icon} {message}",
             button_text=None,
             cancelable=False,
         )
-        self.status_footer.schedule_clear(key, 10000)
+        self._queue_schedule_clear(key, 10000)
 
     def create_control_panel(self):
         """Create modern video control panel with icons"""
@@ -836,6 +941,7 @@ class VideoPlayer(QMainWindow):
         self.instance = vlc.Instance(vlc_args)
         self.media_player = self.instance.media_player_new()
         self.media_player.audio_set_volume(self.config_manager.config.volume)
+        self._last_volume = self.config_manager.config.volume
         self._attach_media_player_to_frame()
 
     def _attach_media_player_to_frame(self):
@@ -903,11 +1009,11 @@ class VideoPlayer(QMainWindow):
             if was_playing:
                 self.media_player.play()
                 if resume_time > 0:
-                    QTimer.singleShot(200, lambda restore_time=resume_time: self.media_player.set_time(restore_time))
+                    QTimer.singleShot(200, partial(self.media_player.set_time, resume_time))
             else:
                 self.media_player.play()
                 if resume_time > 0:
-                    QTimer.singleShot(200, lambda restore_time=resume_time: self.media_player.set_time(restore_time))
+                    QTimer.singleShot(200, partial(self.media_player.set_time, resume_time))
                 QTimer.singleShot(250, self.media_player.pause)
 
         self._update_hw_accel_menu()
@@ -992,6 +1098,7 @@ class VideoPlayer(QMainWindow):
         *,
         progress_callback=None,
         cancel_check=None,
+        cancel_event=None,
     ) -> Optional[str]:
         progress_callback = progress_callback or (lambda *_: None)
         cancel_check = cancel_check or (lambda: False)
@@ -1066,7 +1173,11 @@ class VideoPlayer(QMainWindow):
                 if not line:
                     if process.poll() is not None:
                         break
-                    time.sleep(0.05)
+                    # Wake immediately if the task is cancelled meanwhile
+                    if cancel_event is not None:
+                        cancel_event.wait(0.05)
+                    else:
+                        time.sleep(0.05)
                     continue
 
                 line = line.strip()
@@ -1173,7 +1284,7 @@ class VideoPlayer(QMainWindow):
             return
 
         if self.status_footer:
-            self.status_footer.set_status("casting", f"📡 Casting ativo: {url}")
+            self._queue_status("casting", f"📡 Casting ativo: {url}")
 
         try:
             SAMPLE_CAST_URL_FILE.write_text(url)
@@ -1276,7 +1387,7 @@ class VideoPlayer(QMainWindow):
         for mode, label in accel_options:
             action = QAction(label, self)
             action.setCheckable(True)
-            action.triggered.connect(lambda checked, value=mode: self._on_hardware_accel_selected(value, checked))
+            action.triggered.connect(partial(self._on_hardware_accel_selected, mode))
             hardware_menu.addAction(action)
             self.hw_accel_group.addAction(action)
             self.hw_accel_actions[mode] = action
@@ -1297,12 +1408,12 @@ class VideoPlayer(QMainWindow):
         
         volume_up_action = QAction("Volume &Up", self)
         volume_up_action.setShortcut("Up")
-        volume_up_action.triggered.connect(lambda: self.adjust_volume(10))
+        volume_up_action.triggered.connect(self._vol_up)
         audio_menu.addAction(volume_up_action)
         
         volume_down_action = QAction("Volume &Down", self)
         volume_down_action.setShortcut("Down")
-        volume_down_action.triggered.connect(lambda: self.adjust_volume(-10))
+        volume_down_action.triggered.connect(self._vol_down)
         audio_menu.addAction(volume_down_action)
         
         mute_action = QAction("&Mute/Unmute", self)
@@ -1314,12 +1425,12 @@ class VideoPlayer(QMainWindow):
         
         speed_up_action = QAction("Speed &Increase", self)
         speed_up_action.setShortcut("]")
-        speed_up_action.triggered.connect(lambda: self.adjust_playback_speed(0.25))
+        speed_up_action.triggered.connect(self._speed_up)
         audio_menu.addAction(speed_up_action)
         
         speed_down_action = QAction("Speed &Decrease", self)
         speed_down_action.setShortcut("[")
-        speed_down_action.triggered.connect(lambda: self.adjust_playback_speed(-0.25))
+        speed_down_action.triggered.connect(self._speed_down)
         audio_menu.addAction(speed_down_action)
         
         reset_speed_action = QAction("&Reset Speed", self)
@@ -1385,10 +1496,33 @@ class VideoPlayer(QMainWindow):
 
         self._update_cast_menu_actions()
 
+    def _watch_current_video(self, file_path: str) -> None:
+        """Track the loaded video (and its folder) for existence changes."""
+        watched = self._video_watcher.files() + self._video_watcher.directories()
+        if watched:
+            self._video_watcher.removePaths(watched)
+
+        self._current_video_exists = os.path.exists(file_path)
+        if self._current_video_exists:
+            self._video_watcher.addPath(file_path)
+        parent_dir = os.path.dirname(os.path.abspath(file_path))
+        if os.path.isdir(parent_dir):
+            self._video_watcher.addPath(parent_dir)
+
+    def _on_video_path_changed(self, _path: str) -> None:
+        """Refresh cached existence of the current video after a filesystem change."""
+        exists = bool(self.current_video and os.path.exists(self.current_video))
+        # Editors and downloaders often replace files atomically, which drops the watch
+        if exists and self.current_video not in self._video_watcher.files():
+            self._video_watcher.addPath(self.current_video)
+        if exists != self._current_video_exists:
+            self._current_video_exists = exists
+            self._update_cast_menu_actions()
+
     def _update_cast_menu_actions(self):
         """Enable or disable cast menu actions based on state."""
         casting = self.casting_manager.is_casting
-        can_start = bool(self.current_video and os.path.exists(self.current_video))
+        can_start = bool(self.current_video and self._current_video_exists)
 
         if self.start_cast_action is not None:
             self.start_cast_action.setEnabled(can_start and not casting)
@@ -1420,10 +1554,17 @@ class VideoPlayer(QMainWindow):
                 filename = os.path.basename(filepath)
                 action = QAction(filename, self)
                 action.setData(filepath)
-                action.triggered.connect(
-                    lambda checked, path=filepath: self.load_video(path, source="recent_file")
-                )
+                action.triggered.connect(self._on_recent_action_triggered)
                 self.recent_menu.addAction(action)
+
+    def _on_recent_action_triggered(self):
+        """Load the recent file stored on the triggering action"""
+        action = self.sender()
+        if action is None:
+            return
+        path = action.data()
+        if path:
+            self.load_video(path, source="recent_file")
     
     def apply_theme(self):
         """Apply dark theme"""
@@ -1511,6 +1652,8 @@ class VideoPlayer(QMainWindow):
 
         self.current_video = file_path
         self._current_video_source = source
+        self._subfile_cache = None
+        self._watch_current_video(file_path)
 
         debug_logger.log_video_loaded(file_path, source=source, loop=loop)
 
@@ -1523,7 +1666,7 @@ class VideoPlayer(QMainWindow):
                 )
             self.casting_manager.stop()
             if self.status_footer:
-                self.status_footer.clear_status("casting")
+                self._queue_clear_status("casting")
             self.show_status_message("Casting stopped for new video", 3000)
         self._update_cast_menu_actions()
         
@@ -1546,7 +1689,7 @@ class VideoPlayer(QMainWindow):
             self.optimize_proxy_action.setEnabled(True)
         
         # Try to auto-load subtitle
-        subtitle_file = self.config_manager.get_subtitle_file_for_video(file_path)
+        subtitle_file = self._get_subtitle_file()
         if subtitle_file and os.path.exists(subtitle_file):
             print(f"[Subtitle] Loading saved association: {os.path.basename(subtitle_file)}")
             self.load_subtitle(subtitle_file)
@@ -1555,31 +1698,27 @@ class VideoPlayer(QMainWindow):
             video_path = Path(file_path)
             video_name = video_path.stem
             video_dir = video_path.parent
-            
-            # Search patterns (in order of preference)
-            patterns = [
-                # Exact name match (most common)
-                lambda ext: video_path.with_suffix(ext),
-                # Language codes (e.g., movie.en.srt, movie.pt-BR.srt)
-                lambda ext: video_dir / f"{video_name}.en{ext}",
-                lambda ext: video_dir / f"{video_name}.pt-BR{ext}",
-                lambda ext: video_dir / f"{video_name}.pt{ext}",
-                lambda ext: video_dir / f"{video_name}.es{ext}",
-                # Common suffixes
-                lambda ext: video_dir / f"{video_name}.eng{ext}",
-                lambda ext: video_dir / f"{video_name}.por{ext}",
+
+            # Candidate names in order of preference: extension first, then
+            # exact name match followed by language codes / common suffixes
+            candidates = [
+                f"{video_name}{suffix}{ext}"
+                for ext in SUBTITLE_AUTODETECT_EXTENSIONS
+                for suffix in SUBTITLE_AUTODETECT_SUFFIXES
             ]
-            
-            for ext in ['.srt', '.vtt', '.ass', '.ssa']:
-                for pattern in patterns:
-                    sub_path = pattern(ext)
-                    if sub_path.exists():
-                        print(f"[Subtitle] Auto-detected: {sub_path.name}")
-                        self.load_subtitle(str(sub_path))
-                        break
-                else:
-                    continue  # Continue outer loop if inner didn't break
-                break  # Break outer loop if subtitle was found
+
+            # One directory listing instead of a stat() per candidate
+            try:
+                with os.scandir(video_dir) as entries:
+                    existing = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                existing = set()
+
+            for candidate in candidates:
+                if candidate in existing:
+                    print(f"[Subtitle] Auto-detected: {candidate}")
+                    self.load_subtitle(str(video_dir / candidate))
+                    break
         
         # Load subtitle style
         self.subtitle_style = self.config_manager.load_subtitle_style(file_path)
@@ -1656,7 +1795,7 @@ class VideoPlayer(QMainWindow):
         if self.optimize_proxy_action:
             self.optimize_proxy_action.setEnabled(False)
 
-        self.status_footer.set_status(
+        self._queue_status(
             "proxy",
             f"🎬 {self._progress_prefix(0)}Otimizando {label}...",
             button_text=None,
@@ -1710,6 +1849,7 @@ class VideoPlayer(QMainWindow):
                 # Save association with current video
                 if self.current_video:
                     self.config_manager.set_subtitle_file_for_video(self.current_video, file_path)
+                    self._subfile_cache = None
                     print(f"✓ Saved subtitle association: {os.path.basename(self.current_video)} → {os.path.basename(file_path)}")
                     try:
                         debug_logger.log_subtitle_linked(self.current_video, file_path)
@@ -1746,10 +1886,11 @@ class VideoPlayer(QMainWindow):
             self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
             self.mouse_move_timer.stop()  # Stop auto-hide when paused
             self.show_controls()  # Show controls when paused
+            self._maybe_toggle_sub_timer(False)
         else:
             self.media_player.play()
             self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
-            self.timer.start()
+            self._maybe_toggle_sub_timer(True)
             self.mouse_move_timer.start()  # Start auto-hide when playing
     
     def stop(self):
@@ -1761,6 +1902,21 @@ class VideoPlayer(QMainWindow):
         self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
         self.position_slider.setValue(0)
         self.subtitle_overlay.set_subtitle("")
+
+    def _maybe_toggle_sub_timer(self, playing=None):
+        """Run the position/subtitle timer only while media is playing."""
+        if playing is None:
+            playing = self.media_player.is_playing()
+        if playing and not self.timer.isActive():
+            self.timer.start()
+        elif not playing and self.timer.isActive():
+            self.timer.stop()
+            self.update_ui()  # Leave labels/subtitle in sync with the paused frame
+
+    def _refresh_paused_ui(self):
+        """Resync time labels and subtitle after a seek while the timer is idle."""
+        if not self.timer.isActive():
+            QTimer.singleShot(100, self.update_ui)
     
     def seek_forward(self):
         """Seek forward 10 seconds"""
@@ -1768,6 +1924,7 @@ class VideoPlayer(QMainWindow):
             current_time = self.media_player.get_time()  # milliseconds
             new_time = current_time + 10000  # Add 10 seconds
             self.media_player.set_time(new_time)
+            self._refresh_paused_ui()
     
     def seek_backward(self):
         """Seek backward 10 seconds"""
@@ -1775,6 +1932,7 @@ class VideoPlayer(QMainWindow):
             current_time = self.media_player.get_time()  # milliseconds
             new_time = max(0, current_time - 10000)  # Subtract 10 seconds, but not below 0
             self.media_player.set_time(new_time)
+            self._refresh_paused_ui()
     
     def toggle_mute(self):
         """Toggle mute/unmute"""
@@ -1801,6 +1959,8 @@ class VideoPlayer(QMainWindow):
         """Handle slider release"""
         if self.media_player.is_playing():
             self.timer.start()
+        else:
+            self._refresh_paused_ui()
     
     def slider_click_seek(self, event):
         """Handle click anywhere on slider to seek"""
@@ -1819,6 +1979,7 @@ class VideoPlayer(QMainWindow):
     def set_volume(self, volume):
         """Set playback volume"""
         self.media_player.audio_set_volume(volume)
+        self._last_volume = volume
         self.volume_label.setText(f"{volume}%")
         self.config_manager.config.volume = volume
         self.config_manager.save_config()
@@ -1846,7 +2007,10 @@ class VideoPlayer(QMainWindow):
         duration_sec = duration_ms // 1000  # for display
         
         self.time_label.setText(self.format_time(current_time_sec))
-        self.duration_label.setText(self.format_time(duration_sec))
+        # Duration is fixed per video, so only reformat when it changes
+        if duration_sec != self._last_duration_sec:
+            self._last_duration_sec = duration_sec
+            self.duration_label.setText(self.format_time(duration_sec))
         
         # Update subtitles (need time in seconds with decimal)
         if self.current_subtitles and current_time_ms >= 0:
@@ -1859,13 +2023,23 @@ class VideoPlayer(QMainWindow):
     
     def format_time(self, seconds):
         """Format time in HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        cached = self._fmt_time_cache.get(seconds)
+        if cached is not None:
+            return cached
+
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
+        text = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+        if len(self._fmt_time_cache) >= 8:
+            self._fmt_time_cache.clear()
+        self._fmt_time_cache[seconds] = text
+        return text
     
     def toggle_fullscreen(self):
         """Toggle fullscreen mode with proper escape handling"""
+        # Window state changes restack windows; raise the overlay again on next sync
+        self._subtitle_raised = False
         if self.isFullScreen():
             self.showNormal()
             # Force show all controls when exiting fullscreen
@@ -1992,8 +2166,28 @@ class VideoPlayer(QMainWindow):
         """Handle double-click on video frame to toggle fullscreen"""
         self.toggle_fullscreen()
     
-    def show_video_context_menu(self, position):
-        """Show comprehensive context menu on right-click"""
+    def _lazy_class(self, module_name: str, class_name: str):
+        """Import a class from a sibling module on first use and remember it"""
+        key = (module_name, class_name)
+        cls = self._lazy_classes.get(key)
+        if cls is None:
+            module = importlib.import_module(f".{module_name}", __package__)
+            cls = getattr(module, class_name)
+            self._lazy_classes[key] = cls
+        return cls
+
+    def _menu_icon(self, theme_name: str, fallback: QStyle.StandardPixmap) -> QIcon:
+        """Themed icon with a built-in style fallback, resolved once per name"""
+        icon = self._menu_icon_cache.get(theme_name)
+        if icon is None:
+            icon = QIcon.fromTheme(theme_name)
+            if icon.isNull():
+                icon = self.style().standardIcon(fallback)
+            self._menu_icon_cache[theme_name] = icon
+        return icon
+
+    def _build_video_context_menu(self) -> QMenu:
+        """Create the video context menu once; state is refreshed per open"""
         menu = QMenu(self)
         menu.setStyleSheet("""
             QMenu {
@@ -2016,108 +2210,128 @@ class VideoPlayer(QMainWindow):
         """)
         
         # File operations
-        open_action = menu.addAction("📁 Open Video...")
-        open_action.triggered.connect(self.open_file)
+        menu.addAction(self._menu_icon("document-open", QStyle.StandardPixmap.SP_DialogOpenButton), "Open Video...").triggered.connect(self.open_file)
         
         menu.addSeparator()
         
         # Playback actions
-        if self.media_player.is_playing():
-            play_action = menu.addAction("⏸ Pause")
-            play_action.triggered.connect(self.play_pause)
-        else:
-            play_action = menu.addAction("▶ Play")
-            play_action.triggered.connect(self.play_pause)
+        self._ctx_play_action = menu.addAction(self._menu_icon("media-playback-start", QStyle.StandardPixmap.SP_MediaPlay), "Play")
+        self._ctx_play_action.triggered.connect(self.play_pause)
         
-        stop_action = menu.addAction("⏹ Stop")
-        stop_action.triggered.connect(self.stop)
+        menu.addAction(self._menu_icon("media-playback-stop", QStyle.StandardPixmap.SP_MediaStop), "Stop").triggered.connect(self.stop)
         
         menu.addSeparator()
         
         # Seek controls
-        seek_forward_action = menu.addAction("⏩ Seek Forward 10s")
-        seek_forward_action.triggered.connect(self.seek_forward)
-        seek_forward_action.setEnabled(self.current_video is not None)
+        self._ctx_seek_forward_action = menu.addAction(self._menu_icon("media-seek-forward", QStyle.StandardPixmap.SP_MediaSeekForward), "Seek Forward 10s")
+        self._ctx_seek_forward_action.triggered.connect(self.seek_forward)
         
-        seek_backward_action = menu.addAction("⏪ Seek Backward 10s")
-        seek_backward_action.triggered.connect(self.seek_backward)
-        seek_backward_action.setEnabled(self.current_video is not None)
+        self._ctx_seek_backward_action = menu.addAction(self._menu_icon("media-seek-backward", QStyle.StandardPixmap.SP_MediaSeekBackward), "Seek Backward 10s")
+        self._ctx_seek_backward_action.triggered.connect(self.seek_backward)
         
         menu.addSeparator()
         
         # Audio controls
-        volume_up_action = menu.addAction("🔊 Volume +10%")
-        volume_up_action.triggered.connect(lambda: self.adjust_volume(10))
-
-        volume_down_action = menu.addAction("🔉 Volume -10%")
-        volume_down_action.triggered.connect(lambda: self.adjust_volume(-10))
-
-        mute_action = menu.addAction("🔇 Toggle Mute")
-        mute_action.triggered.connect(self.toggle_mute)
+        menu.addAction(self._menu_icon("audio-volume-high", QStyle.StandardPixmap.SP_MediaVolume), "Volume +10%").triggered.connect(self._vol_up)
+        menu.addAction(self._menu_icon("audio-volume-low", QStyle.StandardPixmap.SP_MediaVolume), "Volume -10%").triggered.connect(self._vol_down)
+        menu.addAction(self._menu_icon("audio-volume-muted", QStyle.StandardPixmap.SP_MediaVolumeMuted), "Toggle Mute").triggered.connect(self.toggle_mute)
 
         menu.addSeparator()
 
         # Playback speed controls
-        faster_action = menu.addAction("⚡ Speed +0.25x")
-        faster_action.triggered.connect(lambda: self.adjust_playback_speed(0.25))
-
-        slower_action = menu.addAction("🐌 Speed -0.25x")
-        slower_action.triggered.connect(lambda: self.adjust_playback_speed(-0.25))
-
-        reset_speed_action = menu.addAction("⏯ Reset Speed (1.0x)")
-        reset_speed_action.triggered.connect(self.reset_playback_speed)
+        menu.addAction(self._menu_icon("go-up", QStyle.StandardPixmap.SP_ArrowUp), "Speed +0.25x").triggered.connect(self._speed_up)
+        menu.addAction(self._menu_icon("go-down", QStyle.StandardPixmap.SP_ArrowDown), "Speed -0.25x").triggered.connect(self._speed_down)
+        menu.addAction(self._menu_icon("view-refresh", QStyle.StandardPixmap.SP_BrowserReload), "Reset Speed (1.0x)").triggered.connect(self.reset_playback_speed)
 
         menu.addSeparator()
 
         # Subtitle actions
-        load_sub_action = menu.addAction("📄 Load Subtitle File...")
-        load_sub_action.triggered.connect(self.open_subtitle)
+        menu.addAction(self._menu_icon("text-x-generic", QStyle.StandardPixmap.SP_FileIcon), "Load Subtitle File...").triggered.connect(self.open_subtitle)
         
-        download_sub_action = menu.addAction("⬇ Download Subtitles...")
-        download_sub_action.triggered.connect(self.show_subtitle_search)
-        download_sub_action.setEnabled(self.current_video is not None)
+        self._ctx_download_sub_action = menu.addAction(self._menu_icon("document-save", QStyle.StandardPixmap.SP_DialogSaveButton), "Download Subtitles...")
+        self._ctx_download_sub_action.triggered.connect(self.show_subtitle_search)
         
-        ai_action = menu.addAction("🤖 Generate Subtitles (AI)...")
-        ai_action.triggered.connect(self.show_ai_subtitle_generator)
-        ai_action.setEnabled(self.current_video is not None)
+        self._ctx_ai_action = menu.addAction(self._menu_icon("system-run", QStyle.StandardPixmap.SP_ComputerIcon), "Generate Subtitles (AI)...")
+        self._ctx_ai_action.triggered.connect(self.show_ai_subtitle_generator)
         
         menu.addSeparator()
         
         # Settings
-        sidebar_action = menu.addAction("⚙ Settings Sidebar")
-        sidebar_action.triggered.connect(self.toggle_subtitle_sidebar)
-
-        legacy_action = menu.addAction("🔧 Legacy Settings Dialog...")
-        legacy_action.triggered.connect(self.show_subtitle_settings)
+        menu.addAction(self._menu_icon("preferences-system", QStyle.StandardPixmap.SP_FileDialogDetailedView), "Settings Sidebar").triggered.connect(self.toggle_subtitle_sidebar)
+        menu.addAction(self._menu_icon("preferences-other", QStyle.StandardPixmap.SP_FileDialogContentsView), "Legacy Settings Dialog...").triggered.connect(self.show_subtitle_settings)
 
         menu.addSeparator()
         
-        # Casting controls
-        if self.casting_manager.is_casting:
-            stop_cast_action = menu.addAction("� Stop Network Cast")
-            stop_cast_action.triggered.connect(self.stop_network_cast)
-            url = self.casting_manager.url or "(unknown)"
-            url_action = menu.addAction(f"🔗 {url}")
-            url_action.setEnabled(False)
-        else:
-            start_cast_action = menu.addAction("🛰 Start Network Cast...")
-            start_cast_action.setEnabled(self.current_video is not None)
-            start_cast_action.triggered.connect(self.start_network_cast)
+        # Casting controls (only one set is visible at a time)
+        self._ctx_cast_stop_action = menu.addAction(self._menu_icon("media-playback-stop", QStyle.StandardPixmap.SP_BrowserStop), "Stop Network Cast")
+        self._ctx_cast_stop_action.triggered.connect(self.stop_network_cast)
+        self._ctx_cast_url_action = menu.addAction(self._menu_icon("network-wired", QStyle.StandardPixmap.SP_DriveNetIcon), "")
+        self._ctx_cast_url_action.setEnabled(False)
+        self._ctx_cast_start_action = menu.addAction(self._menu_icon("network-transmit", QStyle.StandardPixmap.SP_DriveNetIcon), "Start Network Cast...")
+        self._ctx_cast_start_action.triggered.connect(self.start_network_cast)
         
-        analytics_action = menu.addAction("📊 Streaming Analytics...")
-        analytics_action.triggered.connect(self.show_streaming_stats)
+        menu.addAction(self._menu_icon("utilities-system-monitor", QStyle.StandardPixmap.SP_FileDialogInfoView), "Streaming Analytics...").triggered.connect(self.show_streaming_stats)
 
         menu.addSeparator()
 
         # Fullscreen
+        self._ctx_fullscreen_action = menu.addAction(self._menu_icon("view-fullscreen", QStyle.StandardPixmap.SP_TitleBarMaxButton), "Fullscreen")
+        self._ctx_fullscreen_action.triggered.connect(self.toggle_fullscreen)
+
+        return menu
+
+    def show_video_context_menu(self, position):
+        """Show comprehensive context menu on right-click"""
+        if self._ctx_menu is None:
+            self._ctx_menu = self._build_video_context_menu()
+
+        has_video = self.current_video is not None
+        if self.media_player.is_playing():
+            self._ctx_play_action.setText("Pause")
+            self._ctx_play_action.setIcon(self._menu_icon("media-playback-pause", QStyle.StandardPixmap.SP_MediaPause))
+        else:
+            self._ctx_play_action.setText("Play")
+            self._ctx_play_action.setIcon(self._menu_icon("media-playback-start", QStyle.StandardPixmap.SP_MediaPlay))
+        self._ctx_seek_forward_action.setEnabled(has_video)
+        self._ctx_seek_backward_action.setEnabled(has_video)
+        self._ctx_download_sub_action.setEnabled(has_video)
+        self._ctx_ai_action.setEnabled(has_video)
+
+        casting = self.casting_manager.is_casting
+        self._ctx_cast_stop_action.setVisible(casting)
+        self._ctx_cast_url_action.setVisible(casting)
+        if casting:
+            self._ctx_cast_url_action.setText(self.casting_manager.url or "(unknown)")
+        self._ctx_cast_start_action.setVisible(not casting)
+        self._ctx_cast_start_action.setEnabled(has_video)
+
         if self.isFullScreen():
-            fullscreen_action = menu.addAction("⊡ Exit Fullscreen")
+            self._ctx_fullscreen_action.setText("Exit Fullscreen")
+            self._ctx_fullscreen_action.setIcon(self._menu_icon("view-restore", QStyle.StandardPixmap.SP_TitleBarNormalButton))
         else:
-            fullscreen_action = menu.addAction("⛶ Fullscreen")
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
+            self._ctx_fullscreen_action.setText("Fullscreen")
+            self._ctx_fullscreen_action.setIcon(self._menu_icon("view-fullscreen", QStyle.StandardPixmap.SP_TitleBarMaxButton))
         
         # Show menu at cursor position
-        menu.exec(self.video_frame.mapToGlobal(position))
+        self._ctx_menu.exec(self.video_frame.mapToGlobal(position))
+
+    def _on_splitter_moved(self, _pos: int, _index: int):
+        self.update_subtitle_window_geometry()
+
+    def _current_time_seconds(self) -> float:
+        return self.media_player.get_time() / 1000.0
+
+    def _vol_up(self):
+        self.adjust_volume(10)
+
+    def _vol_down(self):
+        self.adjust_volume(-10)
+
+    def _speed_up(self):
+        self.adjust_playback_speed(0.25)
+
+    def _speed_down(self):
+        self.adjust_playback_speed(-0.25)
 
     def ensure_sidebar_visible(self):
         """Ensure the sidebar is visible without toggling off inadvertently"""
@@ -2130,11 +2344,17 @@ class VideoPlayer(QMainWindow):
 
     def adjust_volume(self, delta):
         """Adjust master volume by delta percent"""
-        current_volume = self.media_player.audio_get_volume()
+        # Use the last volume we applied instead of querying VLC on every keystroke
+        current_volume = self._last_volume
+        if current_volume is None:
+            current_volume = self.media_player.audio_get_volume()
         if current_volume == -1:
             current_volume = self.volume_slider.value()
         new_volume = max(0, min(100, current_volume + delta))
+        # Block valueChanged so set_volume runs once instead of twice
+        self.volume_slider.blockSignals(True)
         self.volume_slider.setValue(new_volume)
+        self.volume_slider.blockSignals(False)
         self.set_volume(new_volume)
         self.show_status_message(f"Volume set to {new_volume}%", 2000)
 
@@ -2157,6 +2377,8 @@ class VideoPlayer(QMainWindow):
 
     def reset_playback_speed(self):
         """Reset playback speed to normal"""
+        if abs(self.playback_rate - 1.0) < 1e-3:
+            return
         if self.media_player.set_rate(1.0) == 0:
             self.playback_rate = 1.0
             self.show_status_message("Playback speed reset to 1.00x", 2000)
@@ -2185,7 +2407,7 @@ class VideoPlayer(QMainWindow):
             )
             self.casting_manager.stop()
             if self.status_footer:
-                self.status_footer.clear_status("casting")
+                self._queue_clear_status("casting")
             self.show_status_message("Restarting cast for current video", 3000)
         self._update_cast_menu_actions()
 
@@ -2205,13 +2427,17 @@ class VideoPlayer(QMainWindow):
 
         subtitle_path = None
         if self.current_video:
-            subtitle_path = self.config_manager.get_subtitle_file_for_video(self.current_video)
+            subtitle_path = self._get_subtitle_file()
             if subtitle_path and not os.path.exists(subtitle_path):
                 print(f"[Casting] Subtitle file missing for cast: {subtitle_path}")
                 subtitle_path = None
 
         try:
-            config = FFmpegCastingConfig(host="0.0.0.0", port=8080)
+            config = FFmpegCastingConfig.low_latency(host="0.0.0.0", port=8080)
+            # H.264/AAC sources can be remuxed without re-encoding (no burn-in needed)
+            config.copy_mode = not subtitle_path and self.casting_manager.can_stream_copy(
+                self.current_video, config
+            )
             url = self.casting_manager.start_hls_stream(
                 self.current_video,
                 config,
@@ -2232,7 +2458,7 @@ class VideoPlayer(QMainWindow):
             return
 
         if self.status_footer:
-            self.status_footer.set_status("casting", f"📡 Casting ativo: {url}")
+            self._queue_status("casting", f"📡 Casting ativo: {url}")
         self.show_status_message(f"Casting started: {url}", 5000)
         debug_logger.log_cast_started(
             self.current_video,
@@ -2268,7 +2494,7 @@ class VideoPlayer(QMainWindow):
             reason="user_requested",
         )
         if self.status_footer:
-            self.status_footer.clear_status("casting")
+            self._queue_clear_status("casting")
         self.show_status_message("Casting stopped", 3000)
         QMessageBox.information(
             self,
@@ -2279,8 +2505,8 @@ class VideoPlayer(QMainWindow):
     
     def show_subtitle_search(self):
         """Show subtitle search dialog"""
-        # Import here to avoid circular dependency
-        from .subtitle_search_dialog import SubtitleSearchDialog
+        # Resolved lazily (and once) to avoid a circular dependency
+        SubtitleSearchDialog = self._lazy_class("subtitle_search_dialog", "SubtitleSearchDialog")
         
         if not self.current_video:
             QMessageBox.information(self, "No Video", "Please load a video first")
@@ -2295,17 +2521,25 @@ class VideoPlayer(QMainWindow):
     def toggle_subtitle_sidebar(self):
         """Toggle the visibility of the subtitle settings sidebar"""
         self.sidebar_visible = not self.sidebar_visible
-        if self.sidebar_visible:
-            self.sidebar_container.show()
-            self.subtitle_sidebar.show()
-            sidebar_width = max(320, int(self.width() * 0.28))
-            self.splitter.setSizes([max(1, self.width() - sidebar_width), sidebar_width])
-            if self.subtitle_settings_dialog and self.subtitle_settings_dialog.isVisible():
-                self.subtitle_settings_dialog.reject()
-        else:
-            self.sidebar_container.hide()
-            self.subtitle_sidebar.hide()
-            self.splitter.setSizes([self.width(), 0])
+        # Batch the show/hide and resize into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            if self.sidebar_visible:
+                self.sidebar_container.show()
+                self.subtitle_sidebar.show()
+                width = self.width()
+                sidebar_width = max(320, int(width * 0.28))
+                target_sizes = [max(1, width - sidebar_width), sidebar_width]
+                if self.subtitle_settings_dialog and self.subtitle_settings_dialog.isVisible():
+                    self.subtitle_settings_dialog.reject()
+            else:
+                self.sidebar_container.hide()
+                self.subtitle_sidebar.hide()
+                target_sizes = [self.width(), 0]
+            if self.splitter.sizes() != target_sizes:
+                self.splitter.setSizes(target_sizes)
+        finally:
+            self.setUpdatesEnabled(True)
         self.update_subtitle_window_geometry()
     
     def on_sidebar_settings_changed(self, style):
@@ -2313,8 +2547,22 @@ class VideoPlayer(QMainWindow):
         self.subtitle_style = style
         self.subtitle_overlay.set_style(self.subtitle_style)
     
+    def on_sidebar_setting_field_changed(self, name, value):
+        """Handle sidebar fields that need more than an overlay repaint"""
+        if name == "timing_offset" and self.current_subtitles:
+            base_path = self._get_subtitle_file()
+            if base_path and os.path.exists(base_path):
+                self.current_subtitles = self.subtitle_parser.adjust_timing(
+                    self._get_parsed_subtitles(base_path),
+                    value
+                )
+    
     def update_resource_monitor(self):
         """Update resource usage display in status bar"""
+        # Nothing to show it on - skip the psutil/GPU probes entirely
+        if self.isMinimized() or not self.isVisible() or not self.resource_monitor_label.isVisible():
+            return
+
         try:
             usage_str = self.resource_manager.get_resource_usage_string()
             
@@ -2336,16 +2584,13 @@ class VideoPlayer(QMainWindow):
         if not task_info:
             return
         
-        from .background_task_manager import TaskType
-        
         # Try to restore the associated dialog
-        if task_info.task_type == TaskType.AI_GENERATION:
-            # Check if AI dialog exists and restore it
-            for widget in QApplication.topLevelWidgets():
-                if isinstance(widget, QDialog) and widget.windowTitle().startswith("AI Subtitle Generator"):
-                    if hasattr(widget, 'restore_from_background'):
-                        widget.restore_from_background()
-                        return
+        dialog = None
+        if task_info.task_type is TaskType.AI_GENERATION:
+            dialog = self.minimized_ai_dialog or self.current_ai_dialog
+        if dialog is not None and hasattr(dialog, 'restore_from_background'):
+            dialog.restore_from_background()
+            return
         
         # If dialog not found, show info
         QMessageBox.information(
@@ -2369,8 +2614,8 @@ class VideoPlayer(QMainWindow):
     
     def show_subtitle_settings(self):
         """Show subtitle settings dialog"""
-        # Import here to avoid circular dependency
-        from .subtitle_settings_dialog import SubtitleSettingsDialog
+        # Resolved lazily (and once) to avoid a circular dependency
+        SubtitleSettingsDialog = self._lazy_class("subtitle_settings_dialog", "SubtitleSettingsDialog")
 
         if self.subtitle_settings_dialog and self.subtitle_settings_dialog.isVisible():
             self.subtitle_settings_dialog.raise_()
@@ -2386,13 +2631,13 @@ class VideoPlayer(QMainWindow):
         # Get current subtitle file path
         subtitle_path = None
         if self.current_video:
-            subtitle_path = self.config_manager.get_subtitle_file_for_video(self.current_video)
+            subtitle_path = self._get_subtitle_file()
         
         dialog = SubtitleSettingsDialog(
             self.subtitle_style,
             self,
             subtitles=self.current_subtitles,
-            current_time_func=lambda: self.media_player.get_time() / 1000.0,
+            current_time_func=self._current_time_seconds,
             video_path=self.current_video,
             subtitle_path=subtitle_path
         )
@@ -2401,7 +2646,7 @@ class VideoPlayer(QMainWindow):
         dialog.translation_started.connect(self.on_translation_started)
         dialog.translation_progress.connect(self.on_translation_progress)
         dialog.translation_finished.connect(self.on_translation_finished)
-        dialog.finished.connect(lambda result, dlg=dialog: self._on_subtitle_dialog_finished(dlg, result))
+        dialog.finished.connect(partial(self._on_subtitle_dialog_finished, dialog))
         self.subtitle_settings_dialog = dialog
         self._active_translation_dialog = dialog
 
@@ -2426,8 +2671,7 @@ class VideoPlayer(QMainWindow):
             return
         
         try:
-            from .ai_subtitle_dialog import AISubtitleDialog
-            from .ai_subtitle_generator import AISubtitleGenerator
+            AISubtitleDialog = self._lazy_class("ai_subtitle_dialog", "AISubtitleDialog")
             
             # Pass task_manager and resource_manager for background mode and optimization
             dialog = AISubtitleDialog(self.current_video, self, self.task_manager)
@@ -2436,8 +2680,8 @@ class VideoPlayer(QMainWindow):
             self.current_ai_dialog = dialog
             
             # Connect to dialog events
-            dialog.finished.connect(lambda result: self.on_ai_dialog_finished(dialog, result))
-            dialog.minimized_to_background.connect(lambda: self.on_ai_dialog_minimized(dialog))
+            dialog.finished.connect(partial(self.on_ai_dialog_finished, dialog))
+            dialog.minimized_to_background.connect(partial(self.on_ai_dialog_minimized, dialog))
             
             # Show dialog
             dialog.show()
@@ -2456,38 +2700,47 @@ class VideoPlayer(QMainWindow):
     def on_ai_dialog_finished(self, dialog, result):
         """Handle AI dialog finished (accepted or rejected)"""
         if result and dialog.generated_segments:
-            from .ai_subtitle_generator import AISubtitleGenerator
             segments = dialog.get_generated_segments()
             subtitle_path = dialog.get_subtitle_path()
-            generator = AISubtitleGenerator(resource_manager=self.resource_manager)
-            if generator.save_to_srt(segments, subtitle_path):
-                # Load the generated subtitle
-                self.load_subtitle(subtitle_path)
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"AI-generated subtitles saved and loaded!\n{subtitle_path}"
+            # Writing thousands of segments would stall the event loop; save on a pool thread
+            signals = _SrtSaveSignals(self)
+            signals.done.connect(self._on_ai_subtitles_saved)
+            QThreadPool.globalInstance().start(
+                _SrtSaveTask(
+                    self._lazy_class("ai_subtitle_generator", "AISubtitleGenerator"),
+                    segments,
+                    subtitle_path,
+                    self.resource_manager,
+                    signals,
                 )
+            )
         
         # Clean up all references
         self.current_ai_dialog = None
         self.minimized_ai_dialog = None
 
         # Disconnect any remaining progress handlers
-        if hasattr(dialog, 'gen_thread') and dialog.gen_thread:
-            if self._ai_progress_slot:
-                try:
-                    dialog.gen_thread.progress_update.disconnect(self._ai_progress_slot)
-                except TypeError:
-                    pass
-            try:
-                dialog.gen_thread.finished.disconnect(self.on_ai_generation_finished)
-            except TypeError:
-                pass
-        self._ai_progress_slot = None
+        self._disconnect_ai_signals(getattr(dialog, 'gen_thread', None))
 
         if self.status_footer:
-            self.status_footer.clear_status("ai")
+            self._queue_clear_status("ai")
+    
+    def _on_ai_subtitles_saved(self, subtitle_path: str, success: bool) -> None:
+        """Load AI subtitles once the background save completes"""
+        signals = self.sender()
+        if signals is not None:
+            signals.deleteLater()
+
+        if not success:
+            return
+
+        # Load the generated subtitle
+        self.load_subtitle(subtitle_path)
+        QMessageBox.information(
+            self,
+            "Success",
+            f"AI-generated subtitles saved and loaded!\n{subtitle_path}"
+        )
     
     def on_ai_dialog_minimized(self, dialog):
         """Handle AI dialog minimized to background"""
@@ -2507,7 +2760,7 @@ class VideoPlayer(QMainWindow):
                 status_text = "🤖 100% - Complete! Clique para abrir"
             else:
                 status_text = f"🤖 {current_progress}% - {current_message}"
-            self.status_footer.set_status(
+            self._queue_status(
                 "ai",
                 status_text,
                 button_text="Abrir",
@@ -2519,41 +2772,85 @@ class VideoPlayer(QMainWindow):
 
         # Connect progress updates from thread directly to footer (only if running)
         if hasattr(dialog, 'gen_thread') and dialog.gen_thread and dialog.gen_thread.isRunning():
-            if self._ai_progress_slot is None:
-                def _ai_progress_slot(message, percent):
-                    if self.status_footer:
-                        self.status_footer.set_status(
-                            "ai",
-                            f"🤖 {percent}% - {message}",
-                            button_text="Abrir",
-                        )
+            self._ensure_ai_signals(dialog.gen_thread)
+
+    def _ensure_ai_signals(self, thread) -> None:
+        """Connect generation thread signals to the footer exactly once"""
+        if thread is None:
+            return
+        try:
+            thread.progress_update.connect(
+                self._on_ai_progress_update,
+                Qt.ConnectionType.UniqueConnection,
+            )
+        except TypeError:
+            pass  # Already connected
+        try:
+            thread.finished.connect(
+                self.on_ai_generation_finished,
+                Qt.ConnectionType.UniqueConnection,
+            )
+        except TypeError:
+            pass  # Already connected
+
+    def _disconnect_ai_signals(self, thread) -> None:
+        """Detach footer handlers from a generation thread"""
+        self._pending_ai_progress = None
+        self._ai_footer_flush_timer.stop()
+        if thread is None:
+            return
+        try:
+            thread.progress_update.disconnect(self._on_ai_progress_update)
+        except TypeError:
+            pass  # Not connected
+        try:
+            thread.finished.disconnect(self.on_ai_generation_finished)
+        except TypeError:
+            pass  # Not connected
+
+    def _on_ai_progress_update(self, message: str, percent: int) -> None:
+        """Mirror background AI progress in the footer (throttled)"""
+        now = time.monotonic()
+        if percent < 100 and now - self._last_ai_footer_ts < 0.1:
+            # Keep only the latest value; a trailing flush writes it out
+            self._pending_ai_progress = (message, percent)
+            if not self._ai_footer_flush_timer.isActive():
+                self._ai_footer_flush_timer.start()
+            return
 
-                self._ai_progress_slot = _ai_progress_slot
+        self._last_ai_footer_ts = now
+        self._pending_ai_progress = None
+        self._ai_footer_flush_timer.stop()
+        self._set_ai_footer_progress(message, percent)
 
-            try:
-                dialog.gen_thread.progress_update.connect(
-                    self._ai_progress_slot,
-                    Qt.ConnectionType.UniqueConnection,
-                )
-            except TypeError:
-                pass  # Already connected
+    def _flush_ai_progress(self) -> None:
+        """Write the most recent deferred AI progress update"""
+        pending = self._pending_ai_progress
+        self._pending_ai_progress = None
+        if pending is None:
+            return
+        self._last_ai_footer_ts = time.monotonic()
+        self._set_ai_footer_progress(*pending)
 
-            try:
-                dialog.gen_thread.finished.connect(
-                    self.on_ai_generation_finished,
-                    Qt.ConnectionType.UniqueConnection,
-                )
-            except TypeError:
-                pass
+    def _set_ai_footer_progress(self, message: str, percent: int) -> None:
+        if self.status_footer:
+            self._queue_status(
+                "ai",
+                f"🤖 {percent}% - {message}",
+                button_text="Abrir",
+            )
     
     def restore_ai_dialog(self):
         """Restore minimized AI dialog"""
         if self.minimized_ai_dialog:
+            # The dialog shows its own progress again, so stop mirroring it
+            self._disconnect_ai_signals(getattr(self.minimized_ai_dialog, 'gen_thread', None))
+
             # Use the dialog's restore method to ensure proper rendering
             self.minimized_ai_dialog.restore_from_background()
 
             if self.status_footer:
-                self.status_footer.clear_status("ai")
+                self._queue_clear_status("ai")
             
             # DON'T clear minimized_ai_dialog here - keep it so we can minimize again!
             # It will be cleared when generation finishes or dialog is closed
@@ -2561,7 +2858,7 @@ class VideoPlayer(QMainWindow):
     def on_ai_generation_finished(self):
         """Handle AI generation completion"""
         if self.minimized_ai_dialog and self.status_footer:
-            self.status_footer.set_status(
+            self._queue_status(
                 "ai",
                 "🤖 100% - Complete! Clique para abrir",
                 button_text="Abrir",
@@ -2569,18 +2866,8 @@ class VideoPlayer(QMainWindow):
 
         # Disconnect progress slot once generation completes
         dialog = self.current_ai_dialog or self.minimized_ai_dialog
-        if dialog and hasattr(dialog, 'gen_thread') and dialog.gen_thread:
-            if self._ai_progress_slot:
-                try:
-                    dialog.gen_thread.progress_update.disconnect(self._ai_progress_slot)
-                except TypeError:
-                    pass
-            try:
-                dialog.gen_thread.finished.disconnect(self.on_ai_generation_finished)
-            except TypeError:
-                pass
-
-        self._ai_progress_slot = None
+        if dialog:
+            self._disconnect_ai_signals(getattr(dialog, 'gen_thread', None))
         
         # Keep references so user can still open the completed dialog
         # They will be cleared when dialog is actually closed
@@ -2596,9 +2883,9 @@ class VideoPlayer(QMainWindow):
                 self.subtitle_overlay.set_style(self.subtitle_style)
 
                 if self.current_subtitles:
-                    base_path = self.config_manager.get_subtitle_file_for_video(self.current_video)
+                    base_path = self._get_subtitle_file()
                     if base_path and os.path.exists(base_path):
-                        base_subtitles = self.subtitle_parser.parse_file(base_path)
+                        base_subtitles = self._get_parsed_subtitles(base_path)
                         self.current_subtitles = self.subtitle_parser.adjust_timing(
                             base_subtitles,
                             self.subtitle_style.timing_offset
@@ -2610,6 +2897,24 @@ class VideoPlayer(QMainWindow):
             self._clear_subtitle_dialog_reference()
             dialog.deleteLater()
 
+    def _get_subtitle_file(self) -> Optional[str]:
+        """Associated subtitle path for the current video, cached until it changes"""
+        video = self.current_video
+        if self._subfile_cache is not None and self._subfile_cache[0] == video:
+            return self._subfile_cache[1]
+        path = self.config_manager.get_subtitle_file_for_video(video) if video else None
+        self._subfile_cache = (video, path)
+        return path
+
+    def _get_parsed_subtitles(self, path: str):
+        """Return the un-shifted entries for *path*, re-parsing only if the file changed"""
+        mtime = os.stat(path).st_mtime
+        entry = self._parsed_sub_cache.get(path)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, self.subtitle_parser.parse_file(path))
+            self._parsed_sub_cache[path] = entry
+        return entry[1]
+
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
@@ -2633,30 +2938,60 @@ class VideoPlayer(QMainWindow):
         self._active_translation_dialog = None
 
     def update_subtitle_window_geometry(self):
+        """Schedule a subtitle overlay sync; bursts collapse into a single update"""
+        self._geom_update_timer.start()
+
+    def _do_update_subtitle_window_geometry(self):
         """Synchronize subtitle overlay window with the video frame"""
-        if not hasattr(self, 'subtitle_window') or not hasattr(self, 'video_frame'):
+        if getattr(self, 'subtitle_window', None) is None or not hasattr(self, 'video_frame'):
             return
 
         video_rect = self.video_frame.rect()
         global_pos = self.video_frame.mapToGlobal(QPoint(0, 0))
+        geom = (global_pos.x(), global_pos.y(), video_rect.width(), video_rect.height())
 
-        self.subtitle_window.setGeometry(
-            global_pos.x(),
-            global_pos.y(),
-            video_rect.width(),
-            video_rect.height()
-        )
-        self.subtitle_window.raise_()
+        window_visible = self.subtitle_window.isVisible()
+        if geom == self._last_subtitle_geom and self._subtitle_raised and window_visible:
+            return
+
+        self.subtitle_window.setGeometry(*geom)
+        self._last_subtitle_geom = geom
+
+        # Re-stacking is only needed the first time or after the overlay was hidden
+        if not self._subtitle_raised or not window_visible:
+            self.subtitle_window.raise_()
+            self._subtitle_raised = window_visible
 
         if hasattr(self, 'subtitle_overlay'):
             self.subtitle_overlay.updateGeometry()
-            self.subtitle_overlay.update()
+            # Let the repaint coalesce with pending paint events
+            QTimer.singleShot(0, self.subtitle_overlay.update)
     
     def resizeEvent(self, event):
         """Handle window resize"""
         super().resizeEvent(event)
         self.update_subtitle_window_geometry()
     
+    def changeEvent(self, event):
+        """Restack the subtitle overlay and pause resource polling while minimized"""
+        super().changeEvent(event)
+        event_type = event.type()
+        if event_type in (QEvent.Type.ActivationChange, QEvent.Type.WindowStateChange):
+            # Another window may have been stacked over the overlay meanwhile
+            self._subtitle_raised = False
+            if event_type == QEvent.Type.ActivationChange and self.isActiveWindow():
+                self.update_subtitle_window_geometry()
+        if event_type != QEvent.Type.WindowStateChange:
+            return
+        timer = getattr(self, 'resource_monitor_timer', None)
+        if timer is None:
+            return
+        if self.isMinimized():
+            timer.stop()
+        elif not timer.isActive():
+            timer.start()
+            self.update_resource_monitor()
+    
     def moveEvent(self, event):
         """Handle window move - keep subtitle window synchronized"""
         super().moveEvent(event)
@@ -2685,15 +3020,21 @@ class VideoPlayer(QMainWindow):
                         event.ignore()
                         return
                     
-                    # Cancel all tasks
-                    for task_id in active_tasks:
-                        self.task_manager.cancel_task(task_id)
+                    # Flag every task without blocking the GUI thread; running
+                    # tasks wind down on their own and queued ones never start
+                    self.task_manager.cancel_all(timeout=0)
             
             # Stop all timers
             if hasattr(self, 'timer') and self.timer.isActive():
                 self.timer.stop()
             if hasattr(self, 'mouse_move_timer') and self.mouse_move_timer.isActive():
                 self.mouse_move_timer.stop()
+            # Pending coalesced updates would otherwise fire against the
+            # references dropped below
+            for name in ('_geom_update_timer', '_status_flush_timer', '_ai_footer_flush_timer'):
+                pending_timer = getattr(self, name, None)
+                if pending_timer is not None:
+                    pending_timer.stop()
             
             # Stop and release media player
             if hasattr(self, 'media_player') and self.media_player:
@@ -2725,7 +3066,7 @@ class VideoPlayer(QMainWindow):
                 self.streaming_stats_dialog.deleteLater()
             
             # Clear subtitle cache
-            if hasattr(self, 'current_subtitles'):
+            if hasattr(self, 'current_subtitles') and self.current_subtitles:
                 self.current_subtitles.clear()
             
             # Remove event filter
@@ -2734,9 +3075,15 @@ class VideoPlayer(QMainWindow):
             except:
                 pass
             
-            # Force garbage collection
-            import gc
-            gc.collect()
+            # Drop large references explicitly; the process is about to exit,
+            # so a full-heap gc.collect() would only delay shutdown
+            self.current_subtitles = None
+            self.subtitle_window = None
+            self.subtitle_settings_dialog = None
+            self.streaming_stats_dialog = None
+            self.minimized_ai_dialog = None
+            self.current_ai_dialog = None
+            self._active_translation_dialog = None
             
         except Exception as e:
             print(f"Warning: Error during cleanup: {e}")
@@ -6,123 +6,174 @@ Run this to check if all dependencies are properly installed
 
 import sys
 import os
+import shutil
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
-def check_python_version():
+# (display name, import name) for each required Python package
+_PY_MODULES = (
+    ("PyQt6", "PyQt6"),
+    ("requests", "requests"),
+    ("chardet", "chardet"),
+    ("pysrt", "pysrt"),
+)
+
+# Expected project files, grouped by directory ("" is the project root) in report order
+_PROJECT_FILES_BY_DIR = {
+    "": (
+        "main.py",
+        "requirements.txt",
+        "run.sh",
+        "install.sh",
+        "README.md",
+    ),
+    "subtitleplayer": (
+        "video_player.py",
+        "opensubtitles_api.py",
+        "subtitle_parser.py",
+        "subtitle_search_dialog.py",
+        "subtitle_settings_dialog.py",
+        "config_manager.py",
+    ),
+}
+
+_BAR = "=" * 60
+_HEADER = f"{_BAR}\n  SubtitlePlayer Installation Verification\n{_BAR}\n\n"
+_SUCCESS_FOOTER = (
+    f"\n{_BAR}\n"
+    "  ✓✓✓ All checks passed! SubtitlePlayer is ready to run.\n"
+    f"{_BAR}\n"
+    "\nTo run the application:\n"
+    "  ./run.sh\n"
+    "\nOr manually:\n"
+    "  source venv/bin/activate\n"
+    "  python3 main.py\n"
+)
+_FAILURE_FOOTER = (
+    f"\n{_BAR}\n"
+    "  ✗✗✗ Some checks failed. Please fix the issues above.\n"
+    f"{_BAR}\n"
+    "\nTo install missing dependencies:\n"
+    "  ./install.sh\n"
+    "\nOr manually:\n"
+    "  pip install -r requirements.txt\n"
+)
+
+def check_python_version(out=print):
     """Check Python version"""
-    print("Checking Python version...")
+    out("Checking Python version...")
     version = sys.version_info
     if version.major >= 3 and version.minor >= 8:
-        print(f"  ✓ Python {version.major}.{version.minor}.{version.micro}")
+        out(f"  ✓ Python {version.major}.{version.minor}.{version.micro}")
         return True
     else:
-        print(f"  ✗ Python {version.major}.{version.minor}.{version.micro} (Need 3.8+)")
+        out(f"  ✗ Python {version.major}.{version.minor}.{version.micro} (Need 3.8+)")
+        return False
+
+def _module_available(import_name):
+    """Locate a module without executing it"""
+    try:
+        return importlib.util.find_spec(import_name) is not None
+    except (ImportError, ValueError):
         return False
 
-def check_module(module_name, import_name=None):
+def check_module(module_name, import_name=None, out=print):
     """Check if a Python module is installed"""
     if import_name is None:
         import_name = module_name
     
-    try:
-        __import__(import_name)
-        print(f"  ✓ {module_name}")
+    if _module_available(import_name):
+        out(f"  ✓ {module_name}")
         return True
-    except ImportError:
-        print(f"  ✗ {module_name} (Not installed)")
+    else:
+        out(f"  ✗ {module_name} (Not installed)")
         return False
 
-def check_vlc():
+def check_vlc(out=print):
     """Check VLC installation"""
-    print("\nChecking VLC...")
+    out("\nChecking VLC...")
     
     # Check if VLC command exists
-    vlc_installed = os.system("which vlc > /dev/null 2>&1") == 0
+    vlc_installed = shutil.which("vlc") is not None
     if vlc_installed:
-        print("  ✓ VLC installed")
+        out("  ✓ VLC installed")
     else:
-        print("  ✗ VLC not installed")
+        # The binding is useless without libvlc, so don't go looking for it
+        out("  ✗ VLC not installed")
+        out("  ✗ python-vlc binding (skipped)")
         return False
     
     # Check python-vlc binding
-    try:
-        import vlc
-        print("  ✓ python-vlc binding")
+    if _module_available("vlc"):
+        out("  ✓ python-vlc binding")
         return True
-    except ImportError:
-        print("  ✗ python-vlc binding (Not installed)")
+    else:
+        out("  ✗ python-vlc binding (Not installed)")
         return False
 
-def check_project_structure():
+@lru_cache(maxsize=None)
+def _listdir_cached(directory):
+    """Names in a directory, listed once per run"""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+def check_project_structure(out=print):
     """Check if project files exist"""
-    print("\nChecking project structure...")
-    
-    files_to_check = [
-        "main.py",
-        "requirements.txt",
-        "run.sh",
-        "install.sh",
-        "README.md",
-        "subtitleplayer/video_player.py",
-        "subtitleplayer/opensubtitles_api.py",
-        "subtitleplayer/subtitle_parser.py",
-        "subtitleplayer/subtitle_search_dialog.py",
-        "subtitleplayer/subtitle_settings_dialog.py",
-        "subtitleplayer/config_manager.py"
-    ]
+    out("\nChecking project structure...")
     
+    # One directory listing per parent instead of a stat per file
     all_exist = True
-    for file_path in files_to_check:
-        if os.path.exists(file_path):
-            print(f"  ✓ {file_path}")
-        else:
-            print(f"  ✗ {file_path} (Missing)")
-            all_exist = False
+    for directory, names in _PROJECT_FILES_BY_DIR.items():
+        present = _listdir_cached(directory or ".")
+        for name in names:
+            file_path = os.path.join(directory, name)
+            if name in present:
+                out(f"  ✓ {file_path}")
+            else:
+                out(f"  ✗ {file_path} (Missing)")
+                all_exist = False
     
     return all_exist
 
 def main():
     """Main verification function"""
-    print("=" * 60)
-    print("  SubtitlePlayer Installation Verification")
-    print("=" * 60)
-    print()
-    
-    results = []
-    
-    # Check Python version
-    results.append(check_python_version())
+    sys.stdout.write(_HEADER)
     
-    # Check Python modules
-    print("\nChecking Python dependencies...")
-    results.append(check_module("PyQt6"))
-    results.append(check_module("requests"))
-    results.append(check_module("chardet"))
-    results.append(check_module("pysrt"))
+    # (heading, check) pairs; headings are printed before the check's output
+    checks = [(None, check_python_version)]
+    heading = "\nChecking Python dependencies..."
+    for module_name, import_name in _PY_MODULES:
+        checks.append((heading, partial(check_module, module_name, import_name)))
+        heading = None
+    checks.append((None, check_vlc))
+    checks.append((None, check_project_structure))
     
-    # Check VLC
-    results.append(check_vlc())
+    # The checks are independent, so run them concurrently and buffer each
+    # one's output to report in the order above
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        pending = []
+        for heading, check in checks:
+            lines = []
+            pending.append((heading, lines, executor.submit(check, out=lines.append)))
     
-    # Check project structure
-    results.append(check_project_structure())
+    all_ok = True
+    report = []
+    for heading, lines, future in pending:
+        all_ok &= future.result()
+        if heading:
+            report.append(heading)
+        report.extend(lines)
+    sys.stdout.write("\n".join(report) + "\n")
     
     # Summary
-    print("\n" + "=" * 60)
-    if all(results):
-        print("  ✓✓✓ All checks passed! SubtitlePlayer is ready to run.")
-        print("=" * 60)
-        print("\nTo run the application:")
-        print("  ./run.sh")
-        print("\nOr manually:")
-        print("  source venv/bin/activate")
-        print("  python3 main.py")
+    if all_ok:
+        sys.stdout.write(_SUCCESS_FOOTER)
         return 0
     else:
-        print("  ✗✗✗ Some checks failed. Please fix the issues above.")
-        print("=" * 60)
-        print("\nTo install missing dependencies:")
-        print("  ./install.sh")
-        print("\nOr manually:")
-        print("  pip install -r requirements.txt")
+        sys.stdout.write(_FAILURE_FOOTER)
         return 1
 
 if __name__ == "__main__":